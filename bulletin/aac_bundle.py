@@ -0,0 +1,208 @@
+"""
+AAC upload bundles for Hidden Springs.
+
+A Hidden Springs run prints the AAC files its bulletin needs
+(``BulletinBuilder.get_aac_manifest()``), and someone then digs each
+one out of the library by hand and uploads it to Squarespace. Most
+weeks reuse last week's hymns, so most of those files are already up.
+
+``build_aac_bundle()`` turns the manifests of one or more runs into a
+zip of just the files that aren't up yet:
+
+  - each manifest filename is resolved in the AAC library — the
+    ``sorted_hidden_springs_aac_files/`` folder that
+    ``scripts/build_hs_catalog.py`` scans, so catalog filenames are
+    paths relative to it
+  - each file is identified by the SHA-256 of its bytes, so a renamed
+    or re-sorted file is still recognised and a re-exported one isn't
+  - files whose hash is in the upload ledger (``output/.aac_uploads.json``)
+    are left out; the rest are copied into the zip in chunks (audio
+    is already compressed, so stored, not deflated) and then added to
+    the ledger
+
+The ledger also remembers each file's (size, mtime, hash), so a weekly
+bundle only reads files that are new or changed in the library. Delete
+a file's entry (or the whole ledger) to bundle it again.
+
+A bundle never replaces an earlier one: re-running a date writes
+"… (2).zip" beside the first, since the first one's files are already
+in the ledger and won't be bundled again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from bulletin.report import RunReport
+
+_REPO_DIR = Path(__file__).resolve().parent.parent
+AAC_LIBRARY = _REPO_DIR / "hidden_springs_music" / "sorted_hidden_springs_aac_files"
+
+LEDGER_FILE_NAME = ".aac_uploads.json"
+NO_FILE = "[NO AAC FILE FOUND]"     # builder's placeholder manifest entry
+
+# Bump when the ledger layout changes; an old ledger is then ignored.
+_LEDGER_FORMAT = 1
+_CHUNK = 1 << 20
+
+
+@dataclass
+class AacBundle:
+    """What ``build_aac_bundle()`` did."""
+    path: Optional[Path]            # None when there was nothing new
+    added: list[str] = field(default_factory=list)       # library paths
+    uploaded: list[str] = field(default_factory=list)    # already up
+    missing: list[str] = field(default_factory=list)     # not in library
+
+
+# ---------------------------------------------------------------------------
+# Ledger
+# ---------------------------------------------------------------------------
+
+def ledger_path(output_dir: Path) -> Path:
+    return output_dir / LEDGER_FILE_NAME
+
+
+def _read_ledger(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            ledger = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        ledger = None
+    if not isinstance(ledger, dict) or ledger.get("format") != _LEDGER_FORMAT:
+        ledger = {"format": _LEDGER_FORMAT}
+    ledger.setdefault("uploaded", {})
+    ledger.setdefault("hashes", {})
+    return ledger
+
+
+def _write_ledger(path: Path, ledger: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(ledger, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def _content_hash(path: Path, filename: str, hashes: dict) -> str:
+    """SHA-256 of *path*, reused from *hashes* while size and mtime match."""
+    st = path.stat()
+    known = hashes.get(filename)
+    if known and known[:2] == [st.st_size, st.st_mtime_ns]:
+        return known[2]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            h.update(chunk)
+    hashes[filename] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Bundles
+# ---------------------------------------------------------------------------
+
+def manifest_filenames(manifests: Iterable[list[tuple[str, str]]]) -> list[str]:
+    """Every filename in *manifests*, once each, in first-use order."""
+    seen: dict[str, None] = {}
+    for manifest in manifests:
+        for _slot, filename in manifest:
+            if filename and filename != NO_FILE:
+                seen.setdefault(filename, None)
+    return list(seen)
+
+
+def bundle_name(first: date, last: date) -> str:
+    """The zip's name: the service date, or the range for a batch."""
+    if first == last:
+        return f"{first.isoformat()} - Hidden Springs AAC.zip"
+    return f"{first.isoformat()} to {last.isoformat()} - Hidden Springs AAC.zip"
+
+
+def _unused_path(path: Path) -> Path:
+    """*path*, or "name (2).zip", "name (3).zip", … if it exists."""
+    candidate, n = path, 1
+    while candidate.exists():
+        n += 1
+        candidate = path.with_name(f"{path.stem} ({n}){path.suffix}")
+    return candidate
+
+
+def build_aac_bundle(
+    manifests: Sequence[list[tuple[str, str]]],
+    bundle_path: Path,
+    *,
+    library: Path = AAC_LIBRARY,
+    ledger: Optional[Path] = None,
+    reports: Optional[Sequence[RunReport]] = None,
+) -> AacBundle:
+    """Zip the files in *manifests* that haven't been uploaded yet.
+
+    *manifests* are ``GeneratedBulletin.aac_manifest`` lists — one for a
+    single date, one per date for a month. The ledger defaults to the
+    one next to *bundle_path*; an existing zip at *bundle_path* is kept
+    and the new one gets a numbered name. Files the library doesn't
+    have are listed in ``missing``, and warned about on the report in
+    *reports* (parallel to *manifests*) of each manifest naming them.
+    Nothing is written when there's nothing new.
+    """
+    ledger_file = ledger or ledger_path(bundle_path.parent)
+    state = _read_ledger(ledger_file)
+    uploaded, hashes = state["uploaded"], state["hashes"]
+
+    filenames = manifest_filenames(manifests)
+    reports = list(reports or [])
+    result = AacBundle(path=None)
+    if not library.is_dir():
+        result.missing = filenames
+        for manifest, report in zip(manifests, reports):
+            if manifest_filenames([manifest]):
+                report.warning(category="aac",
+                               message=f"AAC library not found: {library}",
+                               fix_hint="Sync hidden_springs_music/ first")
+        return result
+
+    new: list[tuple[str, Path, str]] = []
+    new_hashes: set[str] = set()
+    for filename in filenames:
+        source = library / filename
+        if not source.is_file():
+            result.missing.append(filename)
+            for manifest, report in zip(manifests, reports):
+                if filename in manifest_filenames([manifest]):
+                    report.warning(
+                        category="aac",
+                        message=f"AAC file not in the library: {filename}",
+                        fix_hint=f"Expected under {library}")
+            continue
+        sha = _content_hash(source, filename, hashes)
+        if sha in uploaded or sha in new_hashes:
+            result.uploaded.append(filename)
+            continue
+        new_hashes.add(sha)
+        new.append((filename, source, sha))
+
+    if new:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        bundle_path = _unused_path(bundle_path)
+        partial = bundle_path.with_name(bundle_path.name + ".part")
+        with zipfile.ZipFile(partial, "w", zipfile.ZIP_STORED) as zf:
+            for filename, source, _sha in new:
+                zf.write(source, arcname=filename)
+        os.replace(partial, bundle_path)
+
+        stamp = datetime.now().isoformat(timespec="seconds")
+        for filename, _source, sha in new:
+            uploaded[sha] = {"filename": filename, "bundle": bundle_path.name,
+                             "added": stamp}
+        result.path = bundle_path
+        result.added = [filename for filename, _source, _sha in new]
+
+    _write_ledger(ledger_file, state)
+    return result
+
@@ -88,7 +88,8 @@ def get_lectionary_year(calendar_year: int) -> str:
     """Return the lectionary year letter (A, B, or C) for a given calendar year.
 
     Note: Advent Sundays in late November/December actually begin the NEXT
-    year's lectionary cycle. That adjustment is handled in the calendar module,
-    not here. This function gives the base year letter.
+    year's lectionary cycle. That adjustment is handled by
+    ``bulletin.logic.church_calendar.lectionary_year``, not here. This
+    function gives the base year letter.
     """
     return LECTIONARY_YEAR_MAP[calendar_year % 3]
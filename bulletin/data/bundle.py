@@ -0,0 +1,139 @@
+"""
+Compiled bundle of every YAML file under ``bulletin/data/``.
+
+A full run parses a couple of dozen YAML files — the BCP texts, the
+psalter, songs.yaml, staff, the Holy Week propers — and pure-Python
+PyYAML spends a few seconds on them in every fresh process (the CLI,
+each web worker). ``compile_bundle()`` parses them all once and writes
+``compiled_data.pickle``:
+
+  - a manifest: for each file, its size, mtime, and SHA-256
+  - for each file, its parsed contents, pickled on their own
+
+``load_yaml()`` is what the loaders call instead of ``yaml.safe_load``.
+The bundle is read in one I/O on first use; a file whose size and mtime
+still match the manifest (or whose hash does, after a checkout touched
+it) is served from the bundle, and anything else — an edited file, a
+file added since the compile, a path outside ``bulletin/data/`` — is
+parsed from YAML with the libyaml C loader when PyYAML has it. A stale
+bundle is never wrong, only slower, so editing a YAML file (by hand or
+through the web UI) needs no extra step; re-run
+``python generate.py --compile-data`` to make it fast again.
+
+Each file's data is unpickled per call, so callers get their own
+objects just as they would from YAML.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+_DATA_DIR = Path(__file__).parent
+
+BUNDLE_PATH = _DATA_DIR / "compiled_data.pickle"
+
+# Bumped when the bundle layout changes; an old bundle is then ignored.
+_FORMAT = 1
+
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse(text: bytes | str) -> Any:
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Compile
+# ---------------------------------------------------------------------------
+
+def compile_bundle(path: Optional[Path] = None) -> int:
+    """Parse every ``bulletin/data/**/*.yaml`` into the bundle at *path*
+    (default ``BUNDLE_PATH``). Returns the number of files compiled."""
+    path = Path(path) if path is not None else BUNDLE_PATH
+    manifest: dict[str, dict] = {}
+    entries: dict[str, bytes] = {}
+    for yaml_path in sorted(_DATA_DIR.rglob("*.yaml")):
+        rel = yaml_path.relative_to(_DATA_DIR).as_posix()
+        raw = yaml_path.read_bytes()
+        st = yaml_path.stat()
+        manifest[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                         "sha256": _digest(raw)}
+        entries[rel] = pickle.dumps(_parse(raw),
+                                    protocol=pickle.HIGHEST_PROTOCOL)
+
+    bundle = {"format": _FORMAT, "manifest": manifest, "entries": entries}
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    clear_cache()
+    return len(entries)
+
+
+# ---------------------------------------------------------------------------
+# Load
+# ---------------------------------------------------------------------------
+
+_bundle: Optional[dict] = None
+_bundle_read = False
+
+
+def _get_bundle() -> Optional[dict]:
+    """The bundle on disk (read once per process), or None."""
+    global _bundle, _bundle_read
+    if not _bundle_read:
+        try:
+            with open(BUNDLE_PATH, "rb") as f:
+                bundle = pickle.load(f)
+            _bundle = bundle if bundle.get("format") == _FORMAT else None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ValueError):
+            _bundle = None
+        _bundle_read = True
+    return _bundle
+
+
+def _relative(path: Path) -> Optional[str]:
+    try:
+        return path.resolve().relative_to(_DATA_DIR.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def load_yaml(path: Path | str) -> Any:
+    """The parsed contents of the YAML file at *path*.
+
+    Served from the compiled bundle when it has a current copy of the
+    file; parsed from YAML otherwise.
+    """
+    path = Path(path)
+    rel = _relative(path)
+    bundle = _get_bundle() if rel is not None else None
+    if bundle is not None and rel in bundle["manifest"]:
+        entry = bundle["manifest"][rel]
+        st = path.stat()
+        if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+            return pickle.loads(bundle["entries"][rel])
+        raw = path.read_bytes()
+        if len(raw) == entry["size"] and _digest(raw) == entry["sha256"]:
+            return pickle.loads(bundle["entries"][rel])
+        return _parse(raw)
+    with open(path, "rb") as f:
+        return _parse(f.read())
+
+
+def clear_cache():
+    """Forget the bundle read from disk (re-read on next use)."""
+    global _bundle, _bundle_read
+    _bundle = None
+    _bundle_read = False
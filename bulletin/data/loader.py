@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 from functools import lru_cache
 
-import yaml
+from bulletin.data.bundle import clear_cache as clear_bundle_cache, load_yaml
 
 
 _DATA_DIR = Path(__file__).parent
@@ -16,9 +16,7 @@ _DATA_DIR = Path(__file__).parent
 @lru_cache(maxsize=None)
 def _load_yaml(relative_path: str) -> dict:
     """Load and cache a YAML file relative to the data directory."""
-    full_path = _DATA_DIR / relative_path
-    with open(full_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml(_DATA_DIR / relative_path)
 
 
 def clear_all_caches() -> None:
@@ -36,6 +34,7 @@ def clear_all_caches() -> None:
     truth for which caches to clear after which writes.
     """
     _load_yaml.cache_clear()
+    clear_bundle_cache()
 
 
 def load_common_prayers() -> dict:
@@ -96,12 +95,22 @@ def load_funeral_texts() -> dict:
     Returns a dict keyed by `rite_I` and `rite_II`, each containing the
     nine top-level sections (opening_anthems, collect_dialogue, collects,
     prayers_for_the_departed, postcommunion_prayer, commendation,
-    committal, blessing, dismissal). See
-    bulletin/data/funerals/funeral_texts.yaml for the structure.
+    committal, blessing, dismissal), plus the rite-independent
+    `burial_readings` menu. See bulletin/data/funerals/funeral_texts.yaml
+    for the structure.
     """
     return _load_yaml("funerals/funeral_texts.yaml")
 
 
+def load_burial_readings() -> dict:
+    """Load the BCP's suggested burial-office readings (pp. 494-495).
+
+    Returns a dict with `old_testament`, `psalms`, `new_testament`, and
+    `gospels` lists of reference strings.
+    """
+    return load_funeral_texts()["burial_readings"]
+
+
 def load_special_prayers() -> dict:
     """Load the optional add-on prayers library (e.g. Daughters of the
     King). Each entry is keyed by a short id; see
@@ -0,0 +1,258 @@
+"""
+Reverse dependency index: which generated bulletins consumed which data.
+
+The output fingerprint (``bulletin/fingerprint.py``) is deliberately
+coarse — any edit anywhere under ``bulletin/data/`` changes it — so it
+can't say which of the already-generated upcoming bulletins in
+``output/`` an edit to ``songs.yaml`` actually affects. This module
+records, per output file, the specific data each bulletin consumed and
+a digest of each piece's content at build time:
+
+  - ``song:<service>|<identifier>``   a resolved song entry
+  - ``pop_form:<key>``                an entry in pop_forms.yaml
+  - ``preface:<key>``                 an entry in proper_prefaces.yaml
+  - ``blessing:<key>``                a section of blessings.yaml
+  - ``psalm:<ref>``                   psalm text from psalms.yaml
+  - ``template:<filename>``           a cover/back .docx under templates/
+
+The dependencies go into each output's manifest, and
+``output/.manifests/index.json`` maps every key back to the outputs
+that used it. ``find_stale()`` re-resolves each recorded key against
+the current data and reports the outputs whose inputs have moved on.
+Pass ``changed`` to narrow the check to the keys a particular file can
+affect. ``generate.py --stale`` and the web UI's /stale page are thin
+wrappers over it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from bulletin.fingerprint import (
+    MANIFEST_DIR_NAME,
+    TEMPLATES_DIR,
+    digest,
+    file_digest,
+    read_manifest,
+)
+
+INDEX_FILE_NAME = "index.json"
+
+# Which dependency kinds an edit to a given data file can invalidate.
+_KINDS_BY_FILE = {
+    "songs.yaml": ("song",),
+    "hidden_springs_songs.yaml": ("song",),
+    "hymnal_1982_first_lines.yaml": ("song",),
+    "pop_forms.yaml": ("pop_form",),
+    "proper_prefaces.yaml": ("preface",),
+    "blessings.yaml": ("blessing",),
+    "psalms.yaml": ("psalm",),
+}
+
+# Hidden Springs planner columns that name a song.
+_HS_SONG_FIELDS = ("processional", "song_of_praise", "sequence", "recessional")
+
+
+# ---------------------------------------------------------------------------
+# Resolving a dependency key to its current content
+# ---------------------------------------------------------------------------
+
+def _psalm_ref(raw: str) -> str:
+    """The bare psalm reference from a sheet cell ("Psalm 16 responsively")."""
+    ref = re.split(r"[\n\r]+", raw or "")[0].strip()
+    return re.sub(r"\s+(responsively|unison|in unison|antiphonally).*$",
+                  "", ref, flags=re.IGNORECASE).strip()
+
+
+def _resolve(key: str):
+    """Current content for a dependency key (``None`` if it no longer exists)."""
+    kind, _, name = key.partition(":")
+    if kind == "song":
+        from bulletin.sources.songs import hs_lookup_song, lookup_song
+        service, _, identifier = name.partition("|")
+        if service == "hidden_springs":
+            return hs_lookup_song(identifier)
+        return lookup_song(identifier, service)
+    if kind == "pop_form":
+        from bulletin.data.loader import load_pop_forms
+        return load_pop_forms().get(name)
+    if kind == "preface":
+        from bulletin.data.loader import load_proper_prefaces
+        return load_proper_prefaces().get(name)
+    if kind == "blessing":
+        from bulletin.data.loader import load_blessings
+        return load_blessings().get(name)
+    if kind == "psalm":
+        from bulletin.sources.psalms import get_psalm
+        try:
+            return get_psalm(name).to_lines()
+        except Exception:
+            return None
+    if kind == "template":
+        path = TEMPLATES_DIR / name
+        return file_digest(path) if path.exists() else None
+    raise ValueError(f"Unknown dependency kind in {key!r}")
+
+
+def current_digest(key: str) -> str:
+    return digest(_resolve(key))
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def collect_dependencies(builder) -> dict[str, str]:
+    """Dependency key → content digest for a resolved ``BulletinBuilder``."""
+    keys: list[str] = []
+
+    if builder.is_hidden_springs:
+        hs_row = builder.hidden_springs_data[0]
+        for fld in _HS_SONG_FIELDS:
+            title = (getattr(hs_row, fld, "") or "").strip()
+            if title and title.lower() != "gloria":
+                keys.append(f"song:hidden_springs|{title}")
+        psalm_raw = hs_row.psalm
+    else:
+        if builder.service_time != "8 am":
+            for slot in builder.get_music_slots():
+                if slot.song_title:
+                    keys.append(f"song:{builder.service_time}|{slot.song_title}")
+        psalm_raw = builder.schedule.psalm
+
+    if builder.pop_form_key:
+        keys.append(f"pop_form:{builder.pop_form_key}")
+    if builder.rules.proper_preface_key:
+        keys.append(f"preface:{builder.rules.proper_preface_key}")
+    if builder.blessing_key:
+        keys.append(f"blessing:{builder.blessing_key}")
+    psalm = _psalm_ref(psalm_raw)
+    if psalm:
+        keys.append(f"psalm:{psalm}")
+    keys.extend(f"template:{name}" for name in builder.get_templates())
+
+    return {key: current_digest(key) for key in dict.fromkeys(keys)}
+
+
+def _index_path(output_dir: Path) -> Path:
+    return output_dir / MANIFEST_DIR_NAME / INDEX_FILE_NAME
+
+
+def _iter_manifests(output_dir: Path):
+    manifest_dir = output_dir / MANIFEST_DIR_NAME
+    if not manifest_dir.exists():
+        return
+    for path in sorted(manifest_dir.glob("*.docx.json")):
+        output_path = output_dir / path.name[:-len(".json")]
+        manifest = read_manifest(output_path)
+        if manifest is not None:
+            yield output_path, manifest
+
+
+def rebuild_index(output_dir: Path) -> dict[str, list[str]]:
+    """Regenerate ``index.json`` (dependency key → output filenames)."""
+    index: dict[str, list[str]] = {}
+    for output_path, manifest in _iter_manifests(output_dir):
+        if not output_path.exists():
+            continue
+        for key in manifest.get("dependencies", {}):
+            index.setdefault(key, []).append(output_path.name)
+    path = _index_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return index
+
+
+def load_index(output_dir: Path) -> dict[str, list[str]]:
+    path = _index_path(output_dir)
+    if not path.exists():
+        return rebuild_index(output_dir)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return rebuild_index(output_dir)
+
+
+# ---------------------------------------------------------------------------
+# Staleness
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StaleBulletin:
+    """A generated bulletin whose recorded inputs no longer match the data."""
+    output_path: Path
+    target_date: Optional[date]
+    service: str
+    changed_keys: list[str] = field(default_factory=list)
+
+
+def kinds_for_file(path: str | Path) -> tuple[str, ...]:
+    """Dependency kinds an edit to *path* can invalidate."""
+    p = Path(path)
+    if p.suffix == ".docx":
+        return ("template",)
+    return _KINDS_BY_FILE.get(p.name, ())
+
+
+def find_stale(output_dir: Path, changed: Optional[list[str]] = None,
+               *, since: Optional[date] = None) -> list[StaleBulletin]:
+    """List bulletins in *output_dir* whose consumed data has changed.
+
+    Args:
+        changed: Optional data/template file paths that were edited.
+            Only keys those files can affect are re-checked; an
+            unrecognized file means "check everything".
+        since: Skip bulletins for dates before this (e.g. today, to
+            list only upcoming services).
+    """
+    kinds: Optional[set[str]] = None
+    if changed:
+        kinds = set()
+        for path in changed:
+            file_kinds = kinds_for_file(path)
+            if not file_kinds:
+                kinds = None
+                break
+            kinds.update(file_kinds)
+
+    candidates: Optional[set[str]] = None
+    if kinds is not None:
+        index = load_index(output_dir)
+        candidates = {name for key, names in index.items()
+                      if key.partition(":")[0] in kinds for name in names}
+
+    digests: dict[str, str] = {}   # many bulletins share keys
+    stale = []
+    for output_path, manifest in _iter_manifests(output_dir):
+        if not output_path.exists():
+            continue
+        if candidates is not None and output_path.name not in candidates:
+            continue
+        target = manifest.get("target_date")
+        target_date = date.fromisoformat(target) if target else None
+        if since and target_date and target_date < since:
+            continue
+        changed_keys = []
+        for key, recorded in manifest.get("dependencies", {}).items():
+            if kinds is not None and key.partition(":")[0] not in kinds:
+                continue
+            if key not in digests:
+                digests[key] = current_digest(key)
+            if digests[key] != recorded:
+                changed_keys.append(key)
+        if changed_keys:
+            stale.append(StaleBulletin(
+                output_path=output_path,
+                target_date=target_date,
+                service=manifest.get("service", ""),
+                changed_keys=changed_keys,
+            ))
+    return sorted(stale, key=lambda s: (s.target_date or date.min,
+                                        s.output_path.name))
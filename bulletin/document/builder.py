@@ -16,6 +16,7 @@ from bulletin.document.templates import (
 )
 from bulletin.document.sections.word_of_god import add_word_of_god
 from bulletin.document.sections.holy_communion import add_holy_communion
+from bulletin.logic.church_calendar import lectionary_year
 from bulletin.logic.rules import get_seasonal_rules, get_dismissal_text, detect_special_service
 from bulletin.data.loader import (
     load_common_prayers, load_pop_forms, load_blessings,
@@ -134,12 +135,25 @@ class BulletinBuilder:
         self.penitential_sentence = None
         self.penitential_sentence_ref = ""
         self.blessing_text = ""
+        self.blessing_key = None  # blessings.yaml section, set in resolve_all()
         self.eucharistic_prayer = "A"
         self.post_communion_prayer = self._resolve_closing_prayer()
         self.pop_form_key = None  # Resolved in resolve_all()
         self._missing_songs = []
         self._aac_manifest = []  # (slot_name, aac_filename) for HS services
 
+    def get_templates(self) -> list[str]:
+        """Template filenames (under templates/) that ``build()`` will use."""
+        if self.is_hidden_springs:
+            return ["senior_living_front_cover.docx",
+                    "senior_living_back_cover.docx"]
+        names = [_COVER_TEMPLATES.get(self.special_service, "front_cover.docx")]
+        inside_back = _INSIDE_BACK_COVER_TEMPLATES.get(self.special_service)
+        if inside_back:
+            names.append(inside_back)
+        names.append("back_cover.docx")
+        return names
+
     def get_aac_manifest(self) -> list[tuple[str, str]]:
         """Return the list of (slot_name, aac_filename) pairs for HS services."""
         return self._aac_manifest
@@ -843,6 +857,7 @@ class BulletinBuilder:
         if not blessing_key or blessing_key not in blessings:
             return
 
+        self.blessing_key = blessing_key
         blessing_data = blessings[blessing_key]
 
         if blessing_key == "lent":
@@ -889,7 +904,7 @@ class BulletinBuilder:
             return  # No music at 8am
         service_key = self.service_time  # e.g. "9 am" or "11 am"
 
-        slots = self._get_music_slots()
+        slots = self.get_music_slots()
         for slot in slots:
             if not slot.song_title:
                 continue
@@ -929,8 +944,18 @@ class BulletinBuilder:
                     f"{slot.service_part}: {slot.song_title}")
                 if self.report is not None:
                     # URL-encode just enough for the deep-link query string
+                    from dataclasses import asdict
                     from urllib.parse import urlencode
+                    from bulletin.sources.song_index import alias_for, suggest_songs
                     qs = urlencode({"title": slot.song_title})
+                    # Likely catalog entries under other wording; the
+                    # report offers each as a one-click alias.
+                    alias = alias_for(slot.song_title)
+                    suggestions = [
+                        dict(asdict(s), alias=alias)
+                        for s in suggest_songs(slot.song_title,
+                                               libraries=("main",))
+                    ]
                     self.report.warning(
                         category="song",
                         message=(
@@ -944,6 +969,7 @@ class BulletinBuilder:
                             "include them automatically."
                         ),
                         link=f"/songs/new?{qs}",
+                        suggestions=suggestions,
                     )
 
         if self._missing_songs and prompt_fn:
@@ -962,13 +988,21 @@ class BulletinBuilder:
         the matching key — already disambiguated. No interactive
         prompt is needed; the POP cell is the unambiguous selector.
 
-        If the POP cell is empty or contains a value no form claims,
-        the lookup falls back to ``form_I`` (handled in
-        ``_get_pop_form_key``). To choose a variant (e.g. Form III
-        Immigration Focus), enter that variant's sheet_value (e.g.
-        ``III (immigration)``) directly in the POP column.
+        An empty POP cell selects ``form_I``; a value no form claims
+        also falls back to ``form_I``, with a warning. To choose a
+        variant (e.g. Form III Immigration Focus), enter that
+        variant's sheet_value (e.g. ``III (immigration)``) directly
+        in the POP column.
         """
-        self.pop_form_key = self._get_pop_form_key()
+        form_key = self._get_pop_form_key()
+        if form_key is None:
+            self._warn(
+                f"Unknown POP form {self.schedule.pop_form.strip()!r} on "
+                f"the planning sheet; using Form I.",
+                category="pop_form",
+                fix_hint="Use a value listed on the Prayers page, or add it "
+                         "to that form's sheet_values in pop_forms.yaml.")
+        self.pop_form_key = form_key or "form_I"
 
     # ------------------------------------------------------------------
     # Data preparation for section modules
@@ -1110,7 +1144,7 @@ class BulletinBuilder:
         # Offertory anthem title (11am only — raw text from the Anthem field)
         offertory_anthem_title = None
         if self.service_time == "11 am":
-            slots = self._get_music_slots()
+            slots = self.get_music_slots()
             for slot in slots:
                 if slot.service_part and slot.service_part.lower() == "anthem":
                     offertory_anthem_title = slot.song_title
@@ -1134,7 +1168,7 @@ class BulletinBuilder:
             "include_lev": True,
         }
 
-    def _get_music_slots(self) -> list:
+    def get_music_slots(self) -> list:
         """Return the list of MusicSlot objects regardless of music data format.
 
         Handles both ServiceMusic9am (has .slots) and list[MusicSlot].
@@ -1183,7 +1217,7 @@ class BulletinBuilder:
         When no YAML entry is found for an 11am song with a hymnal number,
         constructs a minimal stub dict for header-only rendering.
         """
-        slots = self._get_music_slots()
+        slots = self.get_music_slots()
         # Special weekday services (7 pm) use the 11am music pool
         service_key = self.service_time
         uses_hymnals = self.service_time in ("11 am", "7 pm")
@@ -1276,7 +1310,7 @@ class BulletinBuilder:
     def _get_pop_concluding_rubric(self) -> str:
         """Get the concluding rubric for the resolved POP form."""
         pop_forms = load_pop_forms()
-        form_key = self.pop_form_key or self._get_pop_form_key()
+        form_key = self.pop_form_key or self._get_pop_form_key() or "form_I"
         form = pop_forms.get(form_key, {})
         return form.get(
             "concluding_rubric",
@@ -1290,7 +1324,7 @@ class BulletinBuilder:
         liturgical_names = placeholders.get("liturgical_names", {})
 
         # Use the version resolved during resolve_all(), or fall back
-        form_key = self.pop_form_key or self._get_pop_form_key()
+        form_key = self.pop_form_key or self._get_pop_form_key() or "form_I"
         form = pop_forms.get(form_key)
 
         if not form:
@@ -1333,7 +1367,7 @@ class BulletinBuilder:
 
         return result
 
-    def _get_pop_form_key(self) -> str:
+    def _get_pop_form_key(self) -> str | None:
         """Map the sheet's POP form designation to a YAML key.
 
         Lookup is pure data-driven: each entry in ``pop_forms.yaml``
@@ -1345,6 +1379,9 @@ class BulletinBuilder:
 
         To add a new prayer form, add a YAML entry with its own
         ``sheet_values``. No Python change required.
+
+        An empty POP cell means ``form_I``; a value no form claims
+        returns None (``_resolve_pop_version`` warns and uses Form I).
         """
         form = (self.schedule.pop_form or "").strip().lower()
         if not form:
@@ -1355,10 +1392,7 @@ class BulletinBuilder:
             for sv in entry.get("sheet_values", []) or []:
                 if str(sv).strip().lower() == form:
                     return key
-
-        # Unrecognized POP value — fall back to Form I.
-        # _resolve_pop_version emits a warning when the key is absent.
-        return "form_I"
+        return None
 
     def _prepare_maundy_thursday_data(self) -> dict:
         """Prepare the Maundy-Thursday-specific data dict."""
@@ -1471,25 +1505,12 @@ class BulletinBuilder:
         }
 
     def _get_liturgical_year(self) -> str:
-        """Determine the liturgical year (A, B, or C) from the schedule.
-
-        The RCL (Revised Common Lectionary) year cycle:
-          A: years divisible by 3 with remainder 1 (2023, 2026, 2029, ...)
-          B: years divisible by 3 with remainder 2 (2024, 2027, 2030, ...)
-          C: years divisible by 3 with remainder 0 (2025, 2028, 2031, ...)
+        """Determine the liturgical year (A, B, or C) for the service date.
 
-        Note: the liturgical year starts in Advent (late Nov/early Dec),
-        but for simplicity we use the calendar year since Palm Sunday
-        is always well into the liturgical year.
+        Looked up in the precomputed church calendar, which handles the
+        Advent rollover (Advent and Christmas use next year's letter).
         """
-        year_num = self.target_date.year
-        remainder = year_num % 3
-        if remainder == 1:
-            return "A"
-        elif remainder == 2:
-            return "B"
-        else:
-            return "C"
+        return lectionary_year(self.target_date)
 
     def get_reading_sheet_data(self) -> dict:
         """Return the data subset needed for reading sheet generation.
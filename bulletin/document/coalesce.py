@@ -0,0 +1,147 @@
+"""
+Optional run-coalescing pass, applied just before a bulletin is saved.
+
+The formatting helpers emit many tiny runs: ``_add_text_runs`` splits
+scripture on ``LORD``, verse numbers alternate with text, the psalm and
+Gloria helpers emit a run per phrase, and ``_replace_in_paragraph``
+leaves blanked ``<w:t>`` elements behind in the cover templates. Word
+renders adjacent runs with the same formatting exactly as one run, so
+``coalesce_runs()`` merges them and drops the empty text, shrinking
+``document.xml`` for faster saves and opens.
+
+A run is merged into the run before it only when both are plain text
+runs — ``<w:rPr>`` plus ``<w:t>``/``<w:tab/>``/``<w:br/>`` content —
+with identical attributes and identical ``<w:rPr>`` XML. Anything else
+(fields, drawings, breaks with a type, bookmarks between the runs)
+ends the merge.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
+
+_P = qn("w:p")
+_R = qn("w:r")
+_RPR = qn("w:rPr")
+_T = qn("w:t")
+_TAB = qn("w:tab")
+_BR = qn("w:br")
+_XML_SPACE = qn("xml:space")
+
+_TEXT_CONTENT = {_T, _TAB, _BR}
+
+
+@dataclass
+class CoalesceStats:
+    """What ``coalesce_runs()`` saved."""
+    runs_before: int
+    runs_after: int
+    xml_bytes_before: int
+    xml_bytes_after: int
+    empty_text_removed: int
+
+    def summary(self) -> str:
+        def kb(n: int) -> str:
+            return f"{n / 1024:,.0f} KB"
+        saved = self.xml_bytes_before - self.xml_bytes_after
+        pct = 100 * saved / self.xml_bytes_before if self.xml_bytes_before else 0
+        return (f"runs {self.runs_before:,} → {self.runs_after:,}, "
+                f"document.xml {kb(self.xml_bytes_before)} → "
+                f"{kb(self.xml_bytes_after)} (-{pct:.0f}%)")
+
+
+def _is_text_run(r) -> bool:
+    for child in r:
+        tag = child.tag
+        if tag == _RPR:
+            continue
+        if tag not in _TEXT_CONTENT:
+            return False
+        if tag == _BR and child.attrib:     # page/column breaks stay put
+            return False
+    return True
+
+
+def _run_key(r) -> tuple:
+    rpr = r.find(_RPR)
+    return (tuple(sorted(r.attrib.items())),
+            etree.tostring(rpr) if rpr is not None else b"")
+
+
+def _merge_text(r):
+    """Join consecutive ``<w:t>`` children of *r* into one."""
+    prev = None
+    for child in list(r):
+        if child.tag != _T:
+            prev = None
+            continue
+        if prev is None:
+            prev = child
+            continue
+        preserve = (prev.get(_XML_SPACE) == "preserve"
+                    or child.get(_XML_SPACE) == "preserve")
+        prev.text = (prev.text or "") + (child.text or "")
+        r.remove(child)
+        text = prev.text
+        if preserve or len(text.strip()) < len(text):
+            prev.set(_XML_SPACE, "preserve")
+
+
+def _drop_empty_text(p) -> int:
+    removed = 0
+    for r in p.findall(_R):
+        for t in r.findall(_T):
+            if not t.text:
+                r.remove(t)
+                removed += 1
+        if all(child.tag == _RPR for child in r):
+            p.remove(r)
+    return removed
+
+
+def _coalesce_paragraph(p):
+    prev, prev_key = None, None
+    for child in list(p):
+        if child.tag != _R or not _is_text_run(child):
+            prev, prev_key = None, None
+            continue
+        key = _run_key(child)
+        if prev is not None and key == prev_key:
+            for content in list(child):
+                if content.tag != _RPR:
+                    prev.append(content)
+            p.remove(child)
+        else:
+            prev, prev_key = child, key
+    for r in p.findall(_R):
+        _merge_text(r)
+
+
+def coalesce_runs(doc: Document) -> CoalesceStats:
+    """Merge adjacent same-format runs in the document body.
+
+    Covers every paragraph under ``<w:body>``, including table cells
+    and text boxes. Returns the before/after run counts and
+    ``document.xml`` sizes.
+    """
+    root = doc.element
+    body = root.body
+    runs_before = sum(1 for _ in body.iter(_R))
+    bytes_before = len(etree.tostring(root))
+
+    removed = 0
+    for p in list(body.iter(_P)):
+        removed += _drop_empty_text(p)
+        _coalesce_paragraph(p)
+
+    return CoalesceStats(
+        runs_before=runs_before,
+        runs_after=sum(1 for _ in body.iter(_R)),
+        xml_bytes_before=bytes_before,
+        xml_bytes_after=len(etree.tostring(root)),
+        empty_text_removed=removed,
+    )
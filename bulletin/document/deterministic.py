@@ -0,0 +1,120 @@
+"""
+Deterministic .docx saving.
+
+``Document.save()`` gives different bytes for the same inputs on every
+run, which defeats comparing a rebuilt bulletin against the last one
+(or checking a change to the generator left the output alone):
+
+  - python-docx writes each zip entry with the current local time
+  - the core properties carry whatever created/modified/last-printed
+    stamps and revision count the cover template was last saved with
+  - drawing IDs (``<wp:docPr id>``) come from wherever each template
+    or helper allocated them — the copied back cover keeps the Word
+    IDs from its own file, and the QR code used a fixed ``id="100"``
+
+``save_deterministic()`` normalizes all three and writes the package
+with a fixed entry order and timestamp, so two builds from the same
+inputs are equal byte for byte. The relationship IDs need no rewriting
+here: ``_copy_related_parts()`` relates template parts in rId order, so
+allocation is already a function of the inputs.
+"""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from docx import Document
+from docx.oxml.ns import qn
+
+# Earliest time a zip entry can carry; the default when no timestamp
+# is given.
+EPOCH = datetime(1980, 1, 1, tzinfo=timezone.utc)
+
+_DOC_PR = qn("wp:docPr")
+
+# Package parts Word expects up front, in this order; the rest follow
+# sorted by name.
+_LEADING_ENTRIES = ("[Content_Types].xml", "_rels/.rels")
+
+
+def _normalize_core_properties(doc: Document, timestamp: datetime):
+    props = doc.core_properties
+    props.created = timestamp
+    props.modified = timestamp
+    props.revision = 1
+    last_printed = props._element.find(qn("cp:lastPrinted"))
+    if last_printed is not None:
+        props._element.remove(last_printed)
+
+
+def _renumber_drawings(doc: Document) -> int:
+    """Give every ``<wp:docPr>`` a sequential ID in document order.
+
+    Covers the body and every header/footer part, in part-name order.
+    Word only requires the IDs to be unique; renumbering also repairs
+    collisions between IDs copied in from different templates.
+    """
+    parts = sorted((p for p in doc.part.package.iter_parts()
+                    if hasattr(p, "element")),
+                   key=lambda p: str(p.partname))
+    next_id = 1
+    for part in parts:
+        for doc_pr in part.element.iter(_DOC_PR):
+            doc_pr.set("id", str(next_id))
+            next_id += 1
+    return next_id - 1
+
+
+def _zip_date_time(timestamp: datetime) -> tuple[int, ...]:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return max(timestamp.timetuple()[:6], EPOCH.timetuple()[:6])
+
+
+def _entry_order(name: str) -> tuple:
+    if name in _LEADING_ENTRIES:
+        return (0, _LEADING_ENTRIES.index(name), name)
+    return (1, 0, name)
+
+
+def _rewrite_zip(data: bytes, date_time: tuple[int, ...]) -> bytes:
+    """Re-pack *data* with sorted entries and fixed metadata."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for name in sorted(src.namelist(), key=_entry_order):
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 0
+            info.external_attr = 0
+            dst.writestr(info, src.read(name))
+    return out.getvalue()
+
+
+def deterministic_bytes(doc: Document,
+                        timestamp: Optional[datetime] = None) -> bytes:
+    """The .docx bytes for *doc*, normalized as described above.
+
+    *timestamp* becomes the created/modified core properties and the
+    zip entry times (the runner passes the service date); defaults to
+    ``EPOCH``. Modifies *doc* in place (core properties, drawing IDs).
+    """
+    timestamp = timestamp or EPOCH
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    _normalize_core_properties(doc, timestamp)
+    _renumber_drawings(doc)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return _rewrite_zip(buf.getvalue(), _zip_date_time(timestamp))
+
+
+def save_deterministic(doc: Document, path: str | Path,
+                       timestamp: Optional[datetime] = None):
+    """Save *doc* to *path* so equal inputs give byte-identical files."""
+    Path(path).write_bytes(deterministic_bytes(doc, timestamp))
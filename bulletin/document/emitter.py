@@ -0,0 +1,257 @@
+"""
+Low-level paragraph emitter for the formatting helpers.
+
+``doc.add_paragraph(style=...)`` and ``paragraph.add_run()`` are
+convenient, but every call resolves the style *name* by searching the
+styles part with XPath, wraps each new element in a proxy object, and
+sets run properties one attribute at a time (each a get-or-add on
+``<w:rPr>``). A bulletin makes thousands of those calls.
+
+This module builds the same ``<w:p>``/``<w:r>`` trees directly with
+the python-docx element factory:
+
+  - Style names are resolved to style IDs once per document, through
+    the same ``DocumentPart.get_style_id()`` python-docx uses.
+  - Run properties are described by a hashable ``RunFormat``; each
+    distinct format is built once per document as a template
+    ``<w:rPr>`` and deep-copied onto runs.
+  - Text is split into ``<w:t>``/``<w:tab/>``/``<w:br/>`` exactly the
+    way ``Run.text`` does, including ``xml:space="preserve"``.
+
+The XML is identical to what the python-docx API produces —
+``bulletin/tests/test_emitter.py`` checks each helper against the
+equivalent API calls.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+import weakref
+from typing import Iterable, NamedTuple, Optional
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.parser import oxml_parser
+from docx.shared import Pt
+from docx.text.paragraph import Paragraph
+
+_W_NSMAP = {"w": nsmap["w"]}
+
+_P = qn("w:p")
+_PPR = qn("w:pPr")
+_PSTYLE = qn("w:pStyle")
+_R = qn("w:r")
+_RPR = qn("w:rPr")
+_T = qn("w:t")
+_TAB = qn("w:tab")
+_BR = qn("w:br")
+_XML_SPACE = qn("xml:space")
+
+# Same split Run.text uses: tabs and line breaks become their own
+# elements, everything between them one <w:t>.
+_CONTENT_RE = re.compile(r"([\t\r\n])")
+
+
+class RunFormat(NamedTuple):
+    """Character formatting for one run (all off by default)."""
+    style: Optional[str] = None         # character style name, e.g. "People"
+    font: Optional[str] = None          # <w:rFonts w:ascii w:hAnsi>
+    bold: bool = False
+    italic: bool = False
+    small_caps: bool = False
+    size: Optional[float] = None        # points
+    superscript: bool = False
+
+
+PLAIN = RunFormat()
+ITALIC = RunFormat(italic=True)
+
+
+def _make(tag: str):
+    return oxml_parser.makeelement(tag, nsmap=_W_NSMAP)
+
+
+def _child(parent, tag: str, **attrs):
+    el = _make(tag)
+    for name, value in attrs.items():
+        el.set(qn(f"w:{name}"), value)
+    parent.append(el)
+    return el
+
+
+# ---------------------------------------------------------------------------
+# Per-document state
+# ---------------------------------------------------------------------------
+
+class _DocumentCache:
+    """Style IDs and ``<w:rPr>`` templates for one document part."""
+
+    def __init__(self, part):
+        self._part = part
+        self._style_ids: dict[tuple[str, WD_STYLE_TYPE], Optional[str]] = {}
+        self._rpr: dict[RunFormat, object] = {}
+        self._ppr: dict[str, object] = {}
+
+    def style_id(self, name: str, style_type: WD_STYLE_TYPE) -> Optional[str]:
+        key = (name, style_type)
+        try:
+            return self._style_ids[key]
+        except KeyError:
+            style_id = self._part.get_style_id(name, style_type)
+            self._style_ids[key] = style_id
+            return style_id
+
+    def ppr(self, style: str):
+        """Template ``<w:pPr>`` for a paragraph style.
+
+        Like ``Paragraph.style``, the default style leaves an empty
+        ``<w:pPr/>`` rather than a ``<w:pStyle>``.
+        """
+        try:
+            return self._ppr[style]
+        except KeyError:
+            pass
+        style_id = self.style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        ppr = _make(_PPR)
+        if style_id is not None:
+            _child(ppr, _PSTYLE, val=style_id)
+        self._ppr[style] = ppr
+        return ppr
+
+    def rpr(self, fmt: RunFormat):
+        """Template ``<w:rPr>`` for *fmt* (None when it sets nothing)."""
+        try:
+            return self._rpr[fmt]
+        except KeyError:
+            pass
+        rpr = _make(_RPR)
+        # Children in CT_RPr schema order, as python-docx inserts them.
+        if fmt.style is not None:
+            style_id = self.style_id(fmt.style, WD_STYLE_TYPE.CHARACTER)
+            if style_id is not None:
+                _child(rpr, qn("w:rStyle"), val=style_id)
+        if fmt.font is not None:
+            _child(rpr, qn("w:rFonts"), ascii=fmt.font, hAnsi=fmt.font)
+        if fmt.bold:
+            _child(rpr, qn("w:b"))
+        if fmt.italic:
+            _child(rpr, qn("w:i"))
+        if fmt.small_caps:
+            _child(rpr, qn("w:smallCaps"))
+        if fmt.size is not None:
+            _child(rpr, qn("w:sz"), val=str(int(Pt(fmt.size).pt * 2)))
+        if fmt.superscript:
+            _child(rpr, qn("w:vertAlign"), val="superscript")
+        if len(rpr) == 0:
+            rpr = None
+        self._rpr[fmt] = rpr
+        return rpr
+
+
+_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _cache(part) -> _DocumentCache:
+    cache = _caches.get(part)
+    if cache is None:
+        cache = _caches[part] = _DocumentCache(part)
+    return cache
+
+
+# ---------------------------------------------------------------------------
+# Emitting
+# ---------------------------------------------------------------------------
+
+def _append_text(r, text: str):
+    for piece in _CONTENT_RE.split(text):
+        if not piece:
+            continue
+        if piece == "\t":
+            r.append(_make(_TAB))
+        elif piece in "\r\n":
+            r.append(_make(_BR))
+        else:
+            t = _make(_T)
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(_XML_SPACE, "preserve")
+            r.append(t)
+
+
+def _append_runs(cache: _DocumentCache, p, runs: Iterable[tuple[str, RunFormat]]):
+    for text, fmt in runs:
+        r = _make(_R)
+        rpr = cache.rpr(fmt)
+        if rpr is not None:
+            r.append(copy.deepcopy(rpr))
+        if text:
+            _append_text(r, text)
+        p.append(r)
+
+
+def append_runs(paragraph: Paragraph, runs: Iterable[tuple[str, RunFormat]]):
+    """Append ``(text, RunFormat)`` runs to an existing paragraph.
+
+    Equivalent to ``paragraph.add_run(text)`` plus setting the format's
+    attributes on each run.
+    """
+    _append_runs(_cache(paragraph.part), paragraph._p, runs)
+
+
+def emit_paragraph(container, style: str,
+                   runs: Iterable[tuple[str, RunFormat]] = ()) -> Paragraph:
+    """Append a paragraph in *style* with *runs* to a Document or cell.
+
+    Equivalent to ``container.add_paragraph(style=style)`` followed by
+    ``add_run()`` per run; for a Document the paragraph goes before the
+    final ``<w:sectPr>`` as python-docx places it.
+    """
+    parent = getattr(container, "_body", container)   # Document → _Body
+    cache = _cache(parent.part)
+
+    p = _make(_P)
+    p.append(copy.deepcopy(cache.ppr(style)))
+    _append_runs(cache, p, runs)
+
+    parent_el = parent._element
+    sect_pr = getattr(parent_el, "sectPr", None)
+    if sect_pr is not None:
+        sect_pr.addprevious(p)
+    else:
+        parent_el.append(p)
+    return Paragraph(p, parent)
+
+
+# ---------------------------------------------------------------------------
+# python-docx reference implementation
+# ---------------------------------------------------------------------------
+# The same two operations through the public python-docx API. Not used
+# when building bulletins; the emitter test compares XML against these,
+# and tools/bench_emitter.py swaps them in to time the difference.
+
+def _reference_append_runs(paragraph: Paragraph,
+                           runs: Iterable[tuple[str, RunFormat]]):
+    for text, fmt in runs:
+        run = paragraph.add_run(text)
+        if fmt.style is not None:
+            run.style = paragraph.part.document.styles[fmt.style]
+        if fmt.font is not None:
+            run.font.name = fmt.font
+        if fmt.bold:
+            run.bold = True
+        if fmt.italic:
+            run.italic = True
+        if fmt.small_caps:
+            run.font.small_caps = True
+        if fmt.size is not None:
+            run.font.size = Pt(fmt.size)
+        if fmt.superscript:
+            run.font.superscript = True
+
+
+def _reference_emit_paragraph(container, style: str,
+                              runs: Iterable[tuple[str, RunFormat]] = ()) -> Paragraph:
+    p = container.add_paragraph(style=style)
+    _reference_append_runs(p, runs)
+    return p
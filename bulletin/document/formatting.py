@@ -9,21 +9,54 @@ These functions encapsulate the common patterns used throughout the bulletin:
   - Two-column lyrics layout using borderless tables
   - Cross symbols
   - Spacers
+
+The paragraph-level helpers write their XML through
+``bulletin.document.emitter`` rather than ``doc.add_paragraph()``.
 """
 
+import copy
+import weakref
+
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor, Emu
-from docx.table import Table
+from docx.shared import Inches, RGBColor, Emu
+from docx.table import Table, _Cell
 from docx.oxml.ns import qn, nsdecls
 from docx.oxml import parse_xml
 import re
 
 from bulletin.config import CROSS_SYMBOL, FONT_BODY, FONT_BODY_BOLD, FONT_LYRICS
+from bulletin.document.emitter import (
+    ITALIC, PLAIN, RunFormat, append_runs, emit_paragraph,
+)
+
+# Run formats shared by the helpers below.
+_BOLD = RunFormat(font=FONT_BODY_BOLD, bold=True)
+_PEOPLE = RunFormat(style="People")
+_SMALL_CAPS = RunFormat(small_caps=True)
+_BOLD_SMALL_CAPS = RunFormat(font=FONT_BODY_BOLD, bold=True, small_caps=True)
+_VERSE_NUMBER = RunFormat(size=9, superscript=True)
+
+
+def _text_runs(text: str) -> list:
+    """A single plain run for *text* (none for ""), like add_paragraph(text)."""
+    return [(text, PLAIN)] if text else []
+
+
+def _with_crosses(text: str, fmt: RunFormat = PLAIN,
+                  cross_font: str = FONT_BODY_BOLD) -> list:
+    """Runs for *text* with each ✠ as a bold cross (see add_cross_symbol)."""
+    runs = []
+    for i, part in enumerate(text.split(CROSS_SYMBOL)):
+        if i > 0:
+            runs.append((CROSS_SYMBOL, RunFormat(font=cross_font, bold=True)))
+        if part:
+            runs.append((part, fmt))
+    return runs
 
 
 def add_spacer(doc: Document):
     """Add a small vertical spacer paragraph."""
-    doc.add_paragraph("", style="Spacer - Small")
+    emit_paragraph(doc, "Spacer - Small")
 
 
 def add_heading(doc: Document, text: str):
@@ -33,46 +66,35 @@ def add_heading(doc: Document, text: str):
     """
     add_spacer(doc)
     add_spacer(doc)
-    doc.add_paragraph(text, style="Heading")
+    emit_paragraph(doc, "Heading", _text_runs(text))
 
 
 def add_heading2(doc: Document, text: str):
     """Add a section header (e.g., 'Processional', 'Sermon', 'The Peace')."""
-    doc.add_paragraph(text, style="Heading 2")
+    emit_paragraph(doc, "Heading 2", _text_runs(text))
 
 
 def add_rubric(doc: Document, text: str):
     """Add a rubric (italic instruction within the service)."""
-    doc.add_paragraph(text, style="Body - Rubric")
+    emit_paragraph(doc, "Body - Rubric", _text_runs(text))
 
 
 def add_introductory_rubric(doc: Document, text: str):
     """Add an introductory rubric ('Please stand.', 'Be seated.', etc.)."""
-    return doc.add_paragraph(text, style="Body - Introductory Rubric")
+    return emit_paragraph(doc, "Body - Introductory Rubric", _text_runs(text))
 
 
 def add_body(doc: Document, text: str):
     """Add a body text paragraph, rendering ✠ as a bold cross symbol."""
     if CROSS_SYMBOL in text:
-        p = doc.add_paragraph(style="Body")
-        parts = text.split(CROSS_SYMBOL)
-        for i, part in enumerate(parts):
-            if i > 0:
-                add_cross_symbol(p)
-            if part:
-                p.add_run(part)
+        emit_paragraph(doc, "Body", _with_crosses(text))
     else:
-        doc.add_paragraph(text, style="Body")
+        emit_paragraph(doc, "Body", _text_runs(text))
 
 
 def add_body_with_bold_ending(doc: Document, text: str, bold_text: str):
     """Add a body paragraph where the last portion is bold (e.g., ending with 'Amen.')."""
-    p = doc.add_paragraph(style="Body")
-    p.add_run(text)
-    run = p.add_run(bold_text)
-    run.bold = True
-    run.font.name = FONT_BODY_BOLD
-    return p
+    return emit_paragraph(doc, "Body", [(text, PLAIN), (bold_text, _BOLD)])
 
 
 def add_celebrant_line(doc: Document, label: str, text: str):
@@ -82,9 +104,7 @@ def add_celebrant_line(doc: Document, label: str, text: str):
         label: Usually 'Celebrant' or 'The Deacon or a Priest'
         text: The words spoken
     """
-    p = doc.add_paragraph(style="Body - Dialogue")
-    p.add_run(label + "\t" + text)
-    return p
+    return emit_paragraph(doc, "Body - Dialogue", [(label + "\t" + text, PLAIN)])
 
 
 def add_people_line(doc: Document, label: str, text: str):
@@ -94,10 +114,8 @@ def add_people_line(doc: Document, label: str, text: str):
         label: Usually 'People'
         text: The response
     """
-    p = doc.add_paragraph(style="Body - Dialogue")
-    run = p.add_run(label + "\t" + text)
-    run.style = doc.styles["People"]
-    return p
+    return emit_paragraph(doc, "Body - Dialogue",
+                          [(label + "\t" + text, _PEOPLE)])
 
 
 def add_dialogue(doc: Document, celebrant_text: str, people_text: str,
@@ -179,15 +197,13 @@ def add_hymn_header(doc: Document, title: str, tune_name: str = None,
 def add_lyric_verse(doc: Document, lines: list[str]):
     """Add a verse (non-italic) of a hymn/song, one paragraph per line."""
     for line in lines:
-        doc.add_paragraph(line, style="Body - Lyrics")
+        emit_paragraph(doc, "Body - Lyrics", _text_runs(line))
 
 
 def add_lyric_chorus(doc: Document, lines: list[str]):
     """Add a chorus/refrain (italic) of a hymn/song, one paragraph per line."""
     for line in lines:
-        p = doc.add_paragraph(style="Body - Lyrics")
-        run = p.add_run(line)
-        run.italic = True
+        emit_paragraph(doc, "Body - Lyrics", [(line, ITALIC)])
 
 
 def add_no_split_block(doc: Document, add_content_fn):
@@ -199,17 +215,7 @@ def add_no_split_block(doc: Document, add_content_fn):
                         to the cell. The cell's default empty paragraph
                         is already removed before calling.
     """
-    table = doc.add_table(rows=1, cols=1)
-    table.autofit = True
-    _remove_table_borders(table)
-    _prevent_row_split(table)
-    _remove_cell_margins(table)
-
-    cell = table.cell(0, 0)
-    # Remove default empty paragraph
-    for p in cell.paragraphs:
-        p._element.getparent().remove(p._element)
-
+    [[cell]] = lyric_table(doc)
     add_content_fn(cell)
 
 
@@ -251,14 +257,10 @@ def add_song(doc: Document, song_data: dict, multi_row: bool = False):
 
     if multi_row:
         # 1×N table: one row per section (verse/chorus)
-        table = doc.add_table(rows=len(sections), cols=1)
-        table.autofit = True
-        _remove_table_borders(table)
-        _prevent_row_split(table)
-        _remove_cell_margins(table)
+        rows = lyric_table(doc, rows=len(sections))
 
         for i, section in enumerate(sections):
-            cell = table.cell(i, 0)
+            [cell] = rows[i]
             _fill_lyric_cell(cell, [section])
             # Add a small trailing spacer in every row except the last,
             # so consecutive rows don't visually touch on the page.
@@ -266,13 +268,7 @@ def add_song(doc: Document, song_data: dict, multi_row: bool = False):
                 cell.add_paragraph("", style="Spacer - Small")
     else:
         # 1×1 table: all sections in one cell
-        table = doc.add_table(rows=1, cols=1)
-        table.autofit = True
-        _remove_table_borders(table)
-        _prevent_row_split(table)
-        _remove_cell_margins(table)
-
-        cell = table.cell(0, 0)
+        [[cell]] = lyric_table(doc)
         _fill_lyric_cell(cell, sections)
 
 
@@ -304,25 +300,16 @@ def add_song_two_column(doc: Document, song_data: dict):
     # Glue the title to the song table that follows.
     header_p.paragraph_format.keep_with_next = True
 
-    # Create a borderless two-column table
-    table = doc.add_table(rows=1, cols=2)
-    table.autofit = True
-    _remove_table_borders(table)
-    _prevent_row_split(table)
-
-    # Set column widths (equal split of available space)
-    available_width = Inches(PAGE_WIDTH_INCHES - 2 * MARGIN_INCHES)
-    col_width = available_width // 2
-    for cell in table.rows[0].cells:
-        cell.width = col_width
+    # Borderless two-column table
+    [[left, right]] = lyric_table(doc, two_column=True)
 
     # Split sections into left and right columns
     mid = (len(sections) + 1) // 2
     left_sections = sections[:mid]
     right_sections = sections[mid:]
 
-    _fill_lyric_cell(table.cell(0, 0), left_sections)
-    _fill_lyric_cell(table.cell(0, 1), right_sections,
+    _fill_lyric_cell(left, left_sections)
+    _fill_lyric_cell(right, right_sections,
                      lyric_style="Body - Lyrics Right")
 
 
@@ -336,13 +323,80 @@ def _fill_lyric_cell(cell, sections: list[dict],
     for i, section in enumerate(sections):
         if i > 0:
             # Add spacer between sections
-            sp = cell.add_paragraph("", style="Spacer - Small")
+            emit_paragraph(cell, "Spacer - Small")
 
+        fmt = ITALIC if section["type"] == "chorus" else PLAIN
         for line_text in section["lines"]:
-            p = cell.add_paragraph(style=lyric_style)
-            run = p.add_run(line_text)
-            if section["type"] == "chorus":
-                run.italic = True
+            emit_paragraph(cell, lyric_style, [(line_text, fmt)])
+
+
+# ---------------------------------------------------------------------------
+# Lyric table skeletons
+# ---------------------------------------------------------------------------
+# Songs and no-split blocks all sit in borderless, no-split tables.
+# Through python-docx each one costs an add_table() plus three passes
+# over the property XML, so the first table of each shape in a document
+# is built that way and kept as a skeleton — the table shell (tblPr and
+# tblGrid) and one row with its default paragraphs removed. Every later
+# table is a deep copy of the shell with as many copies of the row as
+# it needs.
+
+# Document part → {two_column: (tbl shell, tr template)}
+_table_skeletons: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _build_table_skeleton(doc: Document, two_column: bool):
+    if two_column:
+        table = doc.add_table(rows=1, cols=2)
+        table.autofit = True
+        _remove_table_borders(table)
+        _prevent_row_split(table)
+        # Equal split of the available width
+        available_width = Inches(PAGE_WIDTH_INCHES - 2 * MARGIN_INCHES)
+        col_width = available_width // 2
+        for cell in table.rows[0].cells:
+            cell.width = col_width
+    else:
+        table = doc.add_table(rows=1, cols=1)
+        table.autofit = True
+        _remove_table_borders(table)
+        _prevent_row_split(table)
+        _remove_cell_margins(table)
+
+    tbl = table._tbl
+    tbl.getparent().remove(tbl)
+    row = tbl.tr_lst[0]
+    tbl.remove(row)
+    for tc in row.tc_lst:
+        for p in tc.p_lst:
+            tc.remove(p)
+    return tbl, row
+
+
+def lyric_table(doc: Document, rows: int = 1,
+                two_column: bool = False) -> list[list[_Cell]]:
+    """Append a borderless, no-split table and return its cells by row.
+
+    Single-column tables also have zero cell margins; two-column ones
+    split the text width evenly. The cells start with no paragraphs —
+    fill each one before saving (Word requires at least one).
+    """
+    skeletons = _table_skeletons.setdefault(doc.part, {})
+    if two_column not in skeletons:
+        skeletons[two_column] = _build_table_skeleton(doc, two_column)
+    shell, row = skeletons[two_column]
+
+    tbl = copy.deepcopy(shell)
+    for _ in range(rows):
+        tbl.append(copy.deepcopy(row))
+    body = doc.element.body
+    if body.sectPr is not None:
+        body.sectPr.addprevious(tbl)
+    else:
+        body.append(tbl)
+
+    table = Table(tbl, doc)
+    return [[_Cell(tc, table) for tc in tr.tc_lst] for tr in tbl.tr_lst]
 
 
 def _remove_table_borders(table: Table):
@@ -416,6 +470,14 @@ def add_scripture_text(doc: Document, text: str, style: str = "Reading/Gospel Te
                 Used when the caller iterates paragraphs and knows
                 this is not the first paragraph of the reading.
     """
+    p = None
+    for runs in _scripture_paragraph_runs(text, indent):
+        p = emit_paragraph(doc, style, runs)
+    return p
+
+
+def _scripture_paragraph_runs(text: str, indent: bool = False) -> list[list]:
+    """The runs for each paragraph ``add_scripture_text()`` emits."""
     # Replace asterisks (oremus.org footnote markers) with spaces so that
     # verse numbers adjacent to footnotes (e.g. "'*7 Do not") are still
     # separated by whitespace for the superscript regex to detect them.
@@ -428,8 +490,7 @@ def add_scripture_text(doc: Document, text: str, style: str = "Reading/Gospel Te
 
     paragraphs = text.strip().split("\n\n")  # Double newline = new paragraph
 
-    para_count = 0
-    p = None
+    result = []
     for para_text in paragraphs:
         para_text = para_text.strip()
         if not para_text:
@@ -439,18 +500,14 @@ def add_scripture_text(doc: Document, text: str, style: str = "Reading/Gospel Te
         para_text = para_text.replace("\n", " ")
         para_text = re.sub(r"  +", " ", para_text)
 
-        p = doc.add_paragraph(style=style)
-
         # Indent with a tab if:
         # - caller said this is a continuation paragraph (indent=True), OR
         # - this is the 2nd+ paragraph within this text block
-        if indent or para_count > 0:
-            p.add_run("\t")
-
-        _add_verse_numbered_text(p, para_text)
-        para_count += 1
+        runs = [("\t", PLAIN)] if indent or result else []
+        runs.extend(_verse_numbered_runs(para_text))
+        result.append(runs)
 
-    return p
+    return result
 
 
 def _add_text_runs(paragraph, text: str, bold: bool = False):
@@ -462,19 +519,21 @@ def _add_text_runs(paragraph, text: str, bold: bool = False):
     When *bold* is True, all runs are set to bold with the bold font,
     used for alternating psalm verses in responsive readings.
     """
-    parts = re.split(r'\bLORD\b', text)
-    for i, part in enumerate(parts):
+    append_runs(paragraph, _lord_runs(text, bold))
+
+
+_LORD_RE = re.compile(r'\bLORD\b')
+
+
+def _lord_runs(text: str, bold: bool = False) -> list:
+    fmt, lord_fmt = (_BOLD, _BOLD_SMALL_CAPS) if bold else (PLAIN, _SMALL_CAPS)
+    runs = []
+    for i, part in enumerate(_LORD_RE.split(text)):
         if i > 0:
-            run = paragraph.add_run("Lord")
-            run.font.small_caps = True
-            if bold:
-                run.bold = True
-                run.font.name = FONT_BODY_BOLD
+            runs.append(("Lord", lord_fmt))
         if part:
-            run = paragraph.add_run(part)
-            if bold:
-                run.bold = True
-                run.font.name = FONT_BODY_BOLD
+            runs.append((part, fmt))
+    return runs
 
 
 def _add_verse_numbered_text(paragraph, text: str):
@@ -483,15 +542,17 @@ def _add_verse_numbered_text(paragraph, text: str):
     Verse numbers are marked by the scripture parser with \\x01 delimiters:
       "\\x014\\x01 From Mount Hor..." or "\\x0117\\x01 'In the last days..."
     """
-    segments = _split_verse_numbers(text)
+    append_runs(paragraph, _verse_numbered_runs(text))
+
 
-    for verse_num, segment_text in segments:
+def _verse_numbered_runs(text: str) -> list:
+    runs = []
+    for verse_num, segment_text in _split_verse_numbers(text):
         if verse_num:
-            run = paragraph.add_run(verse_num + _NBSP)
-            run.font.superscript = True
-            run.font.size = Pt(9)
+            runs.append((verse_num + _NBSP, _VERSE_NUMBER))
         if segment_text:
-            _add_text_runs(paragraph, segment_text)
+            runs.extend(_lord_runs(segment_text))
+    return runs
 
 
 def _split_verse_numbers(text: str) -> list[tuple[str | None, str]]:
@@ -0,0 +1,113 @@
+"""
+Pre-rendered OOXML fragments for the static BCP blocks.
+
+Large parts of every bulletin are identical week to week — the Nicene
+Creed, the Confession and Absolution, the body of Eucharistic Prayer
+A/B/C, the Sanctus, the Lord's Prayer, the Agnus Dei, the Great
+Litany — yet each is rebuilt paragraph by paragraph and run by run
+through python-docx, which resolves style names and creates run
+properties one attribute at a time.
+
+``cached_block()`` renders a block the ordinary way the first time,
+snapshots the body elements it appended, and on every later call
+splices deep copies of that snapshot into the body instead. Fragments
+are keyed by:
+
+  - the document's style set and page setup (a digest of ``styles.xml``
+    and the section properties), since style IDs and table widths are
+    baked into the XML — the regular, large-print, and reading-sheet
+    documents each get their own fragments
+  - the block name and variant (e.g. ``"prayer_a"``)
+  - a digest of the text the block renders, so an edit to
+    ``common_prayers.yaml`` is picked up without clearing anything
+
+Only blocks that are pure functions of their text belong here: nothing
+that adds a relationship (images, hyperlinks) or allocates an ID, since
+the copied XML would point at a part the new document doesn't have.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import weakref
+from typing import Callable
+
+from docx import Document
+from lxml import etree
+
+from bulletin.fingerprint import digest
+
+# (style key, name, variant, text digest) → list of body elements.
+_fragments: dict[tuple, list] = {}
+
+# Document part → style key. Computed once per document; the bulletin
+# styles are all registered by configure_document() before any section
+# renders. (Keyed on the part because ``Document`` itself is unhashable.)
+_style_keys: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+_hits = 0
+_misses = 0
+
+
+def _style_key(doc: Document) -> str:
+    key = _style_keys.get(doc.part)
+    if key is None:
+        h = hashlib.sha256(etree.tostring(doc.styles.element))
+        sect_pr = doc.element.body.sectPr
+        if sect_pr is not None:
+            h.update(etree.tostring(sect_pr))
+        key = h.hexdigest()
+        _style_keys[doc.part] = key
+    return key
+
+
+def cached_block(doc: Document, name: str, text, render: Callable,
+                 *, variant: str = ""):
+    """Append block *name* to *doc*, calling ``render(doc)`` only on a miss.
+
+    Args:
+        doc: The Document being built.
+        name: Block name (``"nicene_creed"``, ``"confession"``, ...).
+        text: Everything from the data files the block renders; it is
+            digested into the key. Pass ``None`` for blocks whose text
+            lives in the code.
+        render: Callable that appends the block to the document body.
+        variant: Distinguishes renderings of the same block (e.g. the
+            sung vs. spoken Sanctus).
+    """
+    global _hits, _misses
+    body = doc.element.body
+    sect_pr = body.sectPr
+    key = (_style_key(doc), name, variant, digest(text))
+
+    fragment = _fragments.get(key)
+    if fragment is not None:
+        _hits += 1
+        for el in fragment:
+            el = copy.deepcopy(el)
+            if sect_pr is not None:
+                sect_pr.addprevious(el)
+            else:
+                body.append(el)
+        return
+
+    _misses += 1
+    trailing = 1 if sect_pr is not None else 0
+    start = len(body) - trailing
+    render(doc)
+    end = len(body) - trailing
+    _fragments[key] = [copy.deepcopy(el) for el in body[start:end]]
+
+
+def cache_info() -> tuple[int, int, int]:
+    """(hits, misses, fragments held) since the last ``clear_cache()``."""
+    return _hits, _misses, len(_fragments)
+
+
+def clear_cache():
+    """Drop every cached fragment (tests; a long-running process after a
+    code change)."""
+    global _hits, _misses
+    _fragments.clear()
+    _hits = _misses = 0
@@ -0,0 +1,289 @@
+"""
+Intermediate representation for bulletin content.
+
+The section modules write straight into a python-docx ``Document``, so
+looking at what a bulletin *says* — a web preview, a text diff between
+two weeks, a test — has meant a full docx build. The typed blocks here
+describe content without a document behind it:
+
+    Spacer, Heading, Rubric, Body, DialogueLine, Scripture,
+    PsalmVerse, PageBreak
+
+A producer returns a list of blocks (``word_of_god.pop_blocks()``,
+``reading_sheet.reading_sheet_blocks()``) and one of three renderers
+turns it into output:
+
+  - ``render_docx(doc, blocks)``  the real thing, through the same
+    formatting helpers and emitter the section modules use, so the
+    XML is unchanged from building the document directly
+  - ``render_html(blocks)``       an HTML fragment for the web UI
+  - ``render_text(blocks)``       plain text, for diffs and checks
+
+Blocks are frozen dataclasses: they compare by value and go straight
+into ``fingerprint.digest()``, so a list of blocks is cheap to cache
+and to compare week over week.
+
+Most blocks are just styled paragraphs. ``paragraphs()`` expands one
+into ``(style, runs)`` pairs — the ``(text, RunFormat)`` runs the
+emitter writes — and both the docx and HTML renderers work from that,
+so they agree on LORD/Lord, verse numbers, and crosses by
+construction.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.shared import Pt
+
+from bulletin.config import CROSS_SYMBOL
+from bulletin.document.emitter import PLAIN, RunFormat, emit_paragraph
+from bulletin.document.formatting import (
+    _BOLD,
+    _PEOPLE,
+    _add_text_runs,
+    _lord_runs,
+    _scripture_paragraph_runs,
+    _text_runs,
+    _with_crosses,
+)
+
+
+# ---------------------------------------------------------------------------
+# Blocks
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Spacer:
+    """A small vertical gap (``add_spacer``)."""
+
+
+@dataclass(frozen=True)
+class Heading:
+    """A section heading: level 1 is "Heading", level 2 "Heading 2".
+
+    Only the heading paragraph — ``add_heading()``'s two leading
+    spacers are separate ``Spacer`` blocks.
+    """
+    text: str
+    level: int = 1
+
+
+@dataclass(frozen=True)
+class Rubric:
+    """An italic instruction; *introductory* for "Please stand." etc."""
+    text: str
+    introductory: bool = False
+
+
+@dataclass(frozen=True)
+class Body:
+    """A body paragraph (✠ rendered as a bold cross).
+
+    With *bold_text*, the paragraph is *text* followed by a bold run —
+    a people's response after the leader's words, or an "Amen."
+    """
+    text: str
+    bold_text: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DialogueLine:
+    """One ``label<TAB>text`` line; *people* sets it in the People style."""
+    label: str
+    text: str
+    people: bool = False
+
+
+@dataclass(frozen=True)
+class Scripture:
+    """Scripture text with ``\\x01N\\x01`` verse markers (``add_scripture_text``)."""
+    text: str
+    style: str = "Reading/Gospel Text"
+    indent: bool = False
+
+
+@dataclass(frozen=True)
+class PsalmVerse:
+    """One psalm verse in the "Psalm" style.
+
+    ``\\n`` separates the half-verse lines; a line starting ``\\v``
+    continues the first half as its own paragraph. *bold* sets the
+    whole verse bold; *half_verse* bolds the tab-indented second half
+    (read responsively by half verse).
+    """
+    text: str
+    bold: bool = False
+    half_verse: bool = False
+
+    def line_bold(self, i: int, line: str) -> bool:
+        """Whether line *i* of the verse is set bold."""
+        if self.half_verse:
+            return i > 0 and line.startswith("\t")
+        return self.bold
+
+
+@dataclass(frozen=True)
+class PageBreak:
+    """Start a new page."""
+
+
+Block = Union[Spacer, Heading, Rubric, Body, DialogueLine, Scripture,
+              PsalmVerse, PageBreak]
+
+
+def heading_blocks(text: str) -> list[Block]:
+    """What ``add_heading()`` adds: two spacers and the heading."""
+    return [Spacer(), Spacer(), Heading(text)]
+
+
+# ---------------------------------------------------------------------------
+# Blocks as styled paragraphs
+# ---------------------------------------------------------------------------
+
+def _body_runs(block: Body) -> list:
+    if block.bold_text is None:
+        if CROSS_SYMBOL in block.text:
+            return _with_crosses(block.text)
+        return _text_runs(block.text)
+    return _text_runs(block.text) + [(block.bold_text, _BOLD)]
+
+
+def _psalm_paragraphs(block: PsalmVerse) -> list[list]:
+    """Runs per paragraph of a psalm verse (``\\n`` kept as a line break)."""
+    result = [[]]
+    for i, sub in enumerate(block.text.split("\n")):
+        bold = block.line_bold(i, sub)
+        if sub.startswith("\v"):
+            result.append(_lord_runs(sub[1:], bold))
+        else:
+            if i > 0:
+                result[-1].append(("\n", PLAIN))
+            result[-1].extend(_lord_runs(sub, bold))
+    return result
+
+
+def paragraphs(block: Block) -> list[tuple[str, list]]:
+    """``(style, runs)`` for each paragraph *block* renders as.
+
+    Page breaks have no paragraph text and return ``[]``.
+    """
+    if isinstance(block, Spacer):
+        return [("Spacer - Small", [])]
+    if isinstance(block, Heading):
+        style = "Heading" if block.level == 1 else "Heading 2"
+        return [(style, _text_runs(block.text))]
+    if isinstance(block, Rubric):
+        style = ("Body - Introductory Rubric" if block.introductory
+                 else "Body - Rubric")
+        return [(style, _text_runs(block.text))]
+    if isinstance(block, Body):
+        return [("Body", _body_runs(block))]
+    if isinstance(block, DialogueLine):
+        fmt = _PEOPLE if block.people else PLAIN
+        return [("Body - Dialogue", [(block.label + "\t" + block.text, fmt)])]
+    if isinstance(block, Scripture):
+        return [(block.style, runs)
+                for runs in _scripture_paragraph_runs(block.text, block.indent)]
+    if isinstance(block, PsalmVerse):
+        return [("Psalm", runs) for runs in _psalm_paragraphs(block)]
+    if isinstance(block, PageBreak):
+        return []
+    raise TypeError(f"Not a bulletin block: {block!r}")
+
+
+# ---------------------------------------------------------------------------
+# docx
+# ---------------------------------------------------------------------------
+
+def _render_psalm_verse(doc: Document, block: PsalmVerse):
+    p = doc.add_paragraph(style="Psalm")
+    for i, sub in enumerate(block.text.split("\n")):
+        bold = block.line_bold(i, sub)
+        if sub.startswith("\v"):
+            # First-half continuation: new paragraph at left margin
+            p.paragraph_format.space_after = Pt(0)
+            p = doc.add_paragraph(style="Psalm")
+            p.paragraph_format.space_before = Pt(0)
+            _add_text_runs(p, sub[1:], bold=bold)
+        else:
+            if i > 0:
+                p.add_run().add_break()
+            _add_text_runs(p, sub, bold=bold)
+
+
+def _render_page_break(doc: Document):
+    run = doc.add_paragraph().add_run()
+    run._element.append(parse_xml(
+        '<w:br xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        ' w:type="page"/>'
+    ))
+
+
+def render_docx(doc: Document, blocks: list[Block]):
+    """Append *blocks* to *doc*."""
+    for block in blocks:
+        if isinstance(block, PsalmVerse):
+            _render_psalm_verse(doc, block)
+        elif isinstance(block, PageBreak):
+            _render_page_break(doc)
+        else:
+            for style, runs in paragraphs(block):
+                emit_paragraph(doc, style, runs)
+
+
+# ---------------------------------------------------------------------------
+# Text and HTML
+# ---------------------------------------------------------------------------
+
+def _runs_text(runs: list) -> str:
+    return "".join(text for text, _ in runs)
+
+
+def render_text(blocks: list[Block]) -> str:
+    """Plain text: one line per paragraph, a blank line per spacer,
+    a form feed per page break. Formatting is dropped."""
+    lines: list[str] = []
+    for block in blocks:
+        if isinstance(block, PageBreak):
+            lines.append("\f")
+        else:
+            lines.extend(_runs_text(runs) for _, runs in paragraphs(block))
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _style_class(style: str) -> str:
+    return "ir-" + re.sub(r"[^a-z0-9]+", "-", style.lower()).strip("-")
+
+
+def _run_html(text: str, fmt: RunFormat) -> str:
+    out = html.escape(text).replace("\n", "<br>").replace(
+        "\t", '<span class="ir-tab"></span>')
+    if fmt.superscript:
+        out = f"<sup>{out}</sup>"
+    if fmt.small_caps:
+        out = f'<span class="ir-small-caps">{out}</span>'
+    if fmt.italic:
+        out = f"<em>{out}</em>"
+    if fmt.bold or fmt.style == "People":
+        out = f"<strong>{out}</strong>"
+    return out
+
+
+def render_html(blocks: list[Block]) -> str:
+    """An HTML fragment: a ``<p>`` per paragraph, classed by style name
+    (``ir-body``, ``ir-body-rubric``, ``ir-psalm``, ...)."""
+    out: list[str] = []
+    for block in blocks:
+        if isinstance(block, PageBreak):
+            out.append('<hr class="ir-page-break">')
+        else:
+            for style, runs in paragraphs(block):
+                inner = "".join(_run_html(text, fmt) for text, fmt in runs)
+                out.append(f'<p class="{_style_class(style)}">{inner}</p>')
+    return "\n".join(out)
@@ -36,6 +36,7 @@ from bulletin.document.formatting import (
     add_song, add_song_two_column, add_hymn_header,
     add_no_split_block,
 )
+from bulletin.document.fragments import cached_block
 from bulletin.logic.rules import SeasonalRules
 
 
@@ -127,14 +128,7 @@ def add_holy_communion(doc: Document, rules: SeasonalRules, data: dict):
         add_prayer_a_or_b(doc, ep_data, data, prayers, prayer_key)
 
     # --- Lord's Prayer ---
-    add_spacer(doc)
-    add_rubric(doc, "Please stand and, as you are comfortable, join hands "
-               "with those around you.")
-    add_body(doc, prayers["lords_prayer_intro"]["option_1"])
-    text = " ".join(line.strip() for line in prayers["lords_prayer"])
-    p = doc.add_paragraph(style="Body - People Recitation")
-    run = p.add_run(text)
-    run.style = doc.styles["People"]
+    add_lords_prayer(doc, prayers)
 
     # --- Breaking of the Bread ---
     add_spacer(doc)
@@ -154,15 +148,7 @@ def add_holy_communion(doc: Document, rules: SeasonalRules, data: dict):
                                 force_single_column=True)
             else:
                 # Default Agnus Dei text
-                for line in [
-                    "Lamb of God, you take away the sins of the world: have mercy on us.",
-                    "Lamb of God, you take away the sins of the world: have mercy on us.",
-                    "Lamb of God, you take away the sins of the world: grant us peace.",
-                ]:
-                    p = doc.add_paragraph(style="Body - Dialogue")
-                    run = p.add_run(line)
-                    run.bold = True
-                    run.font.name = FONT_BODY_BOLD
+                cached_block(doc, "agnus_dei", None, _render_agnus_dei_text)
     else:
         add_celebrant_line(doc, "Celebrant", rules.fraction_celebrant)
         add_people_line(doc, "People", rules.fraction_people)
@@ -317,6 +303,14 @@ def add_prayer_a_or_b(doc: Document, ep_data: dict, data: dict,
         # Text version of Sanctus
         add_sanctus_text(doc, prayers["sanctus"])
 
+    # Everything after the Sanctus is fixed text for the chosen prayer.
+    cached_block(doc, "eucharistic_prayer_body", prayer,
+                 lambda d: _render_prayer_a_or_b_body(d, prayer),
+                 variant=key)
+
+
+def _render_prayer_a_or_b_body(doc: Document, prayer: dict):
+    """Eucharistic Prayer A/B from the kneeling rubric through the doxology."""
     # Kneeling rubric
     add_spacer(doc)
     add_rubric(doc, "Please kneel or remain standing. The Celebrant continues")
@@ -367,6 +361,24 @@ def add_prayer_c(doc: Document, ep_data: dict, data: dict, prayers: dict):
     Prayer C has a unique structure different from A/B — it's fully
     responsive with Celebrant/People exchanges throughout.
     """
+    # The text is fixed in this module, so both halves around the
+    # Sanctus are rendered once per process.
+    cached_block(doc, "prayer_c_opening", None, _render_prayer_c_opening)
+
+    # Sanctus
+    sanctus_song = data.get("sanctus_song")
+    if sanctus_song:
+        add_communion_song_smart(doc, sanctus_song, force_single_column=True)
+    elif data.get("service_time") == "8 am":
+        add_sanctus_spoken(doc, prayers["sanctus"])
+    else:
+        add_sanctus_text(doc, prayers["sanctus"])
+
+    cached_block(doc, "prayer_c_body", None, _render_prayer_c_body)
+
+
+def _render_prayer_c_opening(doc: Document):
+    """Eucharistic Prayer C up to the Sanctus."""
     # Prayer C text — we output the full responsive text
     # The preface is woven into the prayer itself, not separate
     pc = [
@@ -391,15 +403,9 @@ def add_prayer_c(doc: Document, ep_data: dict, data: dict, prayers: dict):
             run.font.name = FONT_BODY_BOLD
         add_spacer(doc)
 
-    # Sanctus
-    sanctus_song = data.get("sanctus_song")
-    if sanctus_song:
-        add_communion_song_smart(doc, sanctus_song, force_single_column=True)
-    elif data.get("service_time") == "8 am":
-        add_sanctus_spoken(doc, prayers["sanctus"])
-    else:
-        add_sanctus_text(doc, prayers["sanctus"])
 
+def _render_prayer_c_body(doc: Document):
+    """Eucharistic Prayer C from the kneeling rubric through the doxology."""
     # Post-Sanctus continuation
     add_spacer(doc)
     add_rubric(doc, "Please kneel or remain standing. The Celebrant continues")
@@ -471,6 +477,11 @@ def add_prayer_c(doc: Document, ep_data: dict, data: dict, prayers: dict):
 
 def add_sanctus_text(doc: Document, lines: list[str]):
     """Add text Sanctus in a no-split block, rendering ✠ as a bold cross."""
+    cached_block(doc, "sanctus", lines,
+                 lambda d: _render_sanctus_text(d, lines), variant="text")
+
+
+def _render_sanctus_text(doc: Document, lines: list[str]):
     def _add_sanctus_lines(cell):
         for line in lines:
             if CROSS_SYMBOL in line:
@@ -634,6 +645,7 @@ def _add_qr_code(doc: Document, paragraph):
 
     # Dimensions
     cx = cy = int(0.75 * 914400)      # 0.75" in EMUs = 685,800
+    doc_pr_id = part.next_id          # unique among the document's drawing IDs
     pos_h = int(5.75 * 914400)        # 5.75" from left edge of page
 
     # Namespace declarations needed for the anchor element
@@ -665,7 +677,7 @@ def _add_qr_code(doc: Document, paragraph):
         f'      <wp:lineTo x="0" y="0"/>'
         f'    </wp:wrapPolygon>'
         f'  </wp:wrapTight>'
-        f'  <wp:docPr id="100" name="QR Code"/>'
+        f'  <wp:docPr id="{doc_pr_id}" name="QR Code"/>'
         f'  <wp:cNvGraphicFramePr>'
         f'    <a:graphicFrameLocks noChangeAspect="1"/>'
         f'  </wp:cNvGraphicFramePr>'
@@ -859,6 +871,11 @@ def add_sanctus_spoken(doc: Document, lines: list[str]):
     is bold (spoken in unison by the people). ✠ is rendered via the
     bold cross symbol helper.
     """
+    cached_block(doc, "sanctus", lines,
+                 lambda d: _render_sanctus_spoken(d, lines), variant="spoken")
+
+
+def _render_sanctus_spoken(doc: Document, lines: list[str]):
     def _add_spoken_lines(cell):
         for line in lines:
             p = cell.add_paragraph(style="Body - Lyrics")
@@ -886,6 +903,11 @@ def add_agnus_dei_spoken(doc: Document):
       Lamb of God, you take away the sins of the world: **have mercy on us.**
       Lamb of God, you take away the sins of the world: **grant us peace.**
     """
+    cached_block(doc, "agnus_dei", None, _render_agnus_dei_spoken,
+                 variant="spoken")
+
+
+def _render_agnus_dei_spoken(doc: Document):
     _AGNUS_DEI = [
         ("Lamb of God, you take away the sins of the world: ", "have mercy on us."),
         ("Lamb of God, you take away the sins of the world: ", "have mercy on us."),
@@ -893,3 +915,34 @@ def add_agnus_dei_spoken(doc: Document):
     ]
     for plain, bold in _AGNUS_DEI:
         add_body_with_bold_ending(doc, plain, bold)
+
+
+def _render_agnus_dei_text(doc: Document):
+    """Default Agnus Dei text (9 am Lent with no fraction song planned)."""
+    for line in [
+        "Lamb of God, you take away the sins of the world: have mercy on us.",
+        "Lamb of God, you take away the sins of the world: have mercy on us.",
+        "Lamb of God, you take away the sins of the world: grant us peace.",
+    ]:
+        p = doc.add_paragraph(style="Body - Dialogue")
+        run = p.add_run(line)
+        run.bold = True
+        run.font.name = FONT_BODY_BOLD
+
+
+def add_lords_prayer(doc: Document, prayers: dict):
+    """Add the Lord's Prayer (rubric, invitation, and people's text)."""
+    text = [prayers["lords_prayer_intro"]["option_1"], prayers["lords_prayer"]]
+    cached_block(doc, "lords_prayer", text,
+                 lambda d: _render_lords_prayer(d, prayers))
+
+
+def _render_lords_prayer(doc: Document, prayers: dict):
+    add_spacer(doc)
+    add_rubric(doc, "Please stand and, as you are comfortable, join hands "
+               "with those around you.")
+    add_body(doc, prayers["lords_prayer_intro"]["option_1"])
+    text = " ".join(line.strip() for line in prayers["lords_prayer"])
+    p = doc.add_paragraph(style="Body - People Recitation")
+    run = p.add_run(text)
+    run.style = doc.styles["People"]
@@ -25,6 +25,7 @@ from bulletin.document.formatting import (
     add_introductory_rubric, add_body, add_celebrant_line,
     add_people_line, add_scripture_text,
 )
+from bulletin.document.fragments import cached_block
 from bulletin.document.sections.word_of_god import (
     add_reading, add_psalm, add_song_smart,
     add_body_with_amen, add_nicene_creed, add_pop,
@@ -197,8 +198,9 @@ def add_palm_sunday_word_of_god(doc: Document, rules: SeasonalRules,
     # The Great Litany (replaces Prayers of the People on Palm Sunday)
     add_spacer(doc)
     add_heading2(doc, "The Great Litany")
-    great_litany = load_great_litany()
-    add_pop(doc, great_litany.get("elements", []))
+    litany_elements = load_great_litany().get("elements", [])
+    cached_block(doc, "great_litany", litany_elements,
+                 lambda d: add_pop(d, litany_elements))
 
     # Confession & Absolution (if not done in Penitential Order)
     if not rules.no_confession_after_pop:
@@ -31,6 +31,8 @@ from bulletin.document.formatting import (
     add_hymn_header, add_song, add_song_two_column,
     add_scripture_text, _add_text_runs,
 )
+from bulletin.document.fragments import cached_block
+from bulletin.document.ir import Block, Body, Rubric, Spacer, render_docx
 from bulletin.logic.rules import SeasonalRules
 
 
@@ -270,6 +272,13 @@ def add_penitential_order(doc: Document, rules: SeasonalRules,
 
 def add_confession(doc: Document, prayers: dict):
     """Add the Confession of Sin and Absolution."""
+    text = [prayers["confession_invitation"], prayers["confession"],
+            prayers["absolution"]]
+    cached_block(doc, "confession", text,
+                 lambda d: _render_confession(d, prayers))
+
+
+def _render_confession(doc: Document, prayers: dict):
     add_heading2(doc, "Confession of Sin")
     add_rubric(doc, "The Deacon or a Priest says")
     add_celebrant_line(doc, "", prayers["confession_invitation"])
@@ -464,6 +473,11 @@ def add_gospel(doc: Document, reference: str, book: str, reading,
 
 def add_nicene_creed(doc: Document, prayers: dict):
     """Add the Nicene Creed in the three-article format."""
+    cached_block(doc, "nicene_creed", prayers["nicene_creed"],
+                 lambda d: _render_nicene_creed(d, prayers))
+
+
+def _render_nicene_creed(doc: Document, prayers: dict):
     creed_lines = prayers["nicene_creed"]
     # Group into three articles (separated by blank lines)
     articles = []
@@ -495,28 +509,30 @@ def add_nicene_creed(doc: Document, prayers: dict):
 
 def add_pop(doc: Document, elements: list[dict]):
     """Add Prayers of the People elements."""
+    render_docx(doc, pop_blocks(elements))
+
+
+def pop_blocks(elements: list[dict]) -> list[Block]:
+    """The Prayers of the People elements as IR blocks."""
+    blocks: list[Block] = []
     for i, elem in enumerate(elements):
         etype = elem.get("type", "leader")
         text = elem.get("text", "")
 
         if etype == "leader":
-            add_body(doc, text)
+            blocks.append(Body(text))
             # Spacer after intro line (leader followed by another leader)
             next_type = elements[i + 1].get("type") if i + 1 < len(elements) else None
             if next_type == "leader":
-                add_spacer(doc)
+                blocks.append(Spacer())
         elif etype == "people":
             # Support split leader/people text on the same line
             leader_text = elem.get("leader_text", "")
             people_text = elem.get("people_text", text)
-            p = doc.add_paragraph(style="Body")
-            if leader_text:
-                p.add_run(leader_text + " ")
-            run = p.add_run(people_text)
-            run.bold = True
-            run.font.name = FONT_BODY_BOLD
+            blocks.append(Body(leader_text + " " if leader_text else "",
+                               bold_text=people_text))
         elif etype == "rubric":
-            add_rubric(doc, text)
+            blocks.append(Rubric(text))
         elif etype == "both":
             # Render leader and people on TWO separate paragraphs —
             # used in long antiphonal forms like Form III where each
@@ -527,15 +543,12 @@ def add_pop(doc: Document, elements: list[dict]):
             # use `type: people` with leader_text + people_text
             # instead — the `people` branch above collapses them to
             # a single paragraph.
-            add_body(doc, elem.get("leader_text", ""))
-            p = doc.add_paragraph(style="Body")
-            run = p.add_run(elem.get("people_text", ""))
-            run.bold = True
-            run.font.name = FONT_BODY_BOLD
+            blocks.append(Body(elem.get("leader_text", "")))
+            blocks.append(Body("", bold_text=elem.get("people_text", "")))
 
         # Add spacer between petitions (but not after the last one)
         if etype in ("people", "both") and i + 1 < len(elements):
-            add_spacer(doc)
+            blocks.append(Spacer())
         # Add spacer after a Silence rubric so the next petition is set off
         # (matters for Form II, where Silence is followed directly by the
         # next leader petition with no people response in between).
@@ -543,7 +556,8 @@ def add_pop(doc: Document, elements: list[dict]):
               and "silence" in text.lower()
               and i + 1 < len(elements)
               and elements[i + 1].get("type") != "people"):
-            add_spacer(doc)
+            blocks.append(Spacer())
+    return blocks
 
 
 def _add_advent_wreath(doc: Document, data: dict):
@@ -763,9 +777,7 @@ def _add_gloria_as_song(doc: Document, prayers: dict, sop: dict | None):
     planning sheet is rendered above the block.
     """
     from docx.shared import Inches, Pt
-    from bulletin.document.formatting import (
-        _remove_table_borders, _prevent_row_split, _remove_cell_margins,
-    )
+    from bulletin.document.formatting import lyric_table
 
     gloria = prayers.get("gloria") or {}
     if isinstance(gloria, dict):
@@ -776,11 +788,7 @@ def _add_gloria_as_song(doc: Document, prayers: dict, sop: dict | None):
     if not gloria_sections:
         return
 
-    table = doc.add_table(rows=len(gloria_sections), cols=1)
-    table.autofit = True
-    _remove_table_borders(table)
-    _prevent_row_split(table)
-    _remove_cell_margins(table)
+    rows = lyric_table(doc, rows=len(gloria_sections))
 
     for sec_idx, section in enumerate(gloria_sections):
         if isinstance(section, dict):
@@ -788,9 +796,7 @@ def _add_gloria_as_song(doc: Document, prayers: dict, sop: dict | None):
         else:
             paragraphs = [section]
 
-        cell = table.cell(sec_idx, 0)
-        for p in list(cell.paragraphs):
-            p._element.getparent().remove(p._element)
+        [cell] = rows[sec_idx]
 
         for para_idx, para_data in enumerate(paragraphs):
             if isinstance(para_data, str):
@@ -381,6 +381,12 @@ _HYPERLINK_RELTYPE = (
 )
 
 
+def _rid_sort_key(rId: str) -> tuple:
+    """Order ``rId2`` before ``rId10``."""
+    digits = rId.removeprefix("rId")
+    return (0, int(digits), rId) if digits.isdigit() else (1, 0, rId)
+
+
 def _copy_related_parts(source_doc: Document, target_doc: Document) -> dict:
     """Copy images and hyperlinks from *source_doc* into *target_doc*.
 
@@ -397,7 +403,10 @@ def _copy_related_parts(source_doc: Document, target_doc: Document) -> dict:
     # Collect existing media part names in the target to avoid collisions.
     existing_names = {str(p.partname) for p in tgt_part.package.iter_parts()}
 
-    for rId, rel in list(src_part.rels.items()):
+    # Relate in source rId order so the new rIds (and media names) are
+    # allocated the same way on every build.
+    for rId, rel in sorted(src_part.rels.items(),
+                           key=lambda item: _rid_sort_key(item[0])):
         if rel.reltype == _IMAGE_RELTYPE:
             img = rel.target_part
 
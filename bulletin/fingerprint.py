@@ -0,0 +1,201 @@
+"""
+Input fingerprints for generated bulletins.
+
+Regenerating a date rebuilds and re-saves every .docx even when nothing
+that feeds it has changed. A bulletin is a pure function of:
+
+  - the sheet rows for the date (schedule, clergy, music, Hidden
+    Springs planner rows) and the 9 am / 11 am music slots
+  - the scripture text for each reading
+  - the resolved song entries for each music slot
+  - the resolved liturgical choices (POP form, preface, penitential
+    sentence, Advent wreath verse, blessing, Eucharistic Prayer)
+  - the parish ministries line
+  - the data YAMLs, the cover/back templates, and the generator code
+    itself (plus the package version)
+
+``bulletin_fingerprint()`` hashes each of those into a per-component
+digest and combines them into one fingerprint. After a save, the
+runner writes a small manifest next to the output (in a hidden
+``.manifests/`` folder, so ``output/`` stays readable in Finder); on
+the next run, a bulletin whose output exists and whose fingerprint
+matches the manifest is skipped.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from datetime import date, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Optional
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_REPO_DIR = _PACKAGE_DIR.parent
+_DATA_DIR = _PACKAGE_DIR / "data"
+TEMPLATES_DIR = _REPO_DIR / "templates"
+
+MANIFEST_DIR_NAME = ".manifests"
+
+# Bump when the manifest layout changes so old manifests never match.
+_MANIFEST_FORMAT = 1
+
+
+def package_version() -> str:
+    """Installed version of the generator (``pyproject.toml``)."""
+    try:
+        return version("st-andrews-bulletin")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+# ---------------------------------------------------------------------------
+# Hashing helpers
+# ---------------------------------------------------------------------------
+
+def _json_default(obj):
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    return repr(obj)
+
+
+def digest(obj) -> str:
+    """Stable SHA-256 of any JSON-ish value (dataclasses welcome)."""
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False,
+                         default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# (path, mtime_ns, size) → file digest. Lets a long-running web server
+# re-check the data tree on every run without re-reading unchanged files.
+_file_digests: dict[tuple[str, int, int], str] = {}
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, memoized on its mtime and size."""
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _file_digests.get(key)
+    if cached is None:
+        cached = hashlib.sha256(path.read_bytes()).hexdigest()
+        _file_digests[key] = cached
+    return cached
+
+
+def tree_digest(root: Path, pattern: str, *,
+                exclude_dirs: tuple[str, ...] = ()) -> str:
+    """Combined digest of every file under *root* matching *pattern*."""
+    h = hashlib.sha256()
+    if not root.exists():
+        return h.hexdigest()
+    for path in sorted(root.rglob(pattern)):
+        rel = path.relative_to(root)
+        if any(part in exclude_dirs for part in rel.parts):
+            continue
+        if not path.is_file():
+            continue
+        h.update(str(rel).encode("utf-8"))
+        h.update(file_digest(path).encode("ascii"))
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+def environment_digests() -> dict[str, str]:
+    """Digests of everything that isn't specific to one date."""
+    return {
+        "data": tree_digest(_DATA_DIR, "*.yaml"),
+        "templates": tree_digest(TEMPLATES_DIR, "*"),
+        "code": tree_digest(_PACKAGE_DIR, "*.py",
+                            exclude_dirs=("tests", "__pycache__")),
+        "version": package_version(),
+    }
+
+
+def bulletin_fingerprint(builder, *, output_name: str,
+                         save_options: Optional[dict] = None) -> dict[str, str]:
+    """Per-component input digests for one resolved ``BulletinBuilder``.
+
+    Call after ``builder.resolve_all()`` and before ``builder.build()``.
+    *save_options* are the post-build passes that change the saved
+    bytes (e.g. run coalescing). The combined fingerprint is under the
+    ``"fingerprint"`` key.
+    """
+    slots = builder.get_music_slots()
+    songs = []
+    if builder.service_time != "8 am":
+        for slot in slots:
+            if slot.song_title:
+                songs.append((slot.service_part, slot.song_title,
+                              builder.song_lookup(slot.song_title,
+                                                  builder.service_time)))
+
+    components = {
+        "output": digest([output_name, save_options or {}]),
+        "service": digest([builder.service_time,
+                           builder.target_date.isoformat(),
+                           builder.is_sunrise]),
+        "sheet": digest([builder.schedule, builder.clergy,
+                         builder.sheet.music,
+                         builder.hidden_springs_data]),
+        "music": digest(slots),
+        "scripture": digest(builder.scripture),
+        "songs": digest(songs),
+        "resolutions": digest([builder.get_shared_resolutions(),
+                               builder.eucharistic_prayer,
+                               builder.blessing_text]),
+        "ministries": digest(builder.parish_ministries),
+    }
+    components.update(environment_digests())
+    components["fingerprint"] = digest(
+        [_MANIFEST_FORMAT, sorted(components.items())])
+    return components
+
+
+# ---------------------------------------------------------------------------
+# Sidecar manifests
+# ---------------------------------------------------------------------------
+
+def manifest_path(output_path: Path) -> Path:
+    """Where the manifest for *output_path* lives."""
+    return output_path.parent / MANIFEST_DIR_NAME / f"{output_path.name}.json"
+
+
+def read_manifest(output_path: Path) -> Optional[dict]:
+    path = manifest_path(output_path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def write_manifest(output_path: Path, manifest: dict):
+    path = manifest_path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True,
+                  default=_json_default)
+
+
+def up_to_date_manifest(output_path: Path, fingerprint: str) -> Optional[dict]:
+    """Return the existing manifest if *output_path* was built from
+    exactly these inputs, else None."""
+    if not output_path.exists():
+        return None
+    manifest = read_manifest(output_path)
+    if manifest and manifest.get("fingerprint") == fingerprint:
+        return manifest
+    return None
@@ -0,0 +1,331 @@
+"""
+Precomputed liturgical calendar for the Episcopal church year.
+
+Everything in ``bulletin.logic.rules`` is derived from the title string
+on the Google Sheet. That is still the source of truth for a given
+service (the planners occasionally rename a Sunday — "All Saints'
+Sunday", "Celebration Sunday", …), but most of what the generator needs
+to know about a date is a pure function of the date itself:
+
+  - the liturgical season
+  - the Proper number (BCP pp. 176-185) for Sundays after Pentecost
+  - the lectionary year letter (A/B/C), including the Advent rollover
+    that ``config.get_lectionary_year`` deliberately ignores
+  - the collect key in collects.yaml
+  - the proper preface key (BCP pp. 377-382)
+  - the special-service flags (Palm Sunday, Maundy Thursday, Good Friday)
+
+This module computes all of that once per church year — Advent 1
+through the Saturday before the next Advent 1 — into a table keyed by
+date. Lookups are a dict access; a batch run across several years pays
+for each year's table exactly once.
+
+Church years are labelled by the calendar year in which they END (the
+year containing Easter), so church year 2026 runs from Advent 1 on
+November 30, 2025 to November 28, 2026 and uses lectionary year A.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Optional
+
+from bulletin.config import LECTIONARY_YEAR_MAP
+from bulletin.logic.rules import (
+    _ORDINAL_MAP,
+    _get_proper_preface_key,
+    _is_holy_week,
+    detect_special_service,
+)
+
+
+# Number → ordinal word ("3" → "Third"), the inverse of rules._ORDINAL_MAP.
+_ORDINAL_WORDS: dict[int, str] = {
+    int(num): word.title()
+    for word, num in _ORDINAL_MAP.items()
+    if num.isdigit()
+}
+
+
+@dataclass(frozen=True)
+class CalendarDay:
+    """Everything the calendar knows about one date.
+
+    Sundays and principal feasts/fasts carry their BCP ``title``; other
+    weekdays inherit the season, Proper, and collect of the Sunday (or
+    feast) that governs their week and have an empty title.
+    """
+    date: date
+    title: str                      # e.g. "Third Sunday in Lent" ("" on ferias)
+    season: str                     # same vocabulary as rules._detect_season
+    lectionary_year: str            # "A", "B", or "C"
+    church_year: int                # calendar year the church year ends in
+    proper: Optional[int] = None    # Proper number after Pentecost
+    collect_key: Optional[str] = None   # key in collects.yaml
+    preface_key: str = ""           # key in proper_prefaces.yaml
+    special_service: Optional[str] = None  # "palm_sunday" | "maundy_thursday" | "good_friday"
+    is_holy_week: bool = False
+
+    @property
+    def is_sunday(self) -> bool:
+        return self.date.weekday() == 6
+
+
+@dataclass(frozen=True)
+class ChurchYear:
+    """One church year's worth of :class:`CalendarDay` entries."""
+    year: int                       # calendar year the church year ends in
+    lectionary_year: str
+    start: date                     # First Sunday of Advent
+    end: date                       # Saturday before the next Advent 1
+    easter: date
+    days: dict[date, CalendarDay] = field(default_factory=dict, compare=False)
+
+    def __contains__(self, d: date) -> bool:
+        return self.start <= d <= self.end
+
+    def get(self, d: date) -> Optional[CalendarDay]:
+        return self.days.get(d)
+
+    def sundays(self) -> list[CalendarDay]:
+        """Every Sunday in the church year, in date order."""
+        return [day for day in self.days.values() if day.is_sunday]
+
+
+# ---------------------------------------------------------------------------
+# Date arithmetic
+# ---------------------------------------------------------------------------
+
+def easter_date(year: int) -> date:
+    """Western (Gregorian) Easter Day for *year* — anonymous computus."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def advent_sunday(year: int) -> date:
+    """First Sunday of Advent in calendar *year* (Nov 27 – Dec 3)."""
+    christmas = date(year, 12, 25)
+    # Fourth Sunday of Advent is the last Sunday strictly before Christmas.
+    advent_4 = christmas - timedelta(days=christmas.isoweekday() % 7 or 7)
+    return advent_4 - timedelta(weeks=3)
+
+
+def church_year_of(d: date) -> int:
+    """Return the church-year label (see module docstring) containing *d*."""
+    return d.year + 1 if d >= advent_sunday(d.year) else d.year
+
+
+def lectionary_year(d: date) -> str:
+    """Lectionary year letter for *d*, honoring the Advent rollover.
+
+    Unlike ``config.get_lectionary_year`` (which only sees the calendar
+    year), Advent and Christmas Sundays in late November/December
+    correctly return NEXT year's letter.
+    """
+    return LECTIONARY_YEAR_MAP[church_year_of(d) % 3]
+
+
+def _sunday_on_or_after(d: date) -> date:
+    return d + timedelta(days=(6 - d.weekday()) % 7)
+
+
+def _ordinal(n: int) -> str:
+    return _ORDINAL_WORDS.get(n, f"{n}th")
+
+
+# ---------------------------------------------------------------------------
+# Table construction
+# ---------------------------------------------------------------------------
+
+def _named_days(year: int) -> dict[date, tuple[str, str, Optional[str], Optional[int]]]:
+    """Sundays and principal days of church year *year*.
+
+    Returns ``{date: (title, season, collect_key, proper)}``.
+    """
+    from bulletin.sources.collects import proper_from_date
+
+    start = advent_sunday(year - 1)
+    end_exclusive = advent_sunday(year)
+    easter = easter_date(year)
+    ash_wednesday = easter - timedelta(days=46)
+    pentecost = easter + timedelta(days=49)
+    trinity = pentecost + timedelta(days=7)
+    christmas = date(year - 1, 12, 25)
+    holy_name = date(year, 1, 1)
+    epiphany = date(year, 1, 6)
+
+    named: dict[date, tuple[str, str, Optional[str], Optional[int]]] = {}
+
+    # Advent
+    for n in range(1, 5):
+        d = start + timedelta(weeks=n - 1)
+        title = f"{_ordinal(n)} Sunday of Advent"
+        named[d] = (title, "advent", title, None)
+
+    # Christmas
+    named[christmas] = ("Christmas Day", "christmas", "Christmas I", None)
+    first_after_christmas = _sunday_on_or_after(christmas + timedelta(days=1))
+    if first_after_christmas < holy_name:
+        named[first_after_christmas] = (
+            "First Sunday after Christmas", "christmas",
+            "First Sunday after Christmas", None)
+    second_after_christmas = _sunday_on_or_after(holy_name + timedelta(days=1))
+    if second_after_christmas < epiphany:
+        named[second_after_christmas] = (
+            "Second Sunday after Christmas", "christmas",
+            "The Second Sunday of Christmas", None)
+    named[holy_name] = ("The Holy Name", "christmas", "The Holy Name", None)
+
+    # Epiphany
+    named[epiphany] = ("The Epiphany", "epiphany", "The Epiphany", None)
+    last_epiphany = ash_wednesday - timedelta(days=3)
+    d = _sunday_on_or_after(epiphany + timedelta(days=1))
+    n = 1
+    while d < last_epiphany:
+        title = f"{_ordinal(n)} Sunday after the Epiphany"
+        if n == 1:
+            key = "First Sunday after the Epiphany / The Baptism of Our Lord"
+        elif n <= 5:
+            key = title
+        else:
+            key = None  # 6th-8th Sundays (Propers 1-3) aren't in collects.yaml
+        named[d] = (title, "epiphany", key, None)
+        d += timedelta(weeks=1)
+        n += 1
+    named[last_epiphany] = ("Last Sunday after the Epiphany", "epiphany",
+                            "Last Sunday after the Epiphany", None)
+
+    # Lent and Holy Week
+    named[ash_wednesday] = ("Ash Wednesday", "lent", "Ash Wednesday", None)
+    for n in range(1, 6):
+        d = ash_wednesday + timedelta(days=4) + timedelta(weeks=n - 1)
+        title = f"{_ordinal(n)} Sunday in Lent"
+        named[d] = (title, "lent", title, None)
+    palm_sunday = easter - timedelta(weeks=1)
+    named[palm_sunday] = ("Sunday of the Passion: Palm Sunday", "lent",
+                          "Sunday of the Passion: Palm Sunday", None)
+    for offset, title in enumerate(
+            ("Monday in Holy Week", "Tuesday in Holy Week",
+             "Wednesday in Holy Week", "Maundy Thursday", "Good Friday",
+             "Holy Saturday"), start=1):
+        named[palm_sunday + timedelta(days=offset)] = (title, "lent", title, None)
+
+    # Easter
+    named[easter] = ("Easter Day", "easter", "Easter Day - Principal Service", None)
+    for offset, weekday in enumerate(
+            ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday",
+             "Saturday"), start=1):
+        title = f"{weekday} in Easter Week"
+        named[easter + timedelta(days=offset)] = (title, "easter", title, None)
+    for n in range(2, 8):
+        title = f"{_ordinal(n)} Sunday of Easter"
+        named[easter + timedelta(weeks=n - 1)] = (title, "easter", title, None)
+    named[easter + timedelta(days=39)] = ("Ascension Day", "easter",
+                                          "Ascension Day", None)
+    named[pentecost] = ("Day of Pentecost", "pentecost_day",
+                        "Day of Pentecost / Whitsunday", None)
+
+    # The season after Pentecost
+    named[trinity] = ("Trinity Sunday", "ordinary",
+                      "First Sunday after Pentecost / Trinity Sunday", None)
+    christ_the_king = end_exclusive - timedelta(weeks=1)
+    d = trinity + timedelta(weeks=1)
+    n = 2
+    while d < christ_the_king:
+        proper = proper_from_date(d)
+        named[d] = (f"{_ordinal(n)} Sunday after Pentecost", "ordinary",
+                    f"Proper {proper}", proper)
+        d += timedelta(weeks=1)
+        n += 1
+    named[christ_the_king] = ("Last Sunday after Pentecost: Christ the King",
+                              "ordinary", "Christ the King", 29)
+
+    return named
+
+
+def _build_church_year(year: int) -> ChurchYear:
+    start = advent_sunday(year - 1)
+    end = advent_sunday(year) - timedelta(days=1)
+    letter = LECTIONARY_YEAR_MAP[year % 3]
+    named = _named_days(year)
+
+    days: dict[date, CalendarDay] = {}
+    # Ferias inherit from the most recent Sunday, or from a weekday feast
+    # that opens a new season (Christmas Day, the Epiphany, Ash
+    # Wednesday). Feasts inside a season — Ascension Day, the Holy
+    # Name — don't displace their Sunday's collect for the rest of the
+    # week.
+    governing: Optional[tuple] = None
+    d = start
+    while d <= end:
+        entry = named.get(d)
+        if entry is not None:
+            title, season, collect_key, proper = entry
+            if (d.weekday() == 6 or governing is None
+                    or season != governing[1]):
+                governing = entry
+            preface_key, _, _ = _get_proper_preface_key(title, season)
+            days[d] = CalendarDay(
+                date=d,
+                title=title,
+                season=season,
+                lectionary_year=letter,
+                church_year=year,
+                proper=proper,
+                collect_key=collect_key,
+                preface_key=preface_key,
+                special_service=detect_special_service(title),
+                is_holy_week=_is_holy_week(title),
+            )
+        else:
+            g_title, season, collect_key, proper = governing
+            if season == "pentecost_day":
+                season = "ordinary"  # the week after Pentecost
+            preface_key, _, _ = _get_proper_preface_key("", season)
+            days[d] = CalendarDay(
+                date=d,
+                title="",
+                season=season,
+                lectionary_year=letter,
+                church_year=year,
+                proper=proper,
+                collect_key=collect_key,
+                preface_key=preface_key,
+                is_holy_week=_is_holy_week(g_title),
+            )
+        d += timedelta(days=1)
+
+    return ChurchYear(
+        year=year,
+        lectionary_year=letter,
+        start=start,
+        end=end,
+        easter=easter_date(year),
+        days=days,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def church_year(year: int) -> ChurchYear:
+    """Return the (cached) calendar table for church year *year*."""
+    return _build_church_year(year)
+
+
+def lookup(d: date) -> CalendarDay:
+    """Return the :class:`CalendarDay` for any date."""
+    return church_year(church_year_of(d)).days[d]
@@ -17,14 +17,20 @@ fields in the Google Sheet.
 """
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class SeasonalRules:
-    """All seasonal rules for a given service."""
+    """All seasonal rules for a given service.
+
+    Frozen (and therefore hashable) because ``get_seasonal_rules`` hands
+    the same memoized instance to every builder that asks with the same
+    inputs — the three Sunday services share one object.
+    """
 
     # Structure
     use_penitential_order: bool     # Lent: Penitential Order replaces Word of God opening
@@ -64,7 +70,7 @@ class SeasonalRules:
     # proper_preface_key: YAML key in proper_prefaces.yaml (e.g., "advent", "easter")
     # When "lords_day" or "lent", there are multiple options; prompt_preface is True.
     proper_preface_key: str = ""
-    proper_preface_options: list[str] = field(default_factory=list)
+    proper_preface_options: tuple[str, ...] = ()
     prompt_preface: bool = False    # True when user must choose among options
 
 
@@ -141,6 +147,7 @@ def get_dismissal_text(dismissal_num: str, has_alleluia: bool) -> tuple[str, str
 # Season detection
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=512)
 def _detect_season(title: str, color: str, notes: str) -> str:
     """Detect the liturgical season from the title, color, and notes."""
     title_lower = title.lower()
@@ -214,6 +221,7 @@ def _pop_has_confession(pop_form: str, notes: str) -> bool:
 # Proper Preface selection (BCP pp.377-382)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=512)
 def detect_special_service(title: str) -> str | None:
     """Detect if this is a special service requiring its own liturgical flow.
 
@@ -248,40 +256,44 @@ def _is_trinity_sunday(title: str) -> bool:
     return "trinity" in title.lower()
 
 
-def _get_proper_preface_key(title: str, season: str) -> tuple[str, list[str], bool]:
-    """Determine the proper preface key, options list, and whether to prompt.
+@lru_cache(maxsize=512)
+def _get_proper_preface_key(title: str, season: str) -> tuple[str, tuple[str, ...], bool]:
+    """Determine the proper preface key, options tuple, and whether to prompt.
 
     Returns:
         (key, options, prompt) where:
           - key: YAML key in proper_prefaces.yaml
-          - options: list of sub-keys when multiple choices exist
+          - options: sub-keys when multiple choices exist
           - prompt: True if the user should be prompted to choose
+
+    Memoized, so the options are a tuple rather than a list — callers
+    must not be able to mutate the cached value.
     """
     # Special occasions override the season
     if _is_trinity_sunday(title):
-        return ("trinity", [], False)
+        return ("trinity", (), False)
     if _is_ascension(title):
-        return ("ascension", [], False)
+        return ("ascension", (), False)
     if _is_holy_week(title):
-        return ("holy_week", [], False)
+        return ("holy_week", (), False)
 
     # Season-based prefaces
     if season == "advent":
-        return ("advent", [], False)
+        return ("advent", (), False)
     if season == "christmas":
-        return ("incarnation", [], False)
+        return ("incarnation", (), False)
     if season == "epiphany":
-        return ("epiphany", [], False)
+        return ("epiphany", (), False)
     if season == "lent":
-        return ("lent", ["option_1", "option_2"], True)
+        return ("lent", ("option_1", "option_2"), True)
     if season == "easter":
-        return ("easter", [], False)
+        return ("easter", (), False)
     if season == "pentecost_day":
-        return ("pentecost", [], False)
+        return ("pentecost", (), False)
 
     # Ordinary Time Sundays -> Lord's Day preface (3 options)
-    return ("lords_day", ["of_god_the_father", "of_god_the_son",
-                          "of_god_the_holy_spirit"], True)
+    return ("lords_day", ("of_god_the_father", "of_god_the_son",
+                          "of_god_the_holy_spirit"), True)
 
 
 # ---------------------------------------------------------------------------
@@ -297,7 +309,34 @@ def get_seasonal_rules(title: str, color: str, notes: str,
         color: Liturgical color (e.g., "Violet", "White", "Green")
         notes: Notes from the Google Sheet
         pop_form: Prayers of the People form designation (e.g., "I", "VI (w/ confession)")
+
+    Every rule below is a case-insensitive keyword test, so the inputs
+    are case-folded and stripped before hitting the memo cache; callers
+    passing the same sheet row get the same ``SeasonalRules`` object.
+    See ``seasonal_rules_cache_info()`` for hit counters.
     """
+    return _compute_seasonal_rules(
+        title.strip().lower(),
+        color.strip().lower(),
+        notes.strip().lower(),
+        pop_form.strip().lower(),
+    )
+
+
+def seasonal_rules_cache_info():
+    """Hit/miss counters for the ``get_seasonal_rules`` memo cache."""
+    return _compute_seasonal_rules.cache_info()
+
+
+def clear_seasonal_rules_cache() -> None:
+    """Drop every memoized ``SeasonalRules`` (mainly for tests)."""
+    _compute_seasonal_rules.cache_clear()
+
+
+@lru_cache(maxsize=128)
+def _compute_seasonal_rules(title: str, color: str, notes: str,
+                            pop_form: str) -> SeasonalRules:
+    """Uncached body of ``get_seasonal_rules`` (inputs already normalized)."""
     season = _detect_season(title, color, notes)
     is_lent = _is_lent(season)
     is_easter = _is_in_easter_season(season)
@@ -410,6 +449,9 @@ _ORDINAL_MAP = {
     "last": "Last",
 }
 
+# Longest words first so "twenty-first" matches before "first".
+_ORDINALS_LONGEST_FIRST = sorted(_ORDINAL_MAP.items(), key=lambda x: -len(x[0]))
+
 # Season keywords to match in the title (order matters — check longer first)
 _SEASON_KEYWORDS = [
     "after Pentecost",
@@ -454,6 +496,7 @@ _SPECIAL_DAYS = [
 ]
 
 
+@lru_cache(maxsize=512)
 def get_short_liturgical_title(title: str, proper: str = "") -> str:
     """Convert a full liturgical title to a short form for filenames.
 
@@ -506,7 +549,7 @@ def get_short_liturgical_title(title: str, proper: str = "") -> str:
 def _extract_ordinal(title_lower: str) -> str:
     """Extract an ordinal number from a lowercased title string."""
     # Check word ordinals (longest first to match "twenty-first" before "first")
-    for word, num in sorted(_ORDINAL_MAP.items(), key=lambda x: -len(x[0])):
+    for word, num in _ORDINALS_LONGEST_FIRST:
         if word in title_lower:
             return num
 
@@ -47,6 +47,9 @@ class TodoItem:
     message: str
     fix_hint: Optional[str] = None
     link: Optional[str] = None  # e.g. "/songs/new?title=…"
+    # Ranked "did you mean" candidates, as plain dicts so this module
+    # stays import-free (see ``bulletin.sources.song_index``).
+    suggestions: list[dict] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -91,6 +94,7 @@ class RunReport:
         message: str,
         fix_hint: Optional[str] = None,
         link: Optional[str] = None,
+        suggestions: Optional[list[dict]] = None,
     ) -> None:
         """Record a new item. Keyword-only to make call sites self-documenting."""
         self.items.append(TodoItem(
@@ -99,6 +103,7 @@ class RunReport:
             message=message,
             fix_hint=fix_hint,
             link=link,
+            suggestions=suggestions or [],
         ))
 
     # Convenience shorthands — most sources will want these instead of
@@ -112,9 +117,10 @@ class RunReport:
 
     def warning(self, category: str, message: str,
                 fix_hint: Optional[str] = None,
-                link: Optional[str] = None) -> None:
+                link: Optional[str] = None,
+                suggestions: Optional[list[dict]] = None) -> None:
         self.add(severity="warning", category=category, message=message,
-                 fix_hint=fix_hint, link=link)
+                 fix_hint=fix_hint, link=link, suggestions=suggestions)
 
     def manual(self, category: str, message: str,
                fix_hint: Optional[str] = None,
@@ -176,3 +182,6 @@ class RunReport:
                 print(f"     • {item.message}")
                 if item.fix_hint:
                     print(f"         → {item.fix_hint}")
+                if item.suggestions:
+                    names = ", ".join(f"\"{s['title']}\"" for s in item.suggestions)
+                    print(f"         ? did you mean {names}")
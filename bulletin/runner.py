@@ -24,18 +24,31 @@ should be byte-identical to before.
 
 from __future__ import annotations
 
+import re
 import sys
-from dataclasses import dataclass, field
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from typing import Callable, Optional
 
-from bulletin.config import SERVICE_TIMES, get_lectionary_year
+from bulletin.config import SERVICE_TIMES
+from bulletin.dependencies import collect_dependencies, rebuild_index
+from bulletin.fingerprint import (
+    bulletin_fingerprint,
+    up_to_date_manifest,
+    write_manifest,
+)
+from bulletin.logic.church_calendar import lectionary_year
 from bulletin.logic.rules import detect_special_service, get_short_liturgical_title
 from bulletin.report import RunReport
 from bulletin.sources.google_sheet import (
     BulletinData,
+    HiddenSpringsPlanner,
     LiturgicalScheduleRow,
+    SheetSnapshot,
+    fetch_hidden_springs_planner,
+    fetch_sheet_snapshot,
     get_bulletin_data,
     get_hidden_springs_data,
 )
@@ -44,11 +57,17 @@ from bulletin.sources.music_11am import get_11am_music_slots
 from bulletin.sources.parish_prayers import (
     format_ministries,
     get_ministries_for_date,
+    get_rotation,
 )
+from bulletin.sources.psalms import get_psalm
 from bulletin.sources.scripture import fetch_readings
+from bulletin.sources.scripture_refs import alternatives
 from bulletin.sources.songs import lookup_song
+from bulletin.sources.versification import reference_problems
 from bulletin.document.builder import BulletinBuilder
 from bulletin.document.reading_sheet import build_reading_sheet
+from bulletin.document.coalesce import coalesce_runs
+from bulletin.document.deterministic import save_deterministic
 from bulletin.document.styles import prune_unused_styles
 
 
@@ -61,10 +80,23 @@ class RunOptions:
     """All knobs that ``generate.py`` exposes via argparse."""
     target_date: date
     service: str = "all"            # "all" | "8 am" | "9 am" | "11 am" | "7 pm" | "sunrise" | "hidden_springs"
+    services: Optional[list[str]] = None    # with "all": just these times
     output_dir: Path = field(default_factory=lambda: Path("output"))
     output_path: Optional[Path] = None  # only honored with single service
     reading_sheets: bool = False
     force_fetch: bool = False
+    rebuild: bool = False           # ignore the output fingerprint cache
+    coalesce_runs: bool = False     # merge same-format runs before saving
+    deterministic: bool = False     # byte-reproducible .docx (fixed stamps/order)
+
+
+@dataclass
+class FuneralRunOptions:
+    """Inputs for ``run_funeral_generation`` (``generate.py --funeral``)."""
+    service: str                    # slug ("2026-01-31-cox") or YAML path
+    output_dir: Path = field(default_factory=lambda: Path("output"))
+    output_path: Optional[Path] = None
+    force_fetch: bool = False
 
 
 @dataclass
@@ -73,6 +105,8 @@ class GeneratedBulletin:
     service_time: str
     output_path: Path
     aac_manifest: list[tuple[str, str]]  # [(slot_name, aac_filename), …]
+    fingerprint: str = ""           # input fingerprint (bulletin/fingerprint.py)
+    skipped: bool = False           # True when inputs were unchanged
 
 
 @dataclass
@@ -94,29 +128,63 @@ class RunAborted(Exception):
 
 
 # ---------------------------------------------------------------------------
-# Entry point
+# Fetching
 # ---------------------------------------------------------------------------
 
-def run_generation(
+@dataclass
+class RunInputs:
+    """Everything fetched for one date before any bulletin is built."""
+    target_date: date
+    sheet_data: BulletinData
+    schedule: LiturgicalScheduleRow
+    special: Optional[str]
+    services: list[str]
+    hs_data: Optional[tuple]
+    scripture_readings: dict
+    parish_ministries: str
+    music_9am: object = None
+    music_11am_slots: Optional[list] = None
+
+    def music_for(self, service_time: str):
+        if service_time in ("sunrise", "11 am", "7 pm"):
+            return self.music_11am_slots
+        if service_time == "9 am":
+            return self.music_9am
+        return None
+
+    def new_builder(self, service_time: str,
+                    report: Optional[RunReport] = None) -> BulletinBuilder:
+        return BulletinBuilder(
+            target_date=self.target_date,
+            sheet_data=self.sheet_data,
+            music_data=self.music_for(service_time),
+            scripture_readings=self.scripture_readings,
+            song_lookup_fn=_song_lookup,
+            parish_ministries=self.parish_ministries,
+            service_time=service_time,
+            hidden_springs_data=(self.hs_data if service_time == "hidden_springs"
+                                 else None),
+            report=report,
+        )
+
+
+def _song_lookup(identifier: str, service: str):
+    return lookup_song(identifier, service)
+
+
+def gather_inputs(
     options: RunOptions,
     *,
-    prompt_fn: Optional[Callable] = None,
-    progress_fn: Optional[Callable[[str], None]] = None,
-    report: Optional[RunReport] = None,
-) -> RunResult:
-    """Run the full bulletin pipeline and return a structured result.
+    progress_fn: Callable[[str], None],
+    report: RunReport,
+    snapshot: Optional[SheetSnapshot] = None,
+    hs_planner: Optional[HiddenSpringsPlanner] = None,
+) -> RunInputs:
+    """Steps 1–4 of a run: sheet rows, scripture, ministries, music.
 
-    Mirrors the logic that used to live in ``generate.py``'s ``main()``.
-    Side effects (writing .docx files, printing progress) are preserved
-    so CLI behavior is unchanged when called with the defaults
-    (``progress_fn=print``).
+    Raises ``RunAborted`` when the date isn't on the sheet. *snapshot*
+    and *hs_planner* let many dates share one download of the sheets.
     """
-    if progress_fn is None:
-        progress_fn = print
-
-    if report is None:
-        report = RunReport()
-
     target_date = options.target_date
     is_hidden_springs = options.service == "hidden_springs"
     is_sunrise = options.service == "sunrise"
@@ -126,7 +194,8 @@ def run_generation(
     if is_hidden_springs:
         progress_fn("  Fetching Hidden Springs planner data...")
         try:
-            hs_row, hs_upcoming = get_hidden_springs_data(target_date)
+            hs_row, hs_upcoming = get_hidden_springs_data(
+                target_date, planner=hs_planner)
         except ValueError as e:
             raise RunAborted(str(e)) from e
         hs_data = (hs_row, hs_upcoming)
@@ -159,7 +228,8 @@ def run_generation(
         try:
             svc_filter = "sunrise" if is_sunrise else None
             sheet_data = get_bulletin_data(
-                target_date, service_type_filter=svc_filter)
+                target_date, service_type_filter=svc_filter,
+                snapshot=snapshot)
         except ValueError as e:
             raise RunAborted(str(e)) from e
         schedule = sheet_data.schedule
@@ -176,6 +246,8 @@ def run_generation(
             services = ["sunrise"]
         elif options.service != "all":
             services = [options.service]
+        elif options.services:
+            services = list(options.services)
         elif is_weekday_special:
             services = ["7 pm"]
             progress_fn(
@@ -202,9 +274,7 @@ def run_generation(
         from bulletin.data.loader import load_palm_sunday
         palm_texts = load_palm_sunday()
         liturgy = palm_texts["liturgy_of_the_palms"]
-        year_num = target_date.year
-        remainder = year_num % 3
-        lect_year = "A" if remainder == 1 else ("B" if remainder == 2 else "C")
+        lect_year = lectionary_year(target_date)
         palm_gospel_ref = liturgy["palm_gospel"].get(lect_year, "Matthew 21:1-11")
         refs_to_fetch["palm_gospel"] = palm_gospel_ref
 
@@ -225,7 +295,8 @@ def run_generation(
     # ---- Step 3: Parish ministries ----
     progress_fn("  Looking up parish cycle of prayers...")
     try:
-        ministries = get_ministries_for_date(target_date)
+        ministries = get_ministries_for_date(
+            target_date, force_fetch=options.force_fetch)
         parish_ministries = format_ministries(ministries)
         progress_fn(f"  Ministries: {parish_ministries}")
     except Exception as e:
@@ -243,7 +314,8 @@ def run_generation(
     if "9 am" in services:
         progress_fn("  Fetching 9am music planning data...")
         try:
-            music_9am = fetch_9am_music(target_date)
+            music_9am = fetch_9am_music(
+                target_date, force_fetch=options.force_fetch)
             if music_9am:
                 progress_fn(f"  Found {len(music_9am.slots)} music slots")
             else:
@@ -279,8 +351,57 @@ def run_generation(
                 fix_hint="Check the Service Music tab — the row for this "
                          "date may be missing.")
 
-    def song_lookup_fn(identifier: str, service: str):
-        return lookup_song(identifier, service)
+    return RunInputs(
+        target_date=target_date,
+        sheet_data=sheet_data,
+        schedule=schedule,
+        special=special,
+        services=services,
+        hs_data=hs_data,
+        scripture_readings=scripture_readings,
+        parish_ministries=parish_ministries,
+        music_9am=music_9am,
+        music_11am_slots=music_11am_slots,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def run_generation(
+    options: RunOptions,
+    *,
+    prompt_fn: Optional[Callable] = None,
+    progress_fn: Optional[Callable[[str], None]] = None,
+    report: Optional[RunReport] = None,
+    hs_planner: Optional[HiddenSpringsPlanner] = None,
+    update_index: bool = True,
+) -> RunResult:
+    """Run the full bulletin pipeline and return a structured result.
+
+    Mirrors the logic that used to live in ``generate.py``'s ``main()``.
+    Side effects (writing .docx files, printing progress) are preserved
+    so CLI behavior is unchanged when called with the defaults
+    (``progress_fn=print``).
+
+    *hs_planner* is a Hidden Springs Planner already downloaded;
+    *update_index* False leaves ``output/index.json`` for the caller to
+    rebuild once after a batch.
+    """
+    if progress_fn is None:
+        progress_fn = print
+
+    if report is None:
+        report = RunReport()
+
+    inputs = gather_inputs(options, progress_fn=progress_fn, report=report,
+                           hs_planner=hs_planner)
+    target_date = inputs.target_date
+    is_hidden_springs = options.service == "hidden_springs"
+    schedule = inputs.schedule
+    services = inputs.services
+    hs_data = inputs.hs_data
 
     # ---- Step 5: Build each bulletin ----
     output_dir = options.output_dir
@@ -292,36 +413,13 @@ def run_generation(
     for service_time in services:
         progress_fn(f"\n  === Assembling {service_time} bulletin ===")
 
-        if service_time == "hidden_springs":
-            music_data = None
-        elif service_time == "sunrise":
-            music_data = music_11am_slots
-        elif service_time == "9 am":
-            music_data = music_9am
-        elif service_time in ("11 am", "7 pm"):
-            music_data = music_11am_slots
-        else:
-            music_data = None
-
-        builder = BulletinBuilder(
-            target_date=target_date,
-            sheet_data=sheet_data,
-            music_data=music_data,
-            scripture_readings=scripture_readings,
-            song_lookup_fn=song_lookup_fn,
-            parish_ministries=parish_ministries,
-            service_time=service_time,
-            hidden_springs_data=hs_data if service_time == "hidden_springs" else None,
-            report=report,
-        )
+        builder = inputs.new_builder(service_time, report)
 
         builder.resolve_all(prompt_fn=prompt_fn,
                             shared_resolutions=shared_resolutions)
         if shared_resolutions is None:
             shared_resolutions = builder.get_shared_resolutions()
 
-        doc = builder.build()
-
         # Filename
         if options.output_path and len(services) == 1:
             output_path = options.output_path
@@ -334,7 +432,7 @@ def run_generation(
         else:
             date_str = target_date.strftime("%Y-%m-%d")
             short_title = get_short_liturgical_title(schedule.title, schedule.proper)
-            year_letter = get_lectionary_year(target_date.year)
+            year_letter = lectionary_year(target_date)
             ep_letter = builder.eucharistic_prayer
             file_svc = service_time
 
@@ -344,10 +442,37 @@ def run_generation(
                 # Maundy Thursday and standard Sunday services
                 output_path = output_dir / f"{date_str} - {short_title}{year_letter} - {file_svc} (HEII-{ep_letter}) - Bulletin.docx"
 
+        # Skip the build when nothing feeding this bulletin has changed
+        # since the last save (see bulletin/fingerprint.py).
+        fp_inputs = bulletin_fingerprint(
+            builder, output_name=output_path.name,
+            save_options={"coalesce_runs": options.coalesce_runs,
+                          "deterministic": options.deterministic})
+        fingerprint = fp_inputs["fingerprint"]
+        previous = (None if options.rebuild
+                    else up_to_date_manifest(output_path, fingerprint))
+        if previous is not None:
+            progress_fn(f"  Unchanged since last build, skipped: {output_path}")
+            aac_manifest = [tuple(e) for e in previous.get("aac_manifest", [])]
+            _print_aac_manifest(aac_manifest, progress_fn)
+            bulletins.append(GeneratedBulletin(
+                service_time=service_time,
+                output_path=output_path,
+                aac_manifest=aac_manifest,
+                fingerprint=fingerprint,
+                skipped=True,
+            ))
+            continue
+
+        doc = builder.build()
+
         if output_path.exists():
             output_path.unlink()
         prune_unused_styles(doc)
-        doc.save(str(output_path))
+        if options.coalesce_runs:
+            stats = coalesce_runs(doc)
+            progress_fn(f"  Coalesced runs: {stats.summary()}")
+        _save(doc, output_path, options)
         progress_fn(f"  Saved: {output_path}")
 
         if builder._missing_songs:
@@ -356,18 +481,27 @@ def run_generation(
                 progress_fn(f"    - {s}")
 
         aac_manifest = builder.get_aac_manifest()
-        if aac_manifest:
-            progress_fn(f"\n  === AAC Files for Upload ===")
-            max_slot = max(len(slot) for slot, _ in aac_manifest)
-            for slot, filename in aac_manifest:
-                progress_fn(f"  {slot + ':':<{max_slot + 1}} {filename}")
+        _print_aac_manifest(aac_manifest, progress_fn)
+
+        write_manifest(output_path, {
+            "fingerprint": fingerprint,
+            "inputs": fp_inputs,
+            "target_date": target_date.isoformat(),
+            "service": service_time,
+            "dependencies": collect_dependencies(builder),
+            "aac_manifest": list(aac_manifest),
+        })
 
         bulletins.append(GeneratedBulletin(
             service_time=service_time,
             output_path=output_path,
             aac_manifest=list(aac_manifest),
+            fingerprint=fingerprint,
         ))
 
+    if update_index and any(not b.skipped for b in bulletins):
+        rebuild_index(output_dir)
+
     # ---- Step 6: Reading sheets ----
     reading_sheet_paths: list[Path] = []
     if options.reading_sheets and not is_hidden_springs:
@@ -375,11 +509,11 @@ def run_generation(
 
         rs_builder = BulletinBuilder(
             target_date=target_date,
-            sheet_data=sheet_data,
+            sheet_data=inputs.sheet_data,
             music_data=None,
-            scripture_readings=scripture_readings,
-            song_lookup_fn=song_lookup_fn,
-            parish_ministries=parish_ministries,
+            scripture_readings=inputs.scripture_readings,
+            song_lookup_fn=_song_lookup,
+            parish_ministries=inputs.parish_ministries,
             service_time="9 am",
         )
         rs_builder.resolve_all(prompt_fn=prompt_fn,
@@ -391,7 +525,7 @@ def run_generation(
 
         date_str = target_date.strftime("%Y-%m-%d")
         short_title = get_short_liturgical_title(schedule.title, schedule.proper)
-        year_letter = get_lectionary_year(target_date.year)
+        year_letter = lectionary_year(target_date)
         title_tag = f"{short_title}{year_letter}"
 
         if rubric_8am == rubric_9_11:
@@ -400,7 +534,7 @@ def run_generation(
             if rs_path.exists():
                 rs_path.unlink()
             prune_unused_styles(doc)
-            doc.save(str(rs_path))
+            _save(doc, rs_path, options)
             progress_fn(f"  Saved: {rs_path}")
             reading_sheet_paths.append(rs_path)
         else:
@@ -409,7 +543,7 @@ def run_generation(
             if rs_path_8.exists():
                 rs_path_8.unlink()
             prune_unused_styles(doc_8)
-            doc_8.save(str(rs_path_8))
+            _save(doc_8, rs_path_8, options)
             progress_fn(f"  Saved: {rs_path_8}")
             reading_sheet_paths.append(rs_path_8)
 
@@ -418,7 +552,7 @@ def run_generation(
             if rs_path_9_11.exists():
                 rs_path_9_11.unlink()
             prune_unused_styles(doc_9_11)
-            doc_9_11.save(str(rs_path_9_11))
+            _save(doc_9_11, rs_path_9_11, options)
             progress_fn(f"  Saved: {rs_path_9_11}")
             reading_sheet_paths.append(rs_path_9_11)
 
@@ -429,3 +563,467 @@ def run_generation(
         reading_sheets=reading_sheet_paths,
         report=report,
     )
+
+
+def _save(doc, path: Path, options: RunOptions) -> None:
+    """Save *doc*, reproducibly (stamped with the service date) when
+    ``options.deterministic`` is set."""
+    if options.deterministic:
+        save_deterministic(doc, path,
+                           timestamp=datetime.combine(options.target_date, time()))
+    else:
+        doc.save(str(path))
+
+
+def _print_aac_manifest(aac_manifest: list[tuple[str, str]],
+                        progress_fn: Callable[[str], None]) -> None:
+    """Print the Hidden Springs AAC upload list, if there is one."""
+    if not aac_manifest:
+        return
+    progress_fn(f"\n  === AAC Files for Upload ===")
+    max_slot = max(len(slot) for slot, _ in aac_manifest)
+    for slot, filename in aac_manifest:
+        progress_fn(f"  {slot + ':':<{max_slot + 1}} {filename}")
+
+
+# ---------------------------------------------------------------------------
+# Hidden Springs batch
+# ---------------------------------------------------------------------------
+# A month of Hidden Springs bulletins used to be one run per date, each
+# downloading the planner again and rescanning it for the date's
+# upcoming services. A batch downloads and indexes the planner once and
+# shares it (and this process's song and text caches) across every date.
+
+def run_hidden_springs_range(
+    start: date,
+    end: date,
+    options: RunOptions,
+    *,
+    max_workers: int = 1,
+    prompt_fn: Optional[Callable] = None,
+    progress_fn: Optional[Callable[[str], None]] = None,
+    planner: Optional[HiddenSpringsPlanner] = None,
+) -> list[RunResult]:
+    """Build every Hidden Springs bulletin dated start <= date < end.
+
+    *options* supplies everything but the date and service. With
+    *max_workers* > 1 the dates are built in parallel (and *prompt_fn*
+    is ignored); each date's progress lines are printed together, in
+    date order. Returns one ``RunResult`` per date, in date order.
+    """
+    if progress_fn is None:
+        progress_fn = print
+
+    if planner is None:
+        progress_fn("  Fetching Hidden Springs planner data...")
+        try:
+            planner = HiddenSpringsPlanner.fetch()
+        except Exception as e:
+            raise RunAborted(
+                f"Could not fetch the Hidden Springs Planner: {e}") from e
+    dates = planner.dates(start, end)
+    if not dates:
+        raise RunAborted(
+            f"No Hidden Springs services from {start.isoformat()} "
+            f"to {(end - timedelta(days=1)).isoformat()}.")
+    progress_fn(f"  Building {len(dates)} Hidden Springs bulletin(s)...")
+
+    def build(target_date: date, progress: Callable[[str], None],
+              prompt: Optional[Callable]) -> RunResult:
+        progress(f"\n{target_date.strftime('%B %-d, %Y')}")
+        date_options = replace(options, target_date=target_date,
+                               service="hidden_springs", output_path=None)
+        return run_generation(date_options, prompt_fn=prompt,
+                              progress_fn=progress, report=RunReport(),
+                              hs_planner=planner, update_index=False)
+
+    results: list[RunResult] = []
+    if max_workers > 1:
+        # Warm the shared ministry rotation so the workers don't race
+        # to fetch it.
+        try:
+            get_rotation(force_fetch=options.force_fetch)
+        except Exception:
+            pass        # each date reports the ministry fallback itself
+    if max_workers <= 1:
+        for d in dates:
+            results.append(build(d, progress_fn, prompt_fn))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            jobs = []
+            for d in dates:
+                lines: list[str] = []
+                jobs.append((pool.submit(build, d, lines.append, None), lines))
+            for future, lines in jobs:
+                result = future.result()
+                for line in lines:
+                    progress_fn(line)
+                results.append(result)
+
+    if any(not b.skipped for r in results for b in r.bulletins):
+        rebuild_index(options.output_dir)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Check mode
+# ---------------------------------------------------------------------------
+# Most Saturday problems are data problems — a missing song, a scripture
+# range typo, an unknown POP form, a missing music row. Check mode runs
+# only the fetch and resolve phases (no build, no save) for every service
+# on each upcoming date and returns one punch list per date.
+
+@dataclass
+class DateCheck:
+    """What ``check_upcoming()`` found for one date."""
+    target_date: date
+    title: str
+    services: list[str]
+    report: RunReport
+
+
+def _dedupe(report: RunReport) -> RunReport:
+    """Drop repeats (shared resolutions report once per service)."""
+    seen: set[tuple] = set()
+    items = []
+    for item in report.items:
+        key = (item.severity, item.category, item.message)
+        if key not in seen:
+            seen.add(key)
+            items.append(item)
+    return RunReport(items=items)
+
+
+def check_date(
+    target_date: date,
+    *,
+    service: str = "all",
+    snapshot: Optional[SheetSnapshot] = None,
+    force_fetch: bool = False,
+) -> DateCheck:
+    """Fetch and resolve every service for *target_date* without building."""
+    report = RunReport()
+    options = RunOptions(target_date=target_date, service=service,
+                         force_fetch=force_fetch)
+    try:
+        inputs = gather_inputs(options, progress_fn=lambda line: None,
+                               report=report, snapshot=snapshot)
+    except RunAborted as e:
+        report.blocker(category="sheet", message=str(e))
+        return DateCheck(target_date=target_date, title="", services=[],
+                         report=report)
+
+    shared_resolutions = None
+    for service_time in inputs.services:
+        builder = inputs.new_builder(service_time, report)
+        builder.resolve_all(prompt_fn=None,
+                            shared_resolutions=shared_resolutions)
+        if shared_resolutions is None:
+            shared_resolutions = builder.get_shared_resolutions()
+
+    return DateCheck(target_date=target_date, title=inputs.schedule.title,
+                     services=inputs.services, report=_dedupe(report))
+
+
+def check_upcoming(
+    start: date,
+    weeks: int,
+    *,
+    force_fetch: bool = False,
+    max_workers: int = 4,
+    progress_fn: Optional[Callable[[str], None]] = None,
+) -> list[DateCheck]:
+    """Check every Liturgical Schedule date in the *weeks* weeks from *start*.
+
+    The sheets are downloaded once and shared by all dates, which are
+    then checked in parallel. A date with an Easter-sunrise row also
+    gets a separate check of the sunrise service. *force_fetch*
+    refreshes the ministry rotation and 9 am grid once up front;
+    scripture is served from the cache where it can be.
+    """
+    if progress_fn is None:
+        progress_fn = print
+
+    progress_fn("  Fetching the planning sheets...")
+    try:
+        snapshot = fetch_sheet_snapshot()
+    except ValueError as e:
+        raise RunAborted(str(e)) from e
+    # Warm the shared sources once so the workers don't race to fetch them.
+    try:
+        get_rotation(force_fetch=force_fetch)
+    except Exception:
+        pass            # each date reports the ministry fallback itself
+    try:
+        fetch_9am_music(start, force_fetch=force_fetch)
+    except Exception:
+        pass            # likewise for 9 am music
+
+    jobs: list[tuple[date, str]] = []
+    for d in snapshot.dates(start, start + timedelta(weeks=weeks)):
+        jobs.append((d, "all"))
+        if any("sunrise" in t.lower() for t in snapshot.titles_on(d)):
+            jobs.append((d, "sunrise"))
+    progress_fn(f"  Checking {len(jobs)} service date(s)...")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(check_date, d, service=svc, snapshot=snapshot)
+                   for d, svc in jobs]
+        return [f.result() for f in futures]
+
+
+# ---------------------------------------------------------------------------
+# Reference check
+# ---------------------------------------------------------------------------
+# The reading, psalm, and gospel columns checked against the NRSV
+# versification table (and the psalm column against the psalter) with
+# no scripture fetch at all, so a year of rows takes a moment. Catches
+# the range typos that check mode otherwise finds one oremus round trip
+# at a time.
+
+# Cells that mean "no reading here".
+_NO_REFERENCE = {"", "-", "\u2014", "n/a", "na", "none", "tbd"}
+
+
+def _cell_problems(column: str, cell: str) -> list[str]:
+    """Problems with one sheet cell (which may offer "X or Y")."""
+    problems: list[str] = []
+    for ref in alternatives(cell):
+        if ref.lower() in _NO_REFERENCE:
+            continue
+        if column.endswith("psalm") and re.match(r"(?i)psalm\s+\d", ref):
+            # The psalm is printed from the Prayer Book psalter, whose
+            # numbering is the one the planner means.
+            try:
+                missing = get_psalm(ref).missing_verses
+            except ValueError as e:
+                problems.append(str(e))
+                continue
+            if missing:
+                problems.append(f"verse(s) {missing} are past the end of "
+                                f"the psalm in the psalter")
+        elif column.endswith("psalm") and re.match(r"(?i)canticle\b", ref):
+            continue
+        else:
+            problems.extend(reference_problems(ref))
+    return problems
+
+
+def check_references(
+    start: date,
+    end: date,
+    *,
+    snapshot: Optional[SheetSnapshot] = None,
+    hs_rows: Optional[list] = None,
+) -> RunReport:
+    """Check every scripture reference dated start <= date < end on the
+    Liturgical Schedule and the Hidden Springs Planner.
+
+    Sheets not passed in are downloaded; nothing else is fetched.
+    """
+    report = RunReport()
+    if snapshot is None:
+        snapshot = fetch_sheet_snapshot()
+    if hs_rows is None:
+        try:
+            hs_rows = fetch_hidden_springs_planner()
+        except Exception as e:
+            report.warning(category="sheet",
+                           message=f"Hidden Springs Planner not checked: {e}")
+            hs_rows = []
+
+    sheets = [
+        ("Liturgical Schedule", snapshot.schedule,
+         ("reading", "psalm", "gospel",
+          "hs_reading", "hs_psalm", "hs_gospel")),
+        ("Hidden Springs Planner", hs_rows, ("reading", "psalm", "gospel")),
+    ]
+    for sheet, rows, columns in sheets:
+        in_range = sorted((r for r in rows if r.date and start <= r.date < end),
+                          key=lambda r: r.date)
+        for row in in_range:
+            for column in columns:
+                cell = getattr(row, column)
+                label = column.replace("hs_", "Hidden Springs ")
+                for problem in _cell_problems(column, cell):
+                    report.warning(
+                        category="scripture",
+                        message=(f"{row.date.isoformat()} {label} "
+                                 f"{cell.strip()!r}: {problem}"),
+                        fix_hint=f"Correct the reference on the {sheet}.",
+                    )
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Warm-up
+# ---------------------------------------------------------------------------
+
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+def warm_caches() -> None:
+    """Load every data file and cover template a run reads.
+
+    The first run in a fresh process otherwise pays for parsing the
+    psalter, songs, and BCP texts and for python-docx's first document.
+    The web UI's worker pool calls this as each worker starts.
+    """
+    from docx import Document
+
+    from bulletin.data import loader
+    from bulletin.sources import collects, psalms, song_index, versification
+
+    for load in (
+        loader.load_common_prayers, loader.load_eucharistic_prayers,
+        loader.load_proper_prefaces, loader.load_blessings,
+        loader.load_pop_forms, loader.load_placeholders,
+        loader.load_reading_introductions,
+        loader.load_psalm_reader_instructions,
+        loader.load_maundy_thursday, loader.load_good_friday,
+        loader.load_great_litany, loader.load_palm_sunday,
+        loader.load_hymnal_first_lines,
+        psalms._load_psalms, psalms._load_canticles,
+        collects._collect_index, versification._load,
+        song_index.get_index,
+    ):
+        try:
+            load()
+        except (OSError, ValueError):
+            pass            # a run that needs it reports the problem
+    for template in sorted(_TEMPLATES_DIR.glob("*.docx")):
+        Document(str(template))
+
+
+# ---------------------------------------------------------------------------
+# Funerals
+# ---------------------------------------------------------------------------
+
+def run_funeral_generation(
+    options: FuneralRunOptions,
+    *,
+    progress_fn: Optional[Callable[[str], None]] = None,
+    report: Optional[RunReport] = None,
+) -> RunResult:
+    """Generate a funeral / memorial bulletin from a per-service YAML.
+
+    Loads the YAML, gathers scripture for every reading reference it
+    names, then runs ``FuneralBuilder``. Readings go through
+    ``fetch_readings`` like Sunday services, so they come from (and
+    land in) the scripture cache and get the same verse-range checks;
+    re-rendering after a family edit needs no network. Readings that
+    aren't available offline (``check_readings_offline()``) are listed
+    before anything is fetched. Output filename
+    mirrors the convention used by St. Andrew's existing Pages
+    bulletins, e.g. ``2026-01-31 - Burial of the Dead - Annette Cox.docx``.
+    """
+    from bulletin.sources.burial_readings import (
+        FUNERAL_READING_LABELS,
+        check_readings_offline,
+    )
+    from bulletin.sources.funeral_data import load_service
+    from bulletin.sources.music_11am import parse_11am_identifier
+    from bulletin.sources.psalms import get_psalm
+    from bulletin.document.funeral_builder import FuneralBuilder
+
+    if progress_fn is None:
+        progress_fn = print
+
+    if report is None:
+        report = RunReport()
+
+    try:
+        fd = load_service(options.service)
+    except (FileNotFoundError, ValueError) as e:
+        raise RunAborted(str(e)) from e
+    progress_fn(f"Generating funeral bulletin: {fd.slug}")
+    progress_fn(f"  {fd.cover_subtitle_resolved} — Rite {fd.rite}, "
+                f"HC={fd.holy_eucharist['enabled']}, "
+                f"commendation={fd.include_commendation}, "
+                f"committal={fd.include_committal}")
+
+    # ----- Offline check ----------------------------------------------
+    # Lessons not yet cached are fetched below; a psalm the local
+    # psalter can't supply in full can't be fetched at all.
+    psalm_ref = fd.readings.get("psalm")
+    for ref in check_readings_offline(fd.readings):
+        if ref == psalm_ref:
+            continue            # reported with the psalm lookup below
+        progress_fn(f"  Not available offline, fetching: {ref}")
+
+    # ----- Scripture --------------------------------------------------
+    # Psalms come from the BCP Coverdale psalter (bulletin/data/bcp_texts/
+    # psalms.yaml) so they render with the same hanging-indent verse
+    # layout as Sunday bulletins. Other readings come from oremus via
+    # the scripture cache. The burial sections look readings up by
+    # reference, so results are keyed by ref rather than label.
+    scripture: dict = {}
+    if psalm_ref:
+        try:
+            selection = get_psalm(psalm_ref)
+            scripture[psalm_ref] = selection.to_lines()
+            if selection.missing_verses:
+                report.warning(
+                    category="scripture",
+                    message=f"Psalm verses missing from the psalter: "
+                            f"{psalm_ref}",
+                    fix_hint="Check the verse range in the funeral YAML.")
+        except Exception as e:
+            progress_fn(f"  Warning: could not look up {psalm_ref}: {e}")
+            report.warning(
+                category="scripture",
+                message=f"Psalm not found: {psalm_ref}",
+                fix_hint="Check the psalm reference in the funeral YAML "
+                         "(e.g. 'Psalm 23' or 'Psalm 121').")
+
+    refs_to_fetch = {label: fd.readings[label]
+                     for label in FUNERAL_READING_LABELS
+                     if fd.readings.get(label)}
+    if refs_to_fetch:
+        readings = fetch_readings(
+            refs_to_fetch, force_fetch=options.force_fetch, report=report)
+        for label, reading in readings.items():
+            scripture[refs_to_fetch[label]] = reading
+
+    # ----- Song lookup -----------------------------------------------
+    # Funerals draw from the 11am music pool (full hymnals + songbook).
+    # Wrap lookup_song with a hymnal-stub fallback: if the title
+    # carries a "#NNN" prefix and the catalog has no full lyrics, we
+    # synthesize a header-only stub so the bulletin still prints the
+    # title + hymnal reference (matches the 11am Sunday pipeline's
+    # _lookup_slot behavior).
+    def song_lookup_fn(title: str, service: str):
+        result = lookup_song(title, service="11am")
+        if result and result.get("sections"):
+            return result
+        parsed = parse_11am_identifier(title)
+        if parsed.get("hymnal_number"):
+            return {
+                "title":         result["title"] if result else (parsed.get("title") or title),
+                "hymnal_number": parsed["hymnal_number"],
+                "hymnal_name":   parsed.get("hymnal_name") or "Hymnal 1982",
+                "tune_name":     (result or {}).get("tune_name"),
+                "sections":      [],   # header-only render
+            }
+        return result   # may be None — renderer prints "[Song lyrics not found]"
+
+    builder = FuneralBuilder(fd, scripture, song_lookup_fn)
+    doc = builder.build()
+
+    out = options.output_path or (options.output_dir / builder.output_filename())
+    out.parent.mkdir(parents=True, exist_ok=True)
+    doc.save(str(out))
+    progress_fn(f"\nWrote: {out}")
+
+    service_date = fd.service["date"]
+    if isinstance(service_date, str):
+        service_date = date.fromisoformat(service_date)
+
+    return RunResult(
+        target_date=service_date,
+        services_requested=["funeral"],
+        bulletins=[GeneratedBulletin(
+            service_time="funeral", output_path=out, aac_manifest=[])],
+        reading_sheets=[],
+        report=report,
+    )
@@ -0,0 +1,94 @@
+"""
+The BCP's suggested burial-office readings, prefetched for offline use.
+
+Families choose funeral readings from a short, fixed menu (BCP pp.
+494-495, kept in ``funeral_texts.yaml`` under ``burial_readings``).
+Funerals are usually produced under deadline, so rather than fetching
+each choice live, ``prefetch_burial_readings()`` pulls every lesson and
+gospel on the menu into the scripture cache in one pass and resolves
+every psalm against the local psalter. After that, any funeral that
+sticks to the menu builds with no network at all.
+
+``check_readings_offline()`` answers the question "can this funeral
+YAML be built right now without network?" using only local data. Every
+funeral run asks it before fetching and lists what will need the
+network (``run_funeral_generation()``); ``generate.py --funeral SLUG
+--check-readings`` asks it alone. It isn't part of the YAML schema
+check in ``funeral_data._validate()``: a reading that isn't cached yet
+is fine when there's network, so it mustn't stop ``load_service()``.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from bulletin.data.loader import load_burial_readings
+from bulletin.report import RunReport
+from bulletin.sources.psalms import get_psalm
+from bulletin.sources.scripture import fetch_readings, is_cached
+
+# Funeral YAML ``readings:`` labels that are fetched from oremus (the
+# psalm comes from the local psalter instead).
+FUNERAL_READING_LABELS = ("first", "second", "gospel")
+
+
+def prefetch_burial_readings(
+    *,
+    force_fetch: bool = False,
+    progress_fn: Optional[Callable[[str], None]] = None,
+    report: Optional[RunReport] = None,
+) -> RunReport:
+    """Cache every suggested burial lesson/gospel and check every psalm.
+
+    Readings already in the cache are not re-fetched unless
+    *force_fetch* is set. Problems land in the returned report.
+    """
+    if progress_fn is None:
+        progress_fn = print
+    if report is None:
+        report = RunReport()
+
+    menu = load_burial_readings()
+
+    progress_fn("  Resolving burial-office psalms...")
+    for ref in menu["psalms"]:
+        try:
+            selection = get_psalm(ref)
+        except Exception as e:
+            report.blocker(
+                category="scripture",
+                message=f"Psalm not found in the psalter: {ref}",
+                fix_hint=f"Fix the reference in funeral_texts.yaml ({e}).")
+            continue
+        progress_fn(f"    {ref}: {len(selection.to_lines())} verses")
+
+    refs = [ref for key in ("old_testament", "new_testament", "gospels")
+            for ref in menu[key]]
+    progress_fn("  Fetching burial-office lessons and gospels...")
+    # fetch_readings is label-keyed; the reference itself is a unique label.
+    fetch_readings({ref: ref for ref in refs},
+                   force_fetch=force_fetch, report=report)
+    return report
+
+
+def check_readings_offline(readings: dict) -> list[str]:
+    """Return the references in a funeral ``readings:`` block that could
+    not be produced without network.
+
+    Lessons and the gospel must already be in the scripture cache; the
+    psalm must resolve against the local psalter with no missing
+    verses. An empty list means the bulletin can be built offline.
+    """
+    missing = []
+    psalm_ref = readings.get("psalm")
+    if psalm_ref:
+        try:
+            if get_psalm(psalm_ref).missing_verses:
+                missing.append(psalm_ref)
+        except Exception:
+            missing.append(psalm_ref)
+    for label in FUNERAL_READING_LABELS:
+        ref = readings.get(label)
+        if ref and not is_cached(ref):
+            missing.append(ref)
+    return missing
@@ -13,11 +13,13 @@ like "Third Sunday after Pentecost" doesn't directly match a YAML key,
 we compute the Proper number from the target date.
 """
 
+from bisect import bisect_left
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 
-import yaml
+from bulletin.data.bundle import load_yaml
+
 
 _DATA_PATH = Path(__file__).parent.parent / "data" / "bcp_texts" / "collects.yaml"
 
@@ -54,8 +56,17 @@ _PROPER_ANCHORS: dict[int, tuple[int, int]] = {
 @lru_cache(maxsize=1)
 def _load_collects() -> dict[str, str]:
     """Load the collects YAML (cached after first call)."""
-    with open(_DATA_PATH, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return load_yaml(_DATA_PATH) or {}
+
+
+@lru_cache(maxsize=16)
+def _proper_anchor_table(year: int) -> tuple[tuple[date, ...], tuple[int, ...]]:
+    """Anchor dates for *year* in date order, with their Proper numbers."""
+    pairs = sorted(
+        (date(year, month, day), proper_num)
+        for proper_num, (month, day) in _PROPER_ANCHORS.items()
+    )
+    return tuple(d for d, _ in pairs), tuple(n for _, n in pairs)
 
 
 def proper_from_date(target: date) -> int | None:
@@ -63,18 +74,18 @@ def proper_from_date(target: date) -> int | None:
 
     Each Proper's anchor date is the fixed calendar date listed in the
     BCP.  The Proper used on any given Sunday is the one whose anchor
-    is closest to that Sunday.
+    is closest to that Sunday.  The anchors are a week apart, so only
+    the two on either side of *target* can be closest.
     """
-    year = target.year
-    best_proper = None
-    best_distance = None
-    for proper_num, (month, day) in _PROPER_ANCHORS.items():
-        anchor = date(year, month, day)
-        distance = abs((target - anchor).days)
-        if best_distance is None or distance < best_distance:
-            best_distance = distance
-            best_proper = proper_num
-    return best_proper
+    anchors, propers = _proper_anchor_table(target.year)
+    i = bisect_left(anchors, target)
+    if i == 0:
+        return propers[0]
+    if i == len(anchors):
+        return propers[-1]
+    before = (target - anchors[i - 1]).days
+    after = (anchors[i] - target).days
+    return propers[i] if after < before else propers[i - 1]
 
 
 def _split_title_alternatives(title: str) -> list[str]:
@@ -90,6 +101,68 @@ def _split_title_alternatives(title: str) -> list[str]:
     return [p.strip() for p in parts if p.strip()]
 
 
+class _CollectIndex:
+    """Lookup tables over the collect keys, built once per YAML load.
+
+    ``get_collect`` used to rescan every key (lower-casing each one) for
+    each matching pass.  The passes are all "first key in YAML order
+    that matches", so the index keeps each key's position and answers
+    each pass from small candidate lists instead:
+
+      - ``by_lower``: lower-cased key → positions of keys with that form
+      - ``by_trigram``: character trigram → positions of keys containing
+        it.  A query can only sit inside keys that contain its first
+        trigram.
+      - ``by_prefix``: a key's first trigram → positions of keys that
+        start with it.  A key can only sit inside the query at an
+        offset where the query has that trigram.
+    """
+
+    def __init__(self, collects: dict[str, str]):
+        self.keys = list(collects)
+        self.values = list(collects.values())
+        self.lower = [k.lower() for k in self.keys]
+        self.principal = ["principal" in kl for kl in self.lower]
+        self.by_lower: dict[str, list[int]] = {}
+        self.by_trigram: dict[str, list[int]] = {}
+        self.by_prefix: dict[str, list[int]] = {}
+        self.short: list[int] = []   # keys under three characters
+        for i, kl in enumerate(self.lower):
+            self.by_lower.setdefault(kl, []).append(i)
+            if len(kl) < 3:
+                self.short.append(i)
+                continue
+            self.by_prefix.setdefault(kl[:3], []).append(i)
+            for trigram in {kl[j:j + 3] for j in range(len(kl) - 2)}:
+                self.by_trigram.setdefault(trigram, []).append(i)
+
+    def substring_matches(self, query: str) -> list[int]:
+        """Positions (in YAML order) of keys where query ⊆ key or key ⊆ query."""
+        found: set[int] = set()
+        lower = self.lower
+
+        # Query inside a key.
+        if len(query) < 3:
+            found.update(i for i, kl in enumerate(lower) if query in kl)
+        else:
+            found.update(i for i in self.by_trigram.get(query[:3], ())
+                         if query in lower[i])
+
+        # A key inside the query.
+        for j in range(len(query) - 2):
+            for i in self.by_prefix.get(query[j:j + 3], ()):
+                if query.startswith(lower[i], j):
+                    found.add(i)
+        found.update(i for i in self.short if lower[i] in query)
+
+        return sorted(found)
+
+
+@lru_cache(maxsize=1)
+def _collect_index() -> _CollectIndex:
+    return _CollectIndex(_load_collects())
+
+
 def get_collect(liturgical_title: str, target_date: date | None = None) -> str | None:
     """Look up the Collect of the Day for a liturgical title.
 
@@ -104,6 +177,7 @@ def get_collect(liturgical_title: str, target_date: date | None = None) -> str |
         The collect text, or None if no match is found.
     """
     collects = _load_collects()
+    index = _collect_index()
     title = liturgical_title.strip()
 
     # 1. Exact match
@@ -112,16 +186,16 @@ def get_collect(liturgical_title: str, target_date: date | None = None) -> str |
 
     # 2. Case-insensitive exact match
     title_lower = title.lower()
-    for key, val in collects.items():
-        if key.lower() == title_lower:
-            return val
+    positions = index.by_lower.get(title_lower)
+    if positions:
+        return index.values[positions[0]]
 
     # 3. Fuzzy: title is a substring of a key, or vice versa
     #    e.g. "Second Sunday in Lent" matches "Second Sunday in Lent"
     #    or "Pentecost" matches "Day of Pentecost / Whitsunday"
-    for key, val in collects.items():
-        if title_lower in key.lower() or key.lower() in title_lower:
-            return val
+    matches = index.substring_matches(title_lower)
+    if matches:
+        return index.values[matches[0]]
 
     # 3b. Extract a recognisable day name from a longer title and re-try.
     #     e.g. "The Sunday of the Resurrection, or Easter Day" contains
@@ -129,22 +203,22 @@ def get_collect(liturgical_title: str, target_date: date | None = None) -> str |
     #     Split on ", or " / " or " to try each alternative name.
     #     When multiple keys match, prefer "Principal Service" over others.
     for alt in _split_title_alternatives(title_lower):
-        matches = []
-        for key, val in collects.items():
-            kl = key.lower()
-            if alt in kl or kl in alt:
-                matches.append((key, val))
+        matches = index.substring_matches(alt)
         if matches:
             # Prefer "Principal Service" variant if available
-            for key, val in matches:
-                if "principal" in key.lower():
-                    return val
-            return matches[0][1]
-
-    # 4. Date-based Proper lookup for Ordinary Time
-    #    Titles like "Third Sunday after Pentecost" or any unmatched
-    #    Ordinary Time Sunday can be resolved via the calendar date.
+            for pos in matches:
+                if index.principal[pos]:
+                    return index.values[pos]
+            return index.values[matches[0]]
+
+    # 4. Date-based lookup.  The precomputed church calendar knows the
+    #    collect for every date; for Ordinary Time that's the Proper,
+    #    so titles like "Third Sunday after Pentecost" resolve here.
     if target_date is not None:
+        from bulletin.logic.church_calendar import lookup
+        calendar_key = lookup(target_date).collect_key
+        if calendar_key and calendar_key in collects:
+            return collects[calendar_key]
         proper_num = proper_from_date(target_date)
         if proper_num is not None:
             proper_key = f"Proper {proper_num}"
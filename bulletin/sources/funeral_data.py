@@ -37,7 +37,7 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
+from bulletin.data.bundle import load_yaml
 
 
 # ---------------------------------------------------------------------------
@@ -191,8 +191,7 @@ def load_service(slug_or_path: str | Path) -> FuneralData:
             f"  Expected at: {_SERVICES_DIR / (str(slug_or_path) + '.yaml')}\n"
             f"  Or pass an explicit path."
         )
-    with open(path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    raw = load_yaml(path)
 
     _validate(raw, path)
     return _from_raw(raw)
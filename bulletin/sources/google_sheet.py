@@ -3,22 +3,26 @@ Fetch liturgical schedule, clergy rota, and service music data from the
 St. Andrew's Google Sheet.
 
 The sheet is publicly viewable, so we use CSV export (no API key needed).
-Each worksheet is exported by its GID and parsed into a list of dicts.
+Each worksheet is exported by its GID. Its header row is resolved to
+column indices once (``SheetTable``), and each row is built straight
+into its dataclass from those indices (``_build_rows``).
 """
 
 import csv
 import io
+import re
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 import requests
 
 from bulletin.config import SPREADSHEET_ID, SHEET_GIDS
 
 
-def _fetch_sheet_csv(gid: int) -> list[dict]:
-    """Download a worksheet as CSV and return a list of row dicts.
+def _fetch_sheet_csv(gid: int) -> "SheetTable":
+    """Download a worksheet as CSV and return its header row and data rows.
 
     The Google Sheets often have title/description rows above the real headers.
     We detect the header row by looking for a row containing 'Date' as a value.
@@ -46,16 +50,7 @@ def _fetch_sheet_csv(gid: int) -> list[dict]:
 
     # Normalize header names: collapse newlines, strip whitespace
     headers = [c.strip().replace("\n", " ") for c in all_rows[header_idx]]
-
-    # Build dicts for each data row after the header
-    results = []
-    for row in all_rows[header_idx + 1:]:
-        if len(row) < len(headers):
-            row.extend([""] * (len(headers) - len(row)))
-        row_dict = {headers[j]: row[j] for j in range(len(headers))}
-        results.append(row_dict)
-
-    return results
+    return SheetTable(headers, all_rows[header_idx + 1:])
 
 
 def _parse_date(date_str: str) -> Optional[date]:
@@ -156,107 +151,154 @@ class ServiceMusicRow:
 # ---------------------------------------------------------------------------
 # Google Sheets column headers may vary slightly. These mappings handle the
 # known header names. We normalize by stripping whitespace and lowercasing.
+# Each sheet's mapping is dataclass field -> candidate headers, first match
+# wins; a field with no matching column gets "".
 
 def _normalize_key(key: str) -> str:
-    import re as _re
     normalized = key.strip().lower().replace("\n", " ")
-    return _re.sub(r" {2,}", " ", normalized)  # collapse multiple spaces
+    return re.sub(r" {2,}", " ", normalized)  # collapse multiple spaces
+
+
+class SheetTable:
+    """A worksheet's data rows plus its header row, resolved once to
+    column indices by normalized name."""
+
+    def __init__(self, headers: list[str], rows: list[list[str]]):
+        self.headers = headers
+        self.rows = rows
+        # A repeated header resolves to its last column, as the old
+        # per-row dicts did.
+        self._index = {_normalize_key(h): i for i, h in enumerate(headers)}
+
+    def column(self, *possible_keys: str) -> Optional[int]:
+        """Index of the first of *possible_keys* present, or None."""
+        for key in possible_keys:
+            index = self._index.get(_normalize_key(key))
+            if index is not None:
+                return index
+        return None
 
 
-def _get(row: dict, *possible_keys, default: str = "") -> str:
-    """Get a value from a row dict, trying multiple possible column names."""
-    normalized = {_normalize_key(k): v for k, v in row.items()}
-    for key in possible_keys:
-        val = normalized.get(_normalize_key(key))
-        if val is not None:
-            return val.strip()
-    return default
+def _build_rows(table: SheetTable, row_type: type,
+                columns: dict[str, tuple[str, ...]],
+                converters: Optional[dict[str, Callable[[str], object]]] = None
+                ) -> list:
+    """One *row_type* per data row of *table*.
+
+    Every field in *columns* gets its cell, stripped; a field with a
+    converter gets the converter's result instead, computed once per
+    distinct cell text.
+    """
+    converters = converters or {}
+    width = len(table.headers)
+    plain: list[tuple[str, int]] = []
+    converted: list[tuple[str, int, Callable, dict]] = []
+    missing: dict[str, object] = {}
+    for name, keys in columns.items():
+        index = table.column(*keys)
+        convert = converters.get(name)
+        if index is None:
+            missing[name] = convert("") if convert else ""
+        elif convert:
+            converted.append((name, index, convert, {}))
+        else:
+            plain.append((name, index))
+
+    results = []
+    for row in table.rows:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        values = {name: row[index].strip() for name, index in plain}
+        for name, index, convert, memo in converted:
+            text = row[index].strip()
+            value = memo.get(text, memo)
+            if value is memo:
+                value = memo[text] = convert(text)
+            values[name] = value
+        results.append(row_type(**values, **missing))
+    return results
 
 
 # ---------------------------------------------------------------------------
 # Sheet fetching functions
 # ---------------------------------------------------------------------------
 
+_DATED = {"date": _parse_date}
+
+_SCHEDULE_COLUMNS = {
+    "service_type": ("service type",),
+    "date": ("date",),
+    "title": ("sunday/commemoration title", "title"),
+    "proper": ("proper",),
+    "color": ("color",),
+    "eucharistic_prayer": ("eucharistic prayer",),
+    "preface": ("preface",),
+    "reading": ("reading",),
+    "psalm": ("psalm",),
+    "gospel": ("gospel",),
+    "pop_form": ("pop",),
+    "special_blessing": ("special blessing",),
+    "closing_prayer": ("closing prayer", "clsing prayer"),
+    "dismissal": ("dismissal",),
+    "notes": ("notes",),
+    "hs_reading": ("hidden springs reading",),
+    "hs_psalm": ("hidden springs psalm",),
+    "hs_gospel": ("hidden springs gospel",),
+}
+
+_CLERGY_COLUMNS = {
+    "service_type": ("service type",),
+    "date": ("date",),
+    "title": ("sunday/commemoration title", "title"),
+    # 8 am
+    "celebrant_8am": ("8:00 am celebrant", "8 am celebrant",
+                      "celebrant (8:00)"),
+    "preacher_8am": ("8:00 am preacher", "8 am preacher", "preacher (8:00)"),
+    "deacon_8am": ("8:00 am deacon", "8 am deacon", "deacon (8:00)"),
+    # 9 am
+    "celebrant_9am": ("9:00 am celebrant", "9 am celebrant",
+                      "celebrant (9:00)"),
+    "deacon_word_9am": ("9:00 am deacon of the word",
+                        "deacon of the word (9:00)",
+                        "9 am deacon of the word"),
+    "deacon_table_9am": ("9:00 am deacon of the table",
+                         "deacon of the table (9:00)",
+                         "9 am deacon of the table"),
+    "preacher_9am": ("9:00 am preacher", "9 am preacher", "preacher (9:00)",
+                     "main campus preacher"),
+    "assisting_9am": ("9:00 am assisting priest", "assisting priest (9:00)",
+                      "9 am assisting priest"),
+    "subdeacon_9am": ("9:00 am subdeacon", "subdeacon (9:00)",
+                      "9 am subdeacon"),
+    # 11 am
+    "celebrant_11am": ("11:00 am celebrant", "11 am celebrant",
+                       "celebrant (11:00)"),
+    "deacon_word_11am": ("11:00 am deacon of the word",
+                         "deacon of the word (11:00)",
+                         "11 am deacon of the word"),
+    "deacon_table_11am": ("11:00 am deacon of the table",
+                          "deacon of the table (11:00)",
+                          "11 am deacon of the table"),
+    "preacher_11am": ("11:00 am preacher", "11 am preacher",
+                      "preacher (11:00)"),
+    "assisting_11am": ("11:00 am assisting priest", "assisting priest (11:00)",
+                       "11 am assisting priest"),
+    "subdeacon_11am": ("11:00 am subdeacon", "subdeacon (11:00)",
+                       "11 am subdeacon"),
+}
+
+
 def fetch_liturgical_schedule() -> list[LiturgicalScheduleRow]:
     """Fetch and parse the Liturgical Schedule sheet."""
-    rows = _fetch_sheet_csv(SHEET_GIDS["liturgical_schedule"])
-    results = []
-    for row in rows:
-        dt = _parse_date(_get(row, "date"))
-        results.append(LiturgicalScheduleRow(
-            service_type=_get(row, "service type"),
-            date=dt,
-            title=_get(row, "sunday/commemoration title", "title"),
-            proper=_get(row, "proper"),
-            color=_get(row, "color"),
-            eucharistic_prayer=_get(row, "eucharistic prayer"),
-            preface=_get(row, "preface"),
-            reading=_get(row, "reading"),
-            psalm=_get(row, "psalm"),
-            gospel=_get(row, "gospel"),
-            pop_form=_get(row, "pop"),
-            special_blessing=_get(row, "special blessing"),
-            closing_prayer=_get(row, "closing prayer", "clsing prayer"),
-            dismissal=_get(row, "dismissal"),
-            notes=_get(row, "notes"),
-            hs_reading=_get(row, "hidden springs reading"),
-            hs_psalm=_get(row, "hidden springs psalm"),
-            hs_gospel=_get(row, "hidden springs gospel"),
-        ))
-    return results
+    table = _fetch_sheet_csv(SHEET_GIDS["liturgical_schedule"])
+    return _build_rows(table, LiturgicalScheduleRow, _SCHEDULE_COLUMNS,
+                       _DATED)
 
 
 def fetch_clergy_rota() -> list[ClergyRotaRow]:
     """Fetch and parse the Clergy Rota sheet."""
-    rows = _fetch_sheet_csv(SHEET_GIDS["clergy_rota"])
-    results = []
-    for row in rows:
-        dt = _parse_date(_get(row, "date"))
-        results.append(ClergyRotaRow(
-            service_type=_get(row, "service type"),
-            date=dt,
-            title=_get(row, "sunday/commemoration title", "title"),
-            # 8 am
-            celebrant_8am=_get(row, "8:00 am celebrant", "8 am celebrant",
-                               "celebrant (8:00)"),
-            preacher_8am=_get(row, "8:00 am preacher", "8 am preacher",
-                              "preacher (8:00)"),
-            deacon_8am=_get(row, "8:00 am deacon", "8 am deacon",
-                            "deacon (8:00)"),
-            # 9 am
-            celebrant_9am=_get(row, "9:00 am celebrant", "9 am celebrant",
-                               "celebrant (9:00)"),
-            deacon_word_9am=_get(row, "9:00 am deacon of the word",
-                                  "deacon of the word (9:00)",
-                                  "9 am deacon of the word"),
-            deacon_table_9am=_get(row, "9:00 am deacon of the table",
-                                   "deacon of the table (9:00)",
-                                   "9 am deacon of the table"),
-            preacher_9am=_get(row, "9:00 am preacher", "9 am preacher",
-                              "preacher (9:00)", "main campus preacher"),
-            assisting_9am=_get(row, "9:00 am assisting priest",
-                                "assisting priest (9:00)",
-                                "9 am assisting priest"),
-            subdeacon_9am=_get(row, "9:00 am subdeacon", "subdeacon (9:00)",
-                               "9 am subdeacon"),
-            # 11 am
-            celebrant_11am=_get(row, "11:00 am celebrant", "11 am celebrant",
-                                "celebrant (11:00)"),
-            deacon_word_11am=_get(row, "11:00 am deacon of the word",
-                                   "deacon of the word (11:00)",
-                                   "11 am deacon of the word"),
-            deacon_table_11am=_get(row, "11:00 am deacon of the table",
-                                    "deacon of the table (11:00)",
-                                    "11 am deacon of the table"),
-            preacher_11am=_get(row, "11:00 am preacher", "11 am preacher",
-                               "preacher (11:00)"),
-            assisting_11am=_get(row, "11:00 am assisting priest",
-                                 "assisting priest (11:00)",
-                                 "11 am assisting priest"),
-            subdeacon_11am=_get(row, "11:00 am subdeacon",
-                                 "subdeacon (11:00)", "11 am subdeacon"),
-        ))
-    return results
+    table = _fetch_sheet_csv(SHEET_GIDS["clergy_rota"])
+    return _build_rows(table, ClergyRotaRow, _CLERGY_COLUMNS, _DATED)
 
 
 @dataclass
@@ -295,48 +337,97 @@ class HiddenSpringsRow:
     at_st_andrews: bool = False
 
 
+_HIDDEN_SPRINGS_COLUMNS = {
+    "service_type": ("service type",),
+    "date": ("date",),
+    "title": ("sunday/commemoration title", "title"),
+    "proper": ("proper",),
+    "color": ("color",),
+    "eucharistic_prayer": ("eucharistic prayer",),
+    "preface": ("preface",),
+    "reading": ("reading",),
+    "psalm": ("psalm",),
+    "gospel": ("gospel",),
+    "pop_form": ("pop",),
+    "special_blessing": ("special blessing",),
+    "closing_prayer": ("clsing prayer", "closing prayer"),
+    "dismissal": ("dismissal",),
+    "preacher": ("hidden springs preacher",),
+    "celebrant": ("hidden springs celebrant",),
+    "notes": ("notes",),
+    "prelude": ("prelude",),
+    "processional": ("processional",),
+    "song_of_praise": ("song of praise",),
+    "sequence": ("sequence",),
+    "offertory": ("offertory",),
+    "doxology": ("doxology",),
+    "communion": ("communion",),
+    "recessional": ("recessional",),
+    "postlude": ("postlude",),
+    "at_st_andrews": ("check if service at st. andrew's",
+                      "check if service at st. andrew\u2019s"),
+}
+
+_HIDDEN_SPRINGS_CONVERTERS = {
+    "date": _parse_date,
+    "at_st_andrews": lambda text: text.upper() == "TRUE",
+}
+
+
 def fetch_hidden_springs_planner() -> list[HiddenSpringsRow]:
     """Fetch and parse the Hidden Springs Planner sheet."""
-    rows = _fetch_sheet_csv(SHEET_GIDS["hidden_springs"])
-    results = []
-    for row in rows:
-        dt = _parse_date(_get(row, "date"))
-        at_sta = _get(row, "check if service at st. andrew's",
-                       "check if service at st. andrew\u2019s").upper()
-        results.append(HiddenSpringsRow(
-            service_type=_get(row, "service type"),
-            date=dt,
-            title=_get(row, "sunday/commemoration title", "title"),
-            proper=_get(row, "proper"),
-            color=_get(row, "color"),
-            eucharistic_prayer=_get(row, "eucharistic prayer"),
-            preface=_get(row, "preface"),
-            reading=_get(row, "reading"),
-            psalm=_get(row, "psalm"),
-            gospel=_get(row, "gospel"),
-            pop_form=_get(row, "pop"),
-            special_blessing=_get(row, "special blessing"),
-            closing_prayer=_get(row, "clsing prayer", "closing prayer"),
-            dismissal=_get(row, "dismissal"),
-            preacher=_get(row, "hidden springs preacher"),
-            celebrant=_get(row, "hidden springs celebrant"),
-            notes=_get(row, "notes"),
-            prelude=_get(row, "prelude"),
-            processional=_get(row, "processional"),
-            song_of_praise=_get(row, "song of praise"),
-            sequence=_get(row, "sequence"),
-            offertory=_get(row, "offertory"),
-            doxology=_get(row, "doxology"),
-            communion=_get(row, "communion"),
-            recessional=_get(row, "recessional"),
-            postlude=_get(row, "postlude"),
-            at_st_andrews=(at_sta == "TRUE"),
-        ))
-    return results
+    table = _fetch_sheet_csv(SHEET_GIDS["hidden_springs"])
+    return _build_rows(table, HiddenSpringsRow, _HIDDEN_SPRINGS_COLUMNS,
+                       _HIDDEN_SPRINGS_CONVERTERS)
+
+
+class HiddenSpringsPlanner:
+    """One download of the Hidden Springs Planner, indexed by date.
+
+    Rows are sorted by date once (file order kept among rows on the same
+    date), so finding a date's row and its upcoming services is a
+    binary search rather than a scan. Fetch once with
+    ``HiddenSpringsPlanner.fetch()`` and pass it to
+    ``get_hidden_springs_data()`` to look up many dates against the same
+    download (``generate.py --service hidden_springs --month``).
+    """
+
+    def __init__(self, rows: list[HiddenSpringsRow]):
+        self.rows = rows
+        self._dated = sorted((r for r in rows if r.date), key=lambda r: r.date)
+        self._dates = [r.date for r in self._dated]
+
+    @classmethod
+    def fetch(cls) -> "HiddenSpringsPlanner":
+        return cls(fetch_hidden_springs_planner())
+
+    def dates(self, start: date, end: date) -> list[date]:
+        """Distinct planner dates with start <= date < end."""
+        lo = bisect_left(self._dates, start)
+        hi = bisect_left(self._dates, end)
+        return sorted(set(self._dates[lo:hi]))
+
+    def lookup(self, target_date: date, upcoming: int = 3,
+               ) -> tuple[HiddenSpringsRow, list[HiddenSpringsRow]]:
+        """The row for *target_date* and the next *upcoming* services.
+
+        Raises ValueError if target_date is not on the planner.
+        """
+        i = bisect_left(self._dates, target_date)
+        if i == len(self._dates) or self._dates[i] != target_date:
+            available = sorted(set(d.isoformat() for d in self._dates))
+            raise ValueError(
+                f"Date {target_date.isoformat()} not found in Hidden Springs Planner. "
+                f"Available: {available[0]} to {available[-1]}."
+            )
+        after = bisect_right(self._dates, target_date)
+        return self._dated[i], self._dated[after:after + upcoming]
 
 
 def get_hidden_springs_data(
     target_date: date,
+    *,
+    planner: Optional[HiddenSpringsPlanner] = None,
 ) -> tuple[HiddenSpringsRow, list[HiddenSpringsRow]]:
     """Look up the Hidden Springs row for a date + next 3 upcoming services.
 
@@ -344,57 +435,39 @@ def get_hidden_springs_data(
         (target_row, upcoming_rows) where upcoming_rows has up to 3 future
         services after the target date.
     Raises ValueError if target_date not found.
-    """
-    all_rows = fetch_hidden_springs_planner()
-
-    target_row = None
-    for row in all_rows:
-        if row.date == target_date:
-            target_row = row
-            break
 
-    if target_row is None:
-        available = sorted(set(r.date.isoformat() for r in all_rows if r.date))
-        raise ValueError(
-            f"Date {target_date.isoformat()} not found in Hidden Springs Planner. "
-            f"Available: {available[0]} to {available[-1]}."
-        )
-
-    # Find next 3 services after target_date
-    upcoming = [
-        r for r in all_rows
-        if r.date and r.date > target_date
-    ]
-    upcoming.sort(key=lambda r: r.date)
-
-    return target_row, upcoming[:3]
+    *planner* lets many dates share one download of the planner; it is
+    fetched fresh when omitted.
+    """
+    if planner is None:
+        planner = HiddenSpringsPlanner.fetch()
+    return planner.lookup(target_date)
+
+
+_SERVICE_MUSIC_COLUMNS = {
+    "service_type": ("service type",),
+    "date": ("date",),
+    "title": ("sunday/commemoration title", "title"),
+    "reading": ("reading",),
+    "psalm": ("psalm",),
+    "gospel": ("gospel",),
+    "notes": ("notes",),
+    "prelude": ("prelude",),
+    "processional": ("processional",),
+    "song_of_praise": ("song of praise",),
+    "sequence": ("sequence",),
+    "anthem": ("anthem",),
+    "sanctus": ("sanctus",),
+    "communion": ("communion",),
+    "recessional": ("recessional",),
+    "postlude": ("postlude",),
+}
 
 
 def fetch_service_music() -> list[ServiceMusicRow]:
     """Fetch and parse the Service Music sheet."""
-    rows = _fetch_sheet_csv(SHEET_GIDS["service_music"])
-    results = []
-    for row in rows:
-        dt = _parse_date(_get(row, "date"))
-        results.append(ServiceMusicRow(
-            service_type=_get(row, "service type"),
-            date=dt,
-            title=_get(row, "sunday/commemoration title", "title"),
-            reading=_get(row, "reading"),
-            psalm=_get(row, "psalm"),
-            gospel=_get(row, "gospel"),
-            notes=_get(row, "notes"),
-            prelude=_get(row, "prelude"),
-            processional=_get(row, "processional"),
-            song_of_praise=_get(row, "song of praise"),
-            sequence=_get(row, "sequence"),
-            anthem=_get(row, "anthem"),
-            sanctus=_get(row, "sanctus"),
-            communion=_get(row, "communion"),
-            recessional=_get(row, "recessional"),
-            postlude=_get(row, "postlude"),
-        ))
-    return results
+    table = _fetch_sheet_csv(SHEET_GIDS["service_music"])
+    return _build_rows(table, ServiceMusicRow, _SERVICE_MUSIC_COLUMNS, _DATED)
 
 
 # ---------------------------------------------------------------------------
@@ -409,8 +482,40 @@ class BulletinData:
     music: Optional[ServiceMusicRow]
 
 
+@dataclass
+class SheetSnapshot:
+    """One download of the three sheets ``get_bulletin_data()`` reads.
+
+    Fetch once with ``fetch_sheet_snapshot()`` and pass it to
+    ``get_bulletin_data()`` to look up many dates against the same data
+    (``generate.py --check``).
+    """
+    schedule: list[LiturgicalScheduleRow]
+    clergy: list[ClergyRotaRow]
+    music: list[ServiceMusicRow]
+
+    def dates(self, start: date, end: date) -> list[date]:
+        """Distinct Liturgical Schedule dates with start <= date < end."""
+        return sorted({r.date for r in self.schedule
+                       if r.date and start <= r.date < end})
+
+    def titles_on(self, target_date: date) -> list[str]:
+        return [r.title for r in self.schedule if r.date == target_date]
+
+
+def fetch_sheet_snapshot() -> SheetSnapshot:
+    """Download the Liturgical Schedule, Clergy Rota, and Service Music."""
+    return SheetSnapshot(
+        schedule=fetch_liturgical_schedule(),
+        clergy=fetch_clergy_rota(),
+        music=fetch_service_music(),
+    )
+
+
 def get_bulletin_data(target_date: date,
-                      service_type_filter: str = None) -> BulletinData:
+                      service_type_filter: str = None,
+                      *,
+                      snapshot: Optional[SheetSnapshot] = None) -> BulletinData:
     """Fetch all sheet data and look up the row for the target date.
 
     Args:
@@ -421,12 +526,16 @@ def get_bulletin_data(target_date: date,
             "Sunday" rows.  This allows multiple services on the same
             date (e.g., Easter Sunrise + Easter Day) to each generate
             their own bulletin.
+        snapshot: Sheets already downloaded by ``fetch_sheet_snapshot()``;
+            fetched fresh when omitted.
 
     Raises ValueError if the target date is not found in the Liturgical Schedule.
     """
-    schedule_rows = fetch_liturgical_schedule()
-    clergy_rows = fetch_clergy_rota()
-    music_rows = fetch_service_music()
+    if snapshot is None:
+        snapshot = fetch_sheet_snapshot()
+    schedule_rows = snapshot.schedule
+    clergy_rows = snapshot.clergy
+    music_rows = snapshot.music
 
     # Find the matching row in liturgical schedule
     schedule = None
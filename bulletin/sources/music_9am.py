@@ -10,13 +10,22 @@ each representing one week's service music. Each sub-table has 4 columns:
 
 The 3 horizontal sub-tables are separated by an empty column (col E, J).
 The 3 vertical rows of sub-tables are separated by blank rows.
+
+The grid is a rolling nine-week window: once a Sunday scrolls off the
+sheet its music is gone.  ``Music9amStore`` parses the whole grid once
+per fetch into a date-indexed map and keeps every week it has ever
+seen in ``music_9am_history.json``, so past Sundays can be regenerated
+and a batch over several dates downloads the sheet only once.
 """
 
 import csv
 import io
+import json
 import re
+import time
 from datetime import date, datetime
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Optional
 
 import requests
@@ -25,6 +34,15 @@ import requests
 MUSIC_9AM_SPREADSHEET_ID = "119FYdOXYhjDYS42tYlDm_OTEIegz-ZQXN-3PwoRYwd0"
 MUSIC_9AM_GID = 1254884308
 
+MUSIC_9AM_HISTORY_FILE = (
+    Path(__file__).parent.parent / "data" / "music_9am_history.json"
+)
+
+# A fetched grid is reused for this long before the sheet is downloaded
+# again — long enough for a batch run, short enough that a long-running
+# web server picks up the planners' edits.
+_REFRESH_SECONDS = 300
+
 
 @dataclass
 class MusicSlot:
@@ -58,11 +76,8 @@ class ServiceMusic9am:
         return [s for s in self.slots if s.service_part.lower().startswith(prefix_lower)]
 
 
-def fetch_9am_music(target_date: date) -> Optional[ServiceMusic9am]:
-    """Fetch 9am music for a specific date from the planning spreadsheet.
-
-    Returns None if the date is not found in the current 9-week window.
-    """
+def _fetch_grid() -> list[ServiceMusic9am]:
+    """Download the planning sheet and parse every sub-table in it."""
     url = (
         f"https://docs.google.com/spreadsheets/d/{MUSIC_9AM_SPREADSHEET_ID}"
         f"/export?format=csv&gid={MUSIC_9AM_GID}"
@@ -71,13 +86,104 @@ def fetch_9am_music(target_date: date) -> Optional[ServiceMusic9am]:
     response.raise_for_status()
 
     all_rows = list(csv.reader(io.StringIO(response.text)))
-    sub_tables = _find_sub_tables(all_rows)
+    return _find_sub_tables(all_rows)
 
-    for st in sub_tables:
-        if st.date == target_date:
-            return st
 
-    return None
+def _music_to_dict(music: ServiceMusic9am) -> dict:
+    data = asdict(music)
+    data["date"] = music.date.isoformat()
+    return data
+
+
+def _music_from_dict(data: dict) -> ServiceMusic9am:
+    return ServiceMusic9am(
+        date=date.fromisoformat(data["date"]),
+        liturgical_label=data.get("liturgical_label", ""),
+        slots=[MusicSlot(**slot) for slot in data.get("slots", [])],
+    )
+
+
+class Music9amStore:
+    """Date → ``ServiceMusic9am`` for every week the sheet has shown.
+
+    ``refresh()`` downloads and parses the grid once; weeks in the
+    current window replace what the store held for those dates, and
+    weeks that have scrolled off are kept as history.
+    """
+
+    def __init__(self, history_file: Path = MUSIC_9AM_HISTORY_FILE):
+        self.history_file = history_file
+        self.weeks: dict[date, ServiceMusic9am] = {}
+        self.fetched_at: Optional[float] = None
+        self._load_history()
+
+    def _load_history(self):
+        if not self.history_file.exists():
+            return
+        try:
+            with open(self.history_file, encoding="utf-8") as f:
+                data = json.load(f)
+            for entry in data.values():
+                music = _music_from_dict(entry)
+                self.weeks[music.date] = music
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            self.weeks = {}
+
+    def _save_history(self):
+        data = {d.isoformat(): _music_to_dict(m)
+                for d, m in sorted(self.weeks.items())}
+        with open(self.history_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def refresh(self):
+        """Fetch the current window and merge it into the store."""
+        for music in _fetch_grid():
+            self.weeks[music.date] = music
+        self.fetched_at = time.monotonic()
+        try:
+            self._save_history()
+        except OSError:
+            pass  # history is a convenience; the in-memory store is fine
+
+    def is_fresh(self) -> bool:
+        return (self.fetched_at is not None
+                and time.monotonic() - self.fetched_at < _REFRESH_SECONDS)
+
+    def get(self, target_date: date) -> Optional[ServiceMusic9am]:
+        return self.weeks.get(target_date)
+
+    def dates(self) -> list[date]:
+        return sorted(self.weeks)
+
+
+_store: Optional[Music9amStore] = None
+
+
+def get_store() -> Music9amStore:
+    """Return the process-wide ``Music9amStore`` (history loaded, not fetched)."""
+    global _store
+    if _store is None:
+        _store = Music9amStore()
+    return _store
+
+
+def fetch_9am_music(target_date: date,
+                    force_fetch: bool = False) -> Optional[ServiceMusic9am]:
+    """Fetch 9am music for a specific date from the planning spreadsheet.
+
+    The sheet is downloaded at most once per refresh interval; dates that
+    have left the 9-week window are answered from the store's history.
+    If the sheet can't be reached, a date already in the history is
+    still returned. Returns None if the date has never been on the sheet.
+    """
+    store = get_store()
+    if force_fetch or not store.is_fresh():
+        try:
+            store.refresh()
+        except requests.RequestException:
+            if store.get(target_date) is None:
+                raise
+    return store.get(target_date)
 
 
 def _find_sub_tables(all_rows: list[list[str]]) -> list[ServiceMusic9am]:
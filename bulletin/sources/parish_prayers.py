@@ -6,11 +6,21 @@ rotating through 48 ministries over ~18 weeks (16 regular + 2 special).
 The cycle repeats year after year.
 
 Source: Google Sheet with Date/Ministry columns from a reference year (2022).
+
+Because the rotation is a pure function of the cycle data and the week
+offset, the sheet is fetched once per refresh interval and turned into a
+``MinistryRotation``.  The last good rotation is also written to
+``parish_cycle_cache.json`` so a run without network access still gets
+real ministry names instead of the ``[ministries]`` placeholder.
 """
 
 import csv
 import io
+import json
+import time
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Optional
 
 import requests
@@ -18,6 +28,18 @@ import requests
 PARISH_PRAYERS_SPREADSHEET_ID = "1GzhkbQIKxmrOpnmp4w3QWHZX_DIu-IlTj5WuP6eVJYE"
 PARISH_PRAYERS_GID = 0
 
+PARISH_CYCLE_CACHE_FILE = (
+    Path(__file__).parent.parent / "data" / "parish_cycle_cache.json"
+)
+
+# Fallback anchor: the first Sunday of the 2022 reference sheet.
+_DEFAULT_ANCHOR = date(2022, 8, 28)
+
+# A fetched rotation is reused for this long before the sheet is
+# downloaded again — long enough for a batch run, short enough that the
+# web UI's long-lived workers pick up edits to the Parish Cycle.
+_REFRESH_SECONDS = 300
+
 
 def fetch_parish_cycle() -> list[tuple[str, list[str]]]:
     """Fetch the parish cycle of prayers from the Google Sheet.
@@ -72,49 +94,146 @@ def fetch_parish_cycle() -> list[tuple[str, list[str]]]:
     return weeks
 
 
-def get_ministries_for_date(target_date: date) -> list[str]:
-    """Get the ministries for the Parish Cycle of Prayers for a given Sunday.
+@dataclass
+class MinistryRotation:
+    """The parish cycle reduced to what the date lookup needs.
 
-    The cycle is 18 weeks long (16 regular + 2 special). We calculate
-    which week of the cycle a given Sunday falls in by counting weeks
-    from a known anchor date, modulo the cycle length.
+    ``regular_weeks[i]`` is the ministry list for the i-th week after
+    ``anchor_date`` (modulo the cycle length).  Special-prayer weeks are
+    kept for reference but never land on a Sunday by rotation.
     """
-    cycle = fetch_parish_cycle()
+    anchor_date: date
+    regular_weeks: list[list[str]]
+    special_weeks: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_cycle(cls, cycle: list[tuple[str, list[str]]]) -> "MinistryRotation":
+        """Build the rotation from ``fetch_parish_cycle()`` output."""
+        regular_weeks = []
+        special_weeks = {}
+        for date_label, ministries in cycle:
+            # Check if this is a special week
+            if len(ministries) == 1 and "special" in ministries[0].lower():
+                special_weeks[ministries[0]] = ministries
+            else:
+                regular_weeks.append(ministries)
+
+        # Parse the first date from the cycle to establish an anchor
+        anchor_date = _parse_cycle_date(cycle[0][0]) if cycle else None
+        return cls(
+            anchor_date=anchor_date or _DEFAULT_ANCHOR,
+            regular_weeks=regular_weeks,
+            special_weeks=special_weeks,
+        )
+
+    def ministries_for(self, target_date: date) -> list[str]:
+        """Ministries for the week containing *target_date*."""
+        if not self.regular_weeks:
+            return ["[No regular ministry weeks found]"]
+        week_offset = (target_date - self.anchor_date).days // 7
+        return self.regular_weeks[week_offset % len(self.regular_weeks)]
+
+    def year_from(self, start: date) -> dict[date, list[str]]:
+        """Every Sunday in the year starting at *start* → ministries."""
+        sunday = start + timedelta(days=(6 - start.weekday()) % 7)
+        end = start + timedelta(days=365)
+        weeks = {}
+        while sunday < end:
+            weeks[sunday] = self.ministries_for(sunday)
+            sunday += timedelta(weeks=1)
+        return weeks
+
+    def to_dict(self) -> dict:
+        return {
+            "anchor_date": self.anchor_date.isoformat(),
+            "regular_weeks": self.regular_weeks,
+            "special_weeks": self.special_weeks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MinistryRotation":
+        return cls(
+            anchor_date=date.fromisoformat(data["anchor_date"]),
+            regular_weeks=data["regular_weeks"],
+            special_weeks=data.get("special_weeks", {}),
+        )
+
+
+# In-process rotation and when it was fetched (time.monotonic()).
+_rotation: Optional[MinistryRotation] = None
+_fetched_at: Optional[float] = None
+
+
+def _save_rotation(rotation: MinistryRotation):
+    """Write the rotation snapshot to disk."""
+    with open(PARISH_CYCLE_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(rotation.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def _load_rotation() -> Optional[MinistryRotation]:
+    """Load the last saved rotation snapshot, if any."""
+    if not PARISH_CYCLE_CACHE_FILE.exists():
+        return None
+    try:
+        with open(PARISH_CYCLE_CACHE_FILE, encoding="utf-8") as f:
+            return MinistryRotation.from_dict(json.load(f))
+    except (json.JSONDecodeError, OSError, KeyError, ValueError):
+        return None
 
-    if not cycle:
-        return ["[Parish cycle data not available]"]
 
-    # Filter to regular weeks (exclude special prayers weeks)
-    regular_weeks = []
-    special_weeks = {}
+def _is_fresh() -> bool:
+    return (_fetched_at is not None
+            and time.monotonic() - _fetched_at < _REFRESH_SECONDS)
 
-    for date_label, ministries in cycle:
-        # Check if this is a special week
-        if len(ministries) == 1 and "special" in ministries[0].lower():
-            special_weeks[ministries[0]] = ministries
-        else:
-            regular_weeks.append(ministries)
 
-    # Total regular cycle length
-    cycle_length = len(regular_weeks)
+def get_rotation(force_fetch: bool = False) -> MinistryRotation:
+    """Return the cached ``MinistryRotation``, fetching the sheet at most
+    once per refresh interval.
 
-    if cycle_length == 0:
-        return ["[No regular ministry weeks found]"]
+    If the sheet can't be fetched, the rotation already in memory is
+    kept, else the on-disk snapshot from the last successful fetch is
+    used; with neither, the fetch error propagates.
+    """
+    global _rotation, _fetched_at
+    if _rotation is not None and not force_fetch and _is_fresh():
+        return _rotation
+    try:
+        cycle = fetch_parish_cycle()
+    except requests.RequestException:
+        if _rotation is None:
+            _rotation = _load_rotation()
+        if _rotation is None:
+            raise
+        return _rotation
+    _rotation = MinistryRotation.from_cycle(cycle)
+    _fetched_at = time.monotonic()
+    if _rotation.regular_weeks:
+        try:
+            _save_rotation(_rotation)
+        except OSError:
+            pass  # snapshot is a convenience; the rotation itself is fine
+    return _rotation
 
-    # Parse the first date from the cycle to establish an anchor
-    anchor_date = _parse_cycle_date(cycle[0][0])
-    if not anchor_date:
-        # Fallback: use a known start (August 28, 2022 from the data)
-        anchor_date = date(2022, 8, 28)
 
-    # Calculate week offset
-    days_diff = (target_date - anchor_date).days
-    week_offset = days_diff // 7
+def clear_cache():
+    """Forget the in-process rotation (the on-disk snapshot is kept)."""
+    global _rotation, _fetched_at
+    _rotation = None
+    _fetched_at = None
 
-    # Map to cycle position (modulo regular cycle length)
-    cycle_pos = week_offset % cycle_length
 
-    return regular_weeks[cycle_pos]
+def get_ministries_for_date(target_date: date,
+                            force_fetch: bool = False) -> list[str]:
+    """Get the ministries for the Parish Cycle of Prayers for a given Sunday.
+
+    The cycle is 18 weeks long (16 regular + 2 special). We calculate
+    which week of the cycle a given Sunday falls in by counting weeks
+    from a known anchor date, modulo the cycle length.
+    """
+    rotation = get_rotation(force_fetch=force_fetch)
+    if not rotation.regular_weeks and not rotation.special_weeks:
+        return ["[Parish cycle data not available]"]
+    return rotation.ministries_for(target_date)
 
 
 def _parse_cycle_date(date_str: str) -> Optional[date]:
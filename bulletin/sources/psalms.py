@@ -11,7 +11,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from bulletin.data.bundle import load_yaml
+
 
 _PSALMS_PATH = Path(__file__).parent.parent / "data" / "bcp_texts" / "psalms.yaml"
 _CANTICLES_PATH = Path(__file__).parent.parent / "data" / "bcp_texts" / "canticles.yaml"
@@ -20,15 +21,13 @@ _CANTICLES_PATH = Path(__file__).parent.parent / "data" / "bcp_texts" / "canticl
 @lru_cache(maxsize=1)
 def _load_psalms() -> dict:
     """Load and cache the psalms YAML file."""
-    with open(_PSALMS_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml(_PSALMS_PATH)
 
 
 @lru_cache(maxsize=1)
 def _load_canticles() -> dict:
     """Load and cache the canticles YAML file."""
-    with open(_CANTICLES_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml(_CANTICLES_PATH)
 
 
 # ---------------------------------------------------------------------------
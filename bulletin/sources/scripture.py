@@ -11,6 +11,7 @@ descendants and collect text, detecting verse numbers and paragraph breaks.
 
 import json
 import re
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,6 +31,10 @@ from bulletin.config import OREMUS_BASE_URL, OREMUS_PARAMS
 
 SCRIPTURE_CACHE_FILE = Path(__file__).parent.parent / "data" / "scripture_cache.json"
 
+# Serializes read-merge-write of the cache file when several dates are
+# fetched at once (``generate.py --check``).
+_cache_lock = threading.Lock()
+
 
 def _load_cache() -> dict:
     """Load the scripture cache from disk."""
@@ -48,6 +53,27 @@ def _save_cache(cache: dict):
         json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
 
 
+def is_cached(ref: str) -> bool:
+    """True if *ref* can be served from the cache with no network —
+    cached as written, or assembled from cached verses the way
+    ``fetch_readings`` would (every verse up to the chapter's
+    ``last_verse`` present)."""
+    cache = _load_cache()
+    if ref.strip() in cache:
+        return True
+    from bulletin.sources.scripture_refs import parse_reference
+    from bulletin.sources.scripture_store import VerseStore
+    from bulletin.sources.versification import last_verse
+
+    try:
+        parsed = parse_reference(ref)
+    except ValueError:
+        return False
+    store = VerseStore.from_cache(cache)
+    return bool(store.wanted(parsed, last_verse)) and \
+        store.missing(parsed, last_verse) == []
+
+
 def _reading_to_cache(reading: "ScriptureReading") -> dict:
     """Serialize a ScriptureReading for JSON storage."""
     data = {
@@ -151,10 +177,14 @@ def _parse_oremus_response(soup: BeautifulSoup, reference: str) -> ScriptureRead
                 num = desc.get_text().strip()
                 if num:
                     if "cc" in classes:
-                        # Chapter number -- convert to the starting verse
-                        # Extract starting verse from the reference
-                        start_verse = _get_start_verse(reference)
-                        num = start_verse
+                        # Chapter number -- convert to the starting verse.
+                        # At the top of the passage that's the reference's
+                        # first verse; a chapter starting mid-passage
+                        # ("Isaiah 52:13-53:12") starts at verse 1.
+                        if seen_first_verse:
+                            num = "1"
+                        else:
+                            num = _get_start_verse(reference)
                     if not seen_first_verse:
                         seen_first_verse = True
                     elif "vv" in classes:
@@ -234,7 +264,18 @@ def _parse_oremus_response(soup: BeautifulSoup, reference: str) -> ScriptureRead
     # for t in tokens:
     #     print(t)
 
-    # Now assemble tokens into segments (prose/poetry interleaved)
+    return _assemble_tokens(tokens, reference)
+
+
+def _assemble_tokens(tokens: list[tuple], reference: str) -> ScriptureReading:
+    """Build a ScriptureReading from the parser's token stream.
+
+    Tokens are ``("text", str)``, ``("verse", num)``, ``("para", None)``,
+    ``("poetry_br", indent)`` and ``("poetry_end", None)``. The verse
+    store (``scripture_store.py``) produces the same stream to assemble
+    a reading from cached verses.
+    """
+    # Assemble tokens into segments (prose/poetry interleaved)
     segments = []
     paragraphs = []      # Flat list of all paragraphs (for backward compat)
     has_poetry = False
@@ -558,6 +599,10 @@ def fetch_readings(references: dict[str, str],
     runs load cached text instantly — no network request needed. Over a
     three-year lectionary cycle this builds a complete offline library.
 
+    A reference that isn't cached as written is assembled from cached
+    verses where possible (``scripture_store.py``): "John 3:1-21" after
+    "John 3:1-17" fetches only "John 3:18-21".
+
     Args:
         references: Dict mapping label to reference,
                     e.g., {"reading": "Genesis 12:1-4a", "gospel": "John 3:1-17"}
@@ -569,7 +614,24 @@ def fetch_readings(references: dict[str, str],
     """
     cache = _load_cache()
     results = {}
+    new_entries: dict[str, dict] = {}
     fetched_new = False
+    store = None            # verse index over the cache, built on first miss
+
+    def _fetch(reference: str) -> ScriptureReading:
+        nonlocal fetched_new
+        if fetched_new:
+            time.sleep(delay)
+        reading = fetch_reading(reference)
+        fetched_new = True
+        key = reference.strip()
+        cache[key] = new_entries[key] = _reading_to_cache(reading)
+        if store is not None:
+            try:
+                store.add(key, reading)
+            except ValueError:
+                pass
+        return reading
 
     for label, ref in references.items():
         cache_key = ref.strip()
@@ -581,14 +643,21 @@ def fetch_readings(references: dict[str, str],
             _check_verse_range(label, ref, results[label], report)
             continue
 
-        # Fetch from oremus.org
-        if fetched_new:
-            time.sleep(delay)
         try:
-            reading = fetch_reading(ref)
+            reading = None
+            if not force_fetch:
+                if store is None:
+                    from bulletin.sources.scripture_store import VerseStore
+                    store = VerseStore.from_cache(cache)
+                reading = _assemble_from_verses(ref, store, _fetch)
+                if reading is not None:
+                    cache[cache_key] = new_entries[cache_key] = \
+                        _reading_to_cache(reading)
+                    print(f"    {label}: {ref} (assembled from cached verses)")
+            if reading is None:
+                # Fetch from oremus.org
+                reading = _fetch(ref)
             results[label] = reading
-            cache[cache_key] = _reading_to_cache(reading)
-            fetched_new = True
             _check_verse_range(label, ref, reading, report)
         except Exception as e:
             print(f"Warning: Could not fetch {label} ({ref}): {e}")
@@ -609,13 +678,50 @@ def fetch_readings(references: dict[str, str],
                 has_poetry=False,
             )
 
-    # Persist any newly fetched readings
-    if fetched_new:
-        _save_cache(cache)
+    # Persist any newly fetched readings, merging with whatever another
+    # fetch saved in the meantime.
+    if new_entries:
+        with _cache_lock:
+            cache = _load_cache()
+            cache.update(new_entries)
+            _save_cache(cache)
 
     return results
 
 
+def _assemble_from_verses(ref: str, store, fetch) -> Optional[ScriptureReading]:
+    """*ref* built from the verse store, calling *fetch* for just the
+    verses it lacks. Chapter lengths come from the versification table
+    (whole chapters, ranges across a chapter break). None when the
+    reference can't be parsed or its extent isn't known, or the store
+    still can't cover it."""
+    from bulletin.sources.scripture_refs import (
+        format_reference, parse_reference, spans_for,
+    )
+    from bulletin.sources.versification import last_verse
+
+    try:
+        parsed = parse_reference(ref)
+    except ValueError:
+        return None
+    missing = store.missing(parsed, last_verse)
+    if missing is None:
+        return None
+    if missing:
+        if len(missing) == len(store.wanted(parsed, last_verse)):
+            return None         # nothing cached — fetch it as written
+        sub = format_reference(parsed.book, spans_for(missing))
+        print(f"      fetching {sub} (the rest is cached)")
+        try:
+            fetch(sub)
+        except Exception:
+            # e.g. the missing verses run past the end of the chapter
+            # and oremus has nothing to return; the whole reference is
+            # fetched instead (and the range check flags the typo).
+            return None
+    return store.assemble(ref, parsed, last_verse)
+
+
 def _check_verse_range(label: str, ref: str, reading: "ScriptureReading",
                          report) -> None:
     """Compare the requested reference's expected verse range against
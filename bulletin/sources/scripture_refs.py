@@ -0,0 +1,244 @@
+"""
+Scripture reference parsing.
+
+The planning sheet writes readings the way the lectionary prints them:
+
+    Genesis 12:1-4a
+    Acts 2:14a, 22-32
+    John 13:1-17, 31b-35
+    Isaiah 52:13-53:12          (em/en dash or hyphen)
+    John 3                      (a whole chapter)
+    Exodus 12:1-4, (5-10), 11-14    (optional verses, also "[5-10]")
+
+``parse_reference()`` turns one of those into a ``Reference`` — a book
+and a list of ``VerseSpan``s — and ``Reference.verses()`` expands the
+spans into the individual verses they cover, which is what the verse
+store in ``scripture_store.py`` is keyed on. A partial verse keeps its
+letter (``"4a"``, ``"31b"``): oremus returns only that part, so it is a
+different piece of text from the full verse. Optional verses in
+parentheses or brackets are read as ordinary spans: they are part of
+the reading whenever it is read in full.
+
+A cell may offer alternates, ``"Matthew 26:14-27:66 or 27:11-54"``;
+``alternatives()`` splits them, carrying the book over to an alternate
+that doesn't name one.
+
+Expanding a span that crosses a chapter boundary (or a whole chapter)
+needs the chapter's length; callers pass a ``chapter_length`` function
+and get None back when it doesn't know.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# (chapter, verse label) — e.g. (12, "4a")
+VerseKey = tuple[int, str]
+
+ChapterLength = Callable[[str, int], Optional[int]]
+
+_DASHES = "-–—"
+_BOOK_RE = re.compile(r"^\s*((?:[1-4]\s*)?[A-Za-z][A-Za-z.' ]*?)\s*(\d.*)$")
+_POINT_RE = re.compile(r"^(?:(\d+)\s*:\s*)?(\d+)([a-e]?)$")
+# A trailing note such as "(alt)" or "(Track 1)" — a word, not verses.
+_NOTE_RE = re.compile(r"\s*\([^)]*[A-Za-z]{2}[^)]*\)\s*$")
+
+
+@dataclass(frozen=True)
+class VersePoint:
+    """One end of a span; *verse* is None for "end of chapter"."""
+    chapter: int
+    verse: Optional[int]
+    part: str = ""
+
+    def label(self) -> str:
+        return f"{self.verse}{self.part}"
+
+
+@dataclass(frozen=True)
+class VerseSpan:
+    start: VersePoint
+    end: VersePoint
+
+    @property
+    def crosses_chapters(self) -> bool:
+        return self.start.chapter != self.end.chapter
+
+    def verses(self, book: str,
+               chapter_length: Optional[ChapterLength] = None
+               ) -> Optional[list[VerseKey]]:
+        """The verses in this span, or None if a chapter length it
+        needs is unknown."""
+        keys: list[VerseKey] = []
+        for chapter in range(self.start.chapter, self.end.chapter + 1):
+            first = self.start.verse if chapter == self.start.chapter else 1
+            if chapter == self.end.chapter and self.end.verse is not None:
+                last = self.end.verse
+            else:
+                last = chapter_length(book, chapter) if chapter_length else None
+                if last is None:
+                    return None
+            for verse in range(first, last + 1):
+                keys.append((chapter, str(verse)))
+        if not keys:
+            return keys
+        if self.start.part:
+            keys[0] = (keys[0][0], self.start.label())
+        if self.end.part and self.end.verse is not None:
+            if (self.start.part and len(keys) == 1
+                    and self.start.part != self.end.part):
+                return None         # "4a-4b" — not a thing anyone writes
+            keys[-1] = (keys[-1][0], self.end.label())
+        return keys
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A parsed scripture reference."""
+    book: str
+    spans: tuple[VerseSpan, ...]
+
+    @property
+    def book_key(self) -> str:
+        """*book* normalized for use as a dictionary key."""
+        return " ".join(self.book.lower().replace(".", "").split())
+
+    def verses(self, chapter_length: Optional[ChapterLength] = None
+               ) -> Optional[list[VerseKey]]:
+        """Every verse the reference covers, in reading order."""
+        keys: list[VerseKey] = []
+        for span in self.spans:
+            span_keys = span.verses(self.book_key, chapter_length)
+            if span_keys is None:
+                return None
+            keys.extend(span_keys)
+        return keys
+
+    def __str__(self) -> str:
+        return format_reference(self.book, self.spans)
+
+
+def _point(text: str, chapter: Optional[int]) -> VersePoint:
+    m = _POINT_RE.match(text.strip())
+    if not m:
+        raise ValueError(f"Not a verse: {text!r}")
+    if m.group(1):
+        chapter = int(m.group(1))
+    if chapter is None:
+        raise ValueError(f"No chapter for verse {text!r}")
+    return VersePoint(chapter, int(m.group(2)), m.group(3))
+
+
+def parse_reference(reference: str) -> Reference:
+    """Parse a reference like ``"John 13:1-17, 31b-35"``.
+
+    Raises ValueError for anything it can't read.
+    """
+    text = _NOTE_RE.sub("", reference.strip())
+    m = _BOOK_RE.match(text)
+    if not m:
+        raise ValueError(f"Not a scripture reference: {reference!r}")
+    book, rest = m.group(1).strip(), m.group(2)
+    # "(5-10)" / "[5-10]" are optional verses: separate spans like any other.
+    items = [item.strip() for item in re.split(r"[,;()\[\]]", rest)
+             if item.strip()]
+    if not items:
+        raise ValueError(f"Not a scripture reference: {reference!r}")
+
+    spans: list[VerseSpan] = []
+    if ":" not in rest:
+        # Whole chapters: "John 3", "Ruth 1-2"
+        for item in items:
+            ends = re.split(f"[{_DASHES}]", item)
+            if len(ends) > 2 or not all(e.strip().isdigit() for e in ends):
+                raise ValueError(f"Not a scripture reference: {reference!r}")
+            first, last = int(ends[0]), int(ends[-1])
+            spans.append(VerseSpan(VersePoint(first, 1),
+                                   VersePoint(last, None)))
+        return Reference(book=book, spans=tuple(spans))
+
+    chapter: Optional[int] = None
+    for item in items:
+        ends = re.split(f"[{_DASHES}]", item)
+        if len(ends) > 2:
+            raise ValueError(f"Not a scripture reference: {reference!r}")
+        start = _point(ends[0], chapter)
+        end = _point(ends[-1], start.chapter)
+        if (end.chapter, end.verse) < (start.chapter, start.verse):
+            raise ValueError(f"Backwards range in {reference!r}")
+        spans.append(VerseSpan(start, end))
+        chapter = end.chapter
+    return Reference(book=book, spans=tuple(spans))
+
+
+def alternatives(cell: str) -> list[str]:
+    """The references in a cell offering "X or Y", each with its book:
+    ``"Matthew 26:14-27:66 or 27:11-54"`` gives ``["Matthew 26:14-27:66",
+    "Matthew 27:11-54"]``."""
+    refs: list[str] = []
+    book = None
+    for ref in re.split(r"\s+or\s+", cell.strip()):
+        m = _BOOK_RE.match(ref)
+        if m:
+            book = m.group(1).strip()
+        elif book and ref[:1].isdigit():
+            ref = f"{book} {ref}"
+        refs.append(ref)
+    return refs
+
+
+def format_reference(book: str, spans) -> str:
+    """The lectionary spelling of *spans* (inverse of ``parse_reference``)."""
+    parts = []
+    chapter = None
+    for span in spans:
+        start, end = span.start, span.end
+        if end.verse is None:
+            text = str(start.chapter)
+            if end.chapter != start.chapter:
+                text += f"-{end.chapter}"
+            parts.append(text)
+            chapter = None
+            continue
+        text = start.label()
+        if start.chapter != chapter:
+            text = f"{start.chapter}:{text}"
+        if end != start:
+            if end.chapter != start.chapter:
+                text += f"-{end.chapter}:{end.label()}"
+            else:
+                text += f"-{end.label()}"
+        parts.append(text)
+        chapter = end.chapter
+    return f"{book} {', '.join(parts)}"
+
+
+def spans_for(keys: list[VerseKey]) -> list[VerseSpan]:
+    """Group verse keys (in order) into the fewest contiguous spans.
+
+    A partial verse only ends a span (``"4a"``) or starts one
+    (``"31b"``), matching how a reference can name it.
+    """
+    spans: list[VerseSpan] = []
+    start: Optional[VersePoint] = None
+    prev: Optional[VersePoint] = None
+    for chapter, label in keys:
+        m = re.match(r"(\d+)([a-e]?)$", label)
+        point = VersePoint(chapter, int(m.group(1)), m.group(2))
+        joins = (prev is not None and prev.part != "a"
+                 and point.chapter == prev.chapter
+                 and point.verse == prev.verse + 1
+                 and point.part in ("", "a"))
+        if not joins:
+            if start is not None:
+                spans.append(VerseSpan(start, prev))
+            start = point
+        prev = point
+        if point.part == "a" and point != start:
+            spans.append(VerseSpan(start, point))
+            start = prev = None
+    if start is not None:
+        spans.append(VerseSpan(start, prev))
+    return spans
@@ -0,0 +1,354 @@
+"""
+Verse-granular view of the scripture cache.
+
+``scripture_cache.json`` is keyed by the exact reference string, so
+"John 3:1-17" and "John 3:1-21" used to be two oremus fetches and two
+unrelated cache entries. ``VerseStore`` indexes every cached reading by
+(book, chapter, verse) instead, keeping the structure each verse needs
+to be put back together:
+
+  - prose pieces, and whether the piece starts a paragraph
+  - poetry line pieces, with their indent, and whether the piece starts
+    a new line, continues the previous verse's line, or starts a new
+    stanza
+
+``VerseStore.missing()`` says which verses of a reference aren't cached
+yet, and ``VerseStore.assemble()`` rebuilds a ``ScriptureReading`` for
+any reference whose verses are all there — through the same token
+assembly the oremus parser uses, so the result has the same shape as a
+fresh fetch. ``fetch_readings()`` fetches only the missing spans, which
+it caches as ordinary entries keyed by their own (sub-)reference.
+
+The store is derived from the cache each time it's needed rather than
+kept in a second file: the reference-keyed entries stay the single
+source of truth, and entries written before this existed are indexed
+the same as new ones.
+
+What isn't recoverable from a cached reading is marked unknown and
+resolved conservatively: a verse that only ever appeared at the start
+of a fetched passage may or may not begin a paragraph in the middle of
+a longer one, and is set as a new paragraph.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from bulletin.sources.scripture import ScriptureReading, _assemble_tokens
+from bulletin.sources.scripture_refs import (
+    Reference, VerseKey, parse_reference,
+)
+
+_MARKER_RE = re.compile("\x01(\\d+)\x01")
+_SPLIT_RE = re.compile("(?=\x01\\d+\x01)")
+
+# A piece of one verse:
+#   ("prose", text, starts_paragraph)   starts_paragraph may be None (unknown)
+#   ("line",  text, indent, kind)       kind: "new" | "cont" | "stanza"
+Piece = tuple
+
+
+# ---------------------------------------------------------------------------
+# Reading → pieces
+# ---------------------------------------------------------------------------
+
+def _chunks(reading: ScriptureReading) -> list[tuple]:
+    """The reading as prose paragraphs and poetry lines, in order.
+
+    Yields ``("prose", text, new_segment)`` and
+    ``("line", text, indent, kind)`` where *kind* is "stanza" for the
+    first line of a poetry segment that directly follows another.
+    """
+    chunks: list[tuple] = []
+    if reading.segments:
+        prev = None
+        for seg in reading.segments:
+            if seg["type"] == "prose":
+                chunks.append(("prose", seg["text"], True))
+            elif seg["type"] == "poetry":
+                for i, line in enumerate(seg["lines"]):
+                    if isinstance(line, dict):
+                        text, indent = line["text"], line.get("indent", 0)
+                    else:
+                        text, indent = line, 0
+                    kind = "stanza" if i == 0 and prev == "poetry" else "new"
+                    chunks.append(("line", text, indent, kind))
+            prev = seg["type"]
+    else:
+        for para in reading.paragraphs:
+            chunks.append(("prose", para, True))
+        if reading.has_poetry:
+            for line in reading.poetry_lines:
+                chunks.append(("line", line, 0, "new"))
+    return chunks
+
+
+def _paragraph_starts(reading: ScriptureReading) -> set[tuple[str, int]]:
+    """Verse markers that open a paragraph in the flat ``paragraphs``,
+    as (number, occurrence) — a passage across chapters repeats
+    numbers."""
+    starts = set()
+    seen: dict[str, int] = {}
+    for para in reading.paragraphs:
+        for i, m in enumerate(_MARKER_RE.finditer(para)):
+            number = m.group(1)
+            if i == 0 and not para[:m.start()].strip():
+                starts.add((number, seen.get(number, 0)))
+            seen[number] = seen.get(number, 0) + 1
+    return starts
+
+
+def _split_verses(reading: ScriptureReading) -> Optional[list[tuple[str, list]]]:
+    """``[(verse number, pieces)]`` in reading order, or None if the
+    reading has no verse markers."""
+    para_starts = _paragraph_starts(reading)
+    prose_seen: dict[str, int] = {}
+    verses: list[tuple[str, list]] = []
+    leading: list = []              # text before the first marker
+
+    for chunk in _chunks(reading):
+        # Pieces keep their trailing whitespace, so verses that follow
+        # each other in a paragraph rejoin exactly as oremus spaced them.
+        parts = [p for p in _SPLIT_RE.split(chunk[1]) if p.strip()]
+        for i, part in enumerate(parts):
+            m = _MARKER_RE.match(part)
+            text = part.lstrip()
+            if chunk[0] == "prose":
+                starts = i == 0 and chunk[2]
+                if m:
+                    number = m.group(1)
+                    occurrence = prose_seen.get(number, 0)
+                    prose_seen[number] = occurrence + 1
+                    starts = starts or (number, occurrence) in para_starts
+                piece = ("prose", text, starts)
+            else:
+                kind = chunk[3] if i == 0 else "cont"
+                piece = ("line", text, chunk[2], kind)
+            if m:
+                verses.append((m.group(1), [piece]))
+            elif verses:
+                verses[-1][1].append(piece)
+            else:
+                leading.append(piece)
+
+    if not verses:
+        return None
+    if leading:
+        verses[0] = (verses[0][0], leading + verses[0][1])
+    return verses
+
+
+def _renumber(piece: Piece, old: str, new: str) -> Piece:
+    marker = f"\x01{old}\x01"
+    if old == new or not piece[1].startswith(marker):
+        return piece
+    return (piece[0], f"\x01{new}\x01" + piece[1][len(marker):]) + piece[2:]
+
+
+def _unknown_start(pieces: list) -> list:
+    """*pieces* with the first piece's paragraph start marked unknown."""
+    first = pieces[0]
+    if first[0] == "prose":
+        return [("prose", first[1], None)] + pieces[1:]
+    return pieces
+
+
+def _start_unknown(pieces: list) -> bool:
+    return pieces[0][0] == "prose" and pieces[0][2] is None
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class VerseStore:
+    """Cached scripture text by (book, chapter, verse label)."""
+
+    def __init__(self):
+        self._verses: dict[tuple[str, int, str], list] = {}
+        # (book, chapter) → last verse, learned from passages that ran
+        # past a chapter's end or across a chapter boundary
+        self._chapter_ends: dict[tuple[str, int], int] = {}
+
+    @classmethod
+    def from_cache(cls, cache: dict) -> "VerseStore":
+        """Index every entry of a loaded ``scripture_cache.json``."""
+        from bulletin.sources.scripture import _reading_from_cache
+
+        store = cls()
+        for ref, data in cache.items():
+            try:
+                store.add(ref, _reading_from_cache(ref, data))
+            except (KeyError, TypeError, ValueError):
+                continue        # unreadable entry — skip it
+        return store
+
+    def __contains__(self, key: tuple[str, int, str]) -> bool:
+        return key in self._verses
+
+    def __len__(self) -> int:
+        return len(self._verses)
+
+    def chapter_length(self, book: str, chapter: int) -> Optional[int]:
+        """Last verse of *chapter*, if a cached passage showed it."""
+        return self._chapter_ends.get((book, chapter))
+
+    # ------------------------------------------------------------ indexing
+
+    def add(self, reference: str, reading: ScriptureReading) -> bool:
+        """Index *reading*, fetched for *reference*.
+
+        Returns False (and indexes nothing) when the reading's verse
+        numbers can't be lined up with the reference — better to miss
+        than to file text under the wrong verse.
+        """
+        ref = parse_reference(reference)
+        verses = _split_verses(reading)
+        if verses is None:
+            return False
+
+        placed: list[tuple[VerseKey, list]] = []
+        ends: dict[int, int] = {}
+        span_i, chapter, prev = 0, ref.spans[0].start.chapter, None
+        span_first = True
+        for number, pieces in verses:
+            n = int(number)
+            # Move on to the span this verse belongs to: same chapter and
+            # ascending, a chapter rollover inside a multi-chapter span,
+            # or the start of a later span.
+            while True:
+                span = ref.spans[span_i]
+                if (prev is not None and not span_first and n > prev
+                        and (chapter < span.end.chapter
+                             or span.end.verse is None
+                             or n <= span.end.verse)):
+                    break       # next verse (or one past a gap) in this span
+                if (prev is not None and not span_first
+                        and span.end.chapter > chapter
+                        and (n == 1 or n == span.start.verse)):
+                    # Readings cached before the parser fix carry the
+                    # passage's first verse number for a mid-passage
+                    # chapter start ("53:1" came out as "13").
+                    ends[chapter] = prev
+                    chapter += 1
+                    pieces = [_renumber(p, number, "1") for p in pieces]
+                    n = 1
+                    break
+                if span_first and n == span.start.verse:
+                    chapter = span.start.chapter
+                    pieces = _unknown_start(pieces)
+                    break
+                if span_i + 1 >= len(ref.spans):
+                    return False
+                span_i += 1
+                span_first = True
+            span_first = False
+            end = span.end
+            if chapter > end.chapter or (chapter == end.chapter
+                                         and end.verse is not None
+                                         and n > end.verse):
+                return False
+            placed.append(((chapter, n), pieces))
+            prev = n
+
+        # Label partial verses the way the reference names them.
+        partial = {}
+        for span in ref.spans:
+            for point in (span.start, span.end):
+                if point.part:
+                    partial[(point.chapter, point.verse)] = point.label()
+        keyed = {(chapter, partial.get((chapter, n), str(n))): pieces
+                 for (chapter, n), pieces in placed}
+
+        # A single-chapter passage that stopped short of the verses it
+        # asked for has run past the end of the chapter.
+        last = ref.spans[-1].end
+        if (not ref.spans[-1].crosses_chapters and last.verse is not None
+                and placed and placed[-1][0][0] == last.chapter
+                and placed[-1][0][1] < last.verse):
+            ends[last.chapter] = placed[-1][0][1]
+
+        book = ref.book_key
+        for (chapter, label), pieces in keyed.items():
+            key = (book, chapter, label)
+            old = self._verses.get(key)
+            if old is None or (_start_unknown(old)
+                               and not _start_unknown(pieces)):
+                self._verses[key] = pieces
+        for chapter, last_verse in ends.items():
+            self._chapter_ends[(book, chapter)] = last_verse
+        return True
+
+    # ------------------------------------------------------------ lookup
+
+    def wanted(self, ref: Reference, chapter_length=None) -> Optional[list[VerseKey]]:
+        """The verses *ref* needs that can exist, or None if its extent
+        is unknown (a whole chapter or a chapter crossing whose length
+        hasn't been seen)."""
+        book = ref.book_key
+
+        def length(b: str, chapter: int) -> Optional[int]:
+            known = chapter_length(b, chapter) if chapter_length else None
+            return known if known is not None else self.chapter_length(b, chapter)
+
+        keys = ref.verses(length)
+        if keys is None:
+            return None
+        result = []
+        for chapter, label in keys:
+            end = length(book, chapter)
+            if end is not None and int(re.match(r"\d+", label).group()) > end:
+                continue        # past the end of the chapter
+            result.append((chapter, label))
+        return result
+
+    def missing(self, ref: Reference, chapter_length=None) -> Optional[list[VerseKey]]:
+        """The verses of *ref* not in the store (None: extent unknown)."""
+        keys = self.wanted(ref, chapter_length)
+        if keys is None:
+            return None
+        return [(c, lbl) for c, lbl in keys
+                if (ref.book_key, c, lbl) not in self._verses]
+
+    def assemble(self, reference: str, ref: Reference,
+                 chapter_length=None) -> Optional[ScriptureReading]:
+        """Build *reference* from stored verses, or None if any is missing."""
+        keys = self.wanted(ref, chapter_length)
+        if not keys or self.missing(ref, chapter_length):
+            return None
+
+        # Where each span starts, so its first verse opens a paragraph.
+        span_starts = set()
+        prev = None
+        for chapter, label in keys:
+            n = int(re.match(r"\d+", label).group())
+            if prev is None or (chapter, n) not in {(prev[0], prev[1] + 1),
+                                                    (prev[0] + 1, 1)}:
+                span_starts.add((chapter, label))
+            prev = (chapter, n)
+
+        tokens: list[tuple] = []
+        in_poetry = False
+        for chapter, label in keys:
+            pieces = self._verses[(ref.book_key, chapter, label)]
+            for i, piece in enumerate(pieces):
+                if piece[0] == "prose":
+                    _, text, starts = piece
+                    if in_poetry:
+                        tokens.append(("poetry_end", None))
+                        in_poetry = False
+                    elif starts is not False:
+                        tokens.append(("para", None))
+                    elif i == 0 and (chapter, label) in span_starts:
+                        tokens.append(("text", " "))
+                else:
+                    _, text, indent, kind = piece
+                    if in_poetry and kind == "stanza":
+                        tokens.append(("poetry_end", None))
+                        in_poetry = False
+                    if not in_poetry or kind != "cont":
+                        tokens.append(("poetry_br", indent))
+                        in_poetry = True
+                tokens.append(("text", text))
+        return _assemble_tokens(tokens, reference)
@@ -0,0 +1,207 @@
+"""
+Ranked "did you mean" suggestions for song identifiers.
+
+``lookup_song()`` answers yes or no: an identifier either matches a
+catalog entry by one of its rules or the bulletin prints a title-only
+stub. A miss is usually a song already in the catalog under other
+wording — "Here I Am Lord" for "I the Lord of Sea and Sky", a dropped
+comma, a first line instead of the title — and finding it by hand
+means scrolling songs.yaml.
+
+This module keeps a character-trigram inverted index over, for every
+entry in ``songs.yaml`` and ``hidden_springs_songs.yaml``:
+
+  - the title
+  - each of its ``identifiers:`` aliases
+  - the first lyric line
+
+``suggest_songs()`` scores each entry by the Dice coefficient between
+the query's trigrams and the best-matching of those fields, and returns
+the top few. Only the fields that share a trigram with the query are
+touched, so a query costs a few hundred dictionary updates rather than
+a pass over the catalog.
+
+The index is built on first use from the catalogs ``songs.py`` has
+loaded and is rebuilt whenever those are reloaded (``songs.clear_cache()``
+after the web UI saves a song or an alias).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from bulletin.sources import songs as _songs
+
+
+# Field weights: a title or alias hit is what the planner meant; a
+# first-line hit is nearly as good (sheets often name a hymn by it).
+_FIELD_WEIGHTS = {"title": 1.0, "identifier": 1.0, "first_line": 0.9}
+
+# Below this a "suggestion" is noise.
+MIN_SCORE = 0.3
+
+LIBRARIES = ("main", "hidden_springs")
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """One candidate for a missing song identifier."""
+    title: str
+    library: str            # "main" (songs.yaml) or "hidden_springs"
+    position: int           # index of the entry in its YAML list
+    score: float            # 0–1, weighted Dice similarity
+    matched: str            # the title, alias, or first line that matched
+    field: str              # "title", "identifier", or "first_line"
+
+
+# ---------------------------------------------------------------------------
+# Normalization
+# ---------------------------------------------------------------------------
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, punctuation folded to single spaces."""
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    """Character trigrams of *text*, padded so word edges count."""
+    padded = f"  {_normalize(text)} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _first_line(song: dict) -> Optional[str]:
+    for section in song.get("sections") or []:
+        for line in section.get("lines") or []:
+            if str(line).strip():
+                return str(line)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class SongIndex:
+    """Trigram inverted index over song titles, aliases, and first lines."""
+
+    def __init__(self, catalogs: dict[str, list[dict]]):
+        # One "field" per indexed string; postings point at field ids.
+        self._fields: list[tuple[int, str, str, int]] = []   # (entry, kind, text, n_grams)
+        self._entries: list[tuple[str, int, str]] = []       # (library, position, title)
+        self._postings: dict[str, list[int]] = {}
+
+        for library, songs in catalogs.items():
+            for position, song in enumerate(songs):
+                title = song.get("title")
+                if not title:
+                    continue
+                entry = len(self._entries)
+                self._entries.append((library, position, str(title)))
+                self._add(entry, "title", str(title))
+                for alias in song.get("identifiers") or []:
+                    self._add(entry, "identifier", str(alias))
+                line = _first_line(song)
+                if line:
+                    self._add(entry, "first_line", line)
+
+    def _add(self, entry: int, kind: str, text: str):
+        grams = _trigrams(text)
+        if not grams:
+            return
+        field_id = len(self._fields)
+        self._fields.append((entry, kind, text, len(grams)))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(field_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def suggest(self, query: str, k: int = 3, *,
+                libraries: Iterable[str] = LIBRARIES,
+                min_score: float = MIN_SCORE) -> list[Suggestion]:
+        """The *k* best-scoring entries for *query*, best first."""
+        clean = re.sub(r"^#\d+\s*", "", _songs._clean_identifier(query))
+        grams = _trigrams(clean)
+        if not grams:
+            return []
+
+        shared: dict[int, int] = {}
+        postings = self._postings
+        for gram in grams:
+            for field_id in postings.get(gram, ()):
+                shared[field_id] = shared.get(field_id, 0) + 1
+
+        wanted = set(libraries)
+        n_query = len(grams)
+        best: dict[int, tuple[float, int]] = {}      # entry → (score, field)
+        for field_id, count in shared.items():
+            entry, kind, _, n_field = self._fields[field_id]
+            score = _FIELD_WEIGHTS[kind] * 2 * count / (n_query + n_field)
+            if score < min_score:
+                continue
+            if self._entries[entry][0] not in wanted:
+                continue
+            if entry not in best or score > best[entry][0]:
+                best[entry] = (score, field_id)
+
+        # Entries repeated per service (a 9 am and an 11 am arrangement
+        # of one song) are suggested once, the earlier entry standing in.
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))
+        result: list[Suggestion] = []
+        seen: set[tuple[str, str]] = set()
+        for entry, (score, field_id) in ranked:
+            if len(result) == k:
+                break
+            library, position, title = self._entries[entry]
+            if (library, title.lower()) in seen:
+                continue
+            seen.add((library, title.lower()))
+            _, kind, text, _ = self._fields[field_id]
+            result.append(Suggestion(title=title, library=library,
+                                     position=position,
+                                     score=round(score, 3),
+                                     matched=text, field=kind))
+        return result
+
+
+# The index and the catalog lists it was built from; a reload in
+# songs.py hands out new lists, which triggers a rebuild.
+_index: Optional[SongIndex] = None
+_built_from: tuple = ()
+
+
+def get_index() -> SongIndex:
+    """The index over the currently loaded catalogs."""
+    global _index, _built_from
+    main, hs = _songs._load_all_songs(), _songs._load_hs_songs()
+    if _index is None or _built_from[0] is not main or _built_from[1] is not hs:
+        _index = SongIndex({"main": main, "hidden_springs": hs})
+        _built_from = (main, hs)
+    return _index
+
+
+def suggest_songs(query: str, k: int = 3, *,
+                  libraries: Iterable[str] = LIBRARIES) -> list[Suggestion]:
+    """Top-*k* catalog entries resembling the song identifier *query*."""
+    return get_index().suggest(query, k, libraries=libraries)
+
+
+def alias_for(identifier: str) -> str:
+    """The ``identifiers:`` entry that makes *identifier* resolve.
+
+    ``lookup_song()`` compares aliases against the identifier with its
+    parenthetical notes and H###/S### references stripped.
+    """
+    return _songs._clean_identifier(identifier)
+
+
+def clear_cache():
+    """Drop the index (it is rebuilt on next use)."""
+    global _index, _built_from
+    _index = None
+    _built_from = ()
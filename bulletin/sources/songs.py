@@ -19,7 +19,7 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from bulletin.data.bundle import load_yaml
 
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "hymns"
@@ -30,6 +30,16 @@ HS_SONGS_FILE = DATA_DIR / "hidden_springs_songs.yaml"
 _all_songs: Optional[list[dict]] = None
 _hs_songs: Optional[list[dict]] = None
 
+# Index of resolved songs: the sheets name the same songs week after
+# week (and all three Sunday bulletins look up the shared ones), so each
+# identifier is matched against the catalog once per process.
+#   (identifier, "9am"|"11am") → song dict (or None)
+_resolved: dict[tuple[str, str], Optional[dict]] = {}
+#   "9am"|"11am" → songs available to that service
+_songs_by_service: dict[str, list[dict]] = {}
+#   Hidden Springs title → hidden_springs_songs.yaml entry (or None)
+_hs_resolved: dict[str, Optional[dict]] = {}
+
 
 def _load_all_songs() -> list[dict]:
     """Load all songs from the unified YAML file."""
@@ -38,8 +48,7 @@ def _load_all_songs() -> list[dict]:
         if not SONGS_FILE.exists():
             _all_songs = []
         else:
-            with open(SONGS_FILE, encoding="utf-8") as f:
-                _all_songs = yaml.safe_load(f) or []
+            _all_songs = load_yaml(SONGS_FILE) or []
     return _all_songs
 
 
@@ -65,11 +74,13 @@ def _get_songs(service: str = "9am") -> list[dict]:
       - Its 'services' field matches the requested service
     """
     service = _normalize_service(service)
-    all_songs = _load_all_songs()
-    return [
-        s for s in all_songs
-        if "services" not in s or s["services"] == service
-    ]
+    songs = _songs_by_service.get(service)
+    if songs is None:
+        songs = _songs_by_service[service] = [
+            s for s in _load_all_songs()
+            if "services" not in s or s["services"] == service
+        ]
+    return songs
 
 
 def _hint_matches(song_title: str, hint_lower: str) -> bool:
@@ -99,8 +110,7 @@ def _clean_identifier(identifier: str) -> str:
     return clean.strip()
 
 
-def lookup_song(identifier: str, service: str = "9am",
-                _in_fallback: bool = False) -> Optional[dict]:
+def lookup_song(identifier: str, service: str = "9am") -> Optional[dict]:
     """Look up a song by various identifier formats.
 
     The identifier may be:
@@ -112,8 +122,22 @@ def lookup_song(identifier: str, service: str = "9am",
       - A partial title match
 
     Returns a song dict with keys: title, hymnal_number, hymnal_name,
-    tune_name, sections. Returns None if not found.
+    tune_name, sections. Returns None if not found. Results (including
+    misses) are remembered until ``clear_cache()``.
     """
+    key = (identifier, _normalize_service(service))
+    try:
+        return _resolved[key]
+    except KeyError:
+        pass
+    song = _match_song(identifier, service)
+    _resolved[key] = song
+    return song
+
+
+def _match_song(identifier: str, service: str,
+                _in_fallback: bool = False) -> Optional[dict]:
+    """Search the catalog for *identifier* (see ``lookup_song``)."""
     songs = _get_songs(service)
 
     # Try to extract hymnal number from identifier
@@ -247,7 +271,7 @@ def lookup_song(identifier: str, service: str = "9am",
     if not _in_fallback:
         svc = _normalize_service(service)
         fallback = "9am" if svc == "11am" else "11am"
-        result = lookup_song(identifier, service=fallback, _in_fallback=True)
+        result = _match_song(identifier, service=fallback, _in_fallback=True)
         if result:
             return result
 
@@ -259,6 +283,9 @@ def clear_cache():
     global _all_songs, _hs_songs
     _all_songs = None
     _hs_songs = None
+    _resolved.clear()
+    _songs_by_service.clear()
+    _hs_resolved.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -272,8 +299,7 @@ def _load_hs_songs() -> list[dict]:
         if not HS_SONGS_FILE.exists():
             _hs_songs = []
         else:
-            with open(HS_SONGS_FILE, encoding="utf-8") as f:
-                _hs_songs = yaml.safe_load(f) or []
+            _hs_songs = load_yaml(HS_SONGS_FILE) or []
     return _hs_songs
 
 
@@ -388,8 +414,10 @@ def hs_lookup_song(identifier: str) -> Optional[dict]:
         return None
 
     # Search HS catalog first
-    hs_catalog = _load_hs_songs()
-    song = _match_in_catalog(title, hs_catalog)
+    if title in _hs_resolved:
+        song = _hs_resolved[title]
+    else:
+        song = _hs_resolved[title] = _match_in_catalog(title, _load_hs_songs())
 
     if song:
         # Return a copy with HS metadata attached
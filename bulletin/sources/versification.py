@@ -0,0 +1,125 @@
+"""
+NRSV versification: how many chapters each book has and how many
+verses each chapter has.
+
+The oremus fetch is where a planning-sheet typo used to surface —
+"Acts 2:1-50" came back with 47 verses and the range check warned
+after the fact (``_check_verse_range()`` in ``scripture.py``). With the
+chapter lengths on hand the same typo is visible from the reference
+alone, so a whole year of Liturgical Schedule and Hidden Springs rows
+can be checked in one pass without the network
+(``runner.check_references()``, ``generate.py --check --refs-only``).
+
+The table lives in ``data/versification.yaml``: 66 books plus the
+Apocrypha, each a list of verse counts by chapter, and a list of other
+spellings ("Psalm", "Song of Songs", "Ecclesiasticus", "1 Cor").
+It's loaded once into a dict keyed by normalized book name, so
+``last_verse()`` is a dict lookup and a tuple index.
+
+``last_verse()`` has the ``ChapterLength`` signature from
+``scripture_refs.py``, which lets the verse store expand whole-chapter
+and chapter-crossing references before anything is fetched.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from bulletin.data.bundle import load_yaml
+from bulletin.sources.scripture_refs import parse_reference
+
+_VERSIFICATION_PATH = Path(__file__).parent.parent / "data" / "versification.yaml"
+
+
+def _book_key(book: str) -> str:
+    """Lowercase, dots dropped, "1cor" spaced like "1 cor"."""
+    key = " ".join(book.lower().replace(".", "").split())
+    return re.sub(r"^([1-4])(?=[a-z])", r"\1 ", key)
+
+
+@lru_cache(maxsize=1)
+def _load() -> tuple[dict[str, tuple[int, ...]], dict[str, str]]:
+    """(book name → verse counts, normalized spelling → book name)."""
+    data = load_yaml(_VERSIFICATION_PATH)
+    chapters: dict[str, tuple[int, ...]] = {}
+    names: dict[str, str] = {}
+    for name, counts in data["books"].items():
+        chapters[name] = tuple(counts)
+        names[_book_key(name)] = name
+    for alias, name in (data.get("aliases") or {}).items():
+        names[_book_key(str(alias))] = name
+    return chapters, names
+
+
+# ---------------------------------------------------------------------------
+# Lookups
+# ---------------------------------------------------------------------------
+
+def book_name(book: str) -> Optional[str]:
+    """The table's name for *book* ("Psalm" → "Psalms"), or None."""
+    return _load()[1].get(_book_key(book))
+
+
+def chapter_count(book: str) -> Optional[int]:
+    """How many chapters *book* has, or None for an unknown book."""
+    chapters, names = _load()
+    name = names.get(_book_key(book))
+    return len(chapters[name]) if name else None
+
+
+def last_verse(book: str, chapter: int) -> Optional[int]:
+    """The last verse of *book* *chapter*, or None if there's no such
+    chapter."""
+    chapters, names = _load()
+    name = names.get(_book_key(book))
+    if name is None or not 1 <= chapter <= len(chapters[name]):
+        return None
+    return chapters[name][chapter - 1]
+
+
+# ---------------------------------------------------------------------------
+# Reference checks
+# ---------------------------------------------------------------------------
+
+def reference_problems(reference: str) -> list[str]:
+    """What's wrong with *reference* by the table; empty if nothing.
+
+    Checks that the book exists and that every chapter and verse the
+    reference names is inside it:
+
+        "Acts 2:1-50"       -> ["Acts 2 has only 47 verses"]
+        "Jude 2:1-4"        -> ["Jude has only 1 chapter"]
+        "Hezekiah 1:1"      -> ["Unknown book 'Hezekiah'"]
+    """
+    try:
+        ref = parse_reference(reference)
+    except ValueError:
+        return [f"Can't read {reference.strip()!r} as a scripture reference"]
+    chapters, names = _load()
+    name = names.get(_book_key(ref.book))
+    if name is None:
+        return [f"Unknown book {ref.book!r}"]
+
+    counts = chapters[name]
+    problems: list[str] = []
+    for span in ref.spans:
+        for point in (span.start, span.end):
+            if not 1 <= point.chapter <= len(counts):
+                plural = "chapter" if len(counts) == 1 else "chapters"
+                problem = f"{name} has only {len(counts)} {plural}"
+            elif point.verse is not None and point.verse > counts[point.chapter - 1]:
+                problem = (f"{name} {point.chapter} has only "
+                           f"{counts[point.chapter - 1]} verses")
+            else:
+                continue
+            if problem not in problems:
+                problems.append(problem)
+    return problems
+
+
+def clear_cache():
+    """Drop the loaded table (after editing versification.yaml)."""
+    _load.cache_clear()
@@ -0,0 +1,77 @@
+"""AAC upload bundles: only files the ledger hasn't seen go in the zip,
+recognised by content rather than name.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_aac_bundle.py -v
+"""
+
+from __future__ import annotations
+
+import zipfile
+
+
+def _library(tmp_path):
+    library = tmp_path / "aac"
+    (library / "Hymnal 1982").mkdir(parents=True)
+    (library / "Other").mkdir()
+    (library / "Hymnal 1982" / "362 - Holy, holy, holy.m4a").write_bytes(b"362" * 1000)
+    (library / "Other" / "Amazing Grace.m4a").write_bytes(b"grace" * 1000)
+    return library
+
+
+def test_second_week_bundles_only_new_files(tmp_path):
+    from bulletin.aac_bundle import NO_FILE, build_aac_bundle
+    from bulletin.report import RunReport
+
+    library = _library(tmp_path)
+    out = tmp_path / "output"
+    week1 = [("Processional", "Hymnal 1982/362 - Holy, holy, holy.m4a"),
+             ("Recessional", "Hymnal 1982/362 - Holy, holy, holy.m4a"),
+             ("Sequence", NO_FILE)]
+    first = build_aac_bundle([week1], out / "week1.zip", library=library)
+
+    assert first.added == ["Hymnal 1982/362 - Holy, holy, holy.m4a"]
+    with zipfile.ZipFile(first.path) as zf:
+        assert zf.namelist() == ["Hymnal 1982/362 - Holy, holy, holy.m4a"]
+        assert zf.read(zf.namelist()[0]) == b"362" * 1000
+
+    # The same recording under another name counts as uploaded.
+    (library / "Other" / "Holy (copy).m4a").write_bytes(b"362" * 1000)
+    week2 = [("Processional", "Other/Holy (copy).m4a"),
+             ("Recessional", "Other/Amazing Grace.m4a"),
+             ("Prelude", "Other/Not synced.m4a")]
+    report1, report2 = RunReport(), RunReport()
+    second = build_aac_bundle([week1, week2], out / "week2.zip",
+                              library=library, reports=[report1, report2])
+
+    assert second.added == ["Other/Amazing Grace.m4a"]
+    assert second.uploaded == ["Hymnal 1982/362 - Holy, holy, holy.m4a",
+                               "Other/Holy (copy).m4a"]
+    assert second.missing == ["Other/Not synced.m4a"]
+    assert not report1.items                # warned on its own date only
+    assert [i.category for i in report2.items] == ["aac"]
+
+    third = build_aac_bundle([week2], out / "week3.zip", library=library)
+    assert third.path is None and not (out / "week3.zip").exists()
+
+
+def test_rerun_keeps_the_earlier_bundle(tmp_path):
+    from bulletin.aac_bundle import build_aac_bundle
+
+    library = _library(tmp_path)
+    out = tmp_path / "output"
+    name = out / "2026-05-06 - Hidden Springs AAC.zip"
+    first = build_aac_bundle(
+        [[("Processional", "Other/Amazing Grace.m4a")]], name, library=library)
+
+    second = build_aac_bundle(
+        [[("Processional", "Other/Amazing Grace.m4a"),
+          ("Recessional", "Hymnal 1982/362 - Holy, holy, holy.m4a")]],
+        name, library=library)
+
+    assert first.path == name
+    assert second.path == out / "2026-05-06 - Hidden Springs AAC (2).zip"
+    with zipfile.ZipFile(first.path) as zf:
+        assert zf.namelist() == ["Other/Amazing Grace.m4a"]
+    assert second.added == ["Hymnal 1982/362 - Holy, holy, holy.m4a"]
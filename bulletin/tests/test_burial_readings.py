@@ -0,0 +1,52 @@
+"""Burial-office readings: prefetching the whole menu, and telling whether a
+funeral's readings can be produced without network.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_burial_readings.py -v
+"""
+
+from __future__ import annotations
+
+_MENU = {
+    "old_testament": ["Isaiah 25:6-9"],
+    "psalms": ["Psalm 23", "Psalm 999"],
+    "new_testament": ["Romans 8:14-19, 34-35, 37-39"],
+    "gospels": ["John 6:37-40"],
+}
+
+
+def test_prefetch_fetches_every_lesson_and_checks_every_psalm(monkeypatch):
+    import bulletin.sources.burial_readings as br
+
+    calls = []
+    monkeypatch.setattr(br, "load_burial_readings", lambda: _MENU)
+    monkeypatch.setattr(
+        br, "fetch_readings",
+        lambda readings, force_fetch=False, report=None:
+            calls.append((readings, force_fetch)))
+
+    report = br.prefetch_burial_readings(force_fetch=True,
+                                         progress_fn=lambda line: None)
+
+    assert calls == [({"Isaiah 25:6-9": "Isaiah 25:6-9",
+                       "Romans 8:14-19, 34-35, 37-39":
+                           "Romans 8:14-19, 34-35, 37-39",
+                       "John 6:37-40": "John 6:37-40"}, True)]
+    assert [(i.severity, i.message) for i in report.items] == [
+        ("blocker", "Psalm not found in the psalter: Psalm 999")]
+
+
+def test_check_readings_offline(monkeypatch):
+    import bulletin.sources.burial_readings as br
+
+    monkeypatch.setattr(br, "is_cached", lambda ref: ref == "John 6:37-40")
+
+    assert br.check_readings_offline(
+        {"psalm": "Psalm 23", "gospel": "John 6:37-40"}) == []
+    assert br.check_readings_offline({
+        "psalm": "Psalm 23:1-40",           # runs past the psalm's end
+        "first": "Isaiah 25:6-9",
+        "gospel": "John 6:37-40",
+    }) == ["Psalm 23:1-40", "Isaiah 25:6-9"]
+    assert br.check_readings_offline({"psalm": "Psalm 999"}) == ["Psalm 999"]
@@ -0,0 +1,77 @@
+"""Check mode: fetch and resolve upcoming dates from one sheet snapshot,
+without building anything.
+
+The sheets and the 9 am grid are replaced with hand-made rows; the
+readings used are in the scripture cache, so no network is needed.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_check.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+_EASTER_2 = date(2026, 4, 12)
+
+
+def _snapshot(**schedule_changes):
+    import dataclasses
+
+    from bulletin.sources.google_sheet import (
+        ClergyRotaRow, LiturgicalScheduleRow, ServiceMusicRow, SheetSnapshot,
+    )
+
+    title = "Second Sunday of Easter"
+    schedule = LiturgicalScheduleRow(
+        service_type="Sunday", date=_EASTER_2, title=title, proper="-",
+        color="White", eucharistic_prayer="A", preface="",
+        reading="Acts 2:14a, 22-32", psalm="Psalm 16 responsively",
+        gospel="John 20:19-31", pop_form="I", special_blessing="",
+        closing_prayer="Almighty", dismissal="2", notes="")
+    clergy = ClergyRotaRow(
+        service_type="Sunday", date=_EASTER_2, title=title,
+        preacher_9am="Andrew", preacher_11am="Logan", preacher_8am="Gene")
+    music = ServiceMusicRow(
+        service_type="Sunday", date=_EASTER_2, title=title,
+        processional="#207 Jesus Christ is risen today",
+        song_of_praise="#S280", sequence="#193", anthem="Some anthem",
+        communion="#305; #306", recessional="#208")
+    return SheetSnapshot(
+        schedule=[dataclasses.replace(schedule, **schedule_changes)],
+        clergy=[clergy], music=[music])
+
+
+def _offline(monkeypatch, snapshot):
+    import bulletin.runner as runner
+
+    monkeypatch.setattr(runner, "fetch_sheet_snapshot", lambda: snapshot)
+    monkeypatch.setattr(runner, "fetch_9am_music",
+                        lambda d, force_fetch=False: None)
+
+
+def test_unknown_pop_form_is_reported_once(monkeypatch):
+    from bulletin.runner import check_upcoming
+
+    _offline(monkeypatch, _snapshot(pop_form="Bogus"))
+    checks = check_upcoming(date(2026, 4, 10), 1,
+                            progress_fn=lambda line: None)
+
+    assert [c.target_date for c in checks] == [_EASTER_2]
+    check = checks[0]
+    assert check.title == "Second Sunday of Easter"
+    assert "9 am" in check.services and "11 am" in check.services
+    pop = [i for i in check.report.items if i.category == "pop_form"]
+    assert len(pop) == 1
+    assert pop[0].severity == "warning"
+    assert "Bogus" in pop[0].message
+
+
+def test_date_missing_from_sheet_is_a_blocker():
+    from bulletin.runner import check_date
+
+    check = check_date(date(2026, 4, 19), snapshot=_snapshot())
+
+    assert check.services == []
+    assert [i.category for i in check.report.by_severity("blocker")] == ["sheet"]
@@ -0,0 +1,68 @@
+"""Sanity checks for the precomputed church calendar.
+
+The calendar replaces several title/date heuristics (the Proper anchor
+scan, the year % 3 lectionary letter), so these tests pin the dates
+that used to be computed ad hoc and the Advent rollover that wasn't.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_church_calendar.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+
+def test_easter_dates():
+    from bulletin.logic.church_calendar import easter_date
+
+    assert easter_date(2024) == date(2024, 3, 31)
+    assert easter_date(2025) == date(2025, 4, 20)
+    assert easter_date(2026) == date(2026, 4, 5)
+    assert easter_date(2027) == date(2027, 3, 28)
+
+
+def test_lectionary_year_rolls_over_at_advent():
+    from bulletin.logic.church_calendar import lectionary_year
+
+    # Church year 2026 (Year A) begins on Advent 1, November 30, 2025.
+    assert lectionary_year(date(2025, 11, 23)) == "C"
+    assert lectionary_year(date(2025, 11, 30)) == "A"
+    assert lectionary_year(date(2026, 4, 5)) == "A"
+    assert lectionary_year(date(2026, 11, 29)) == "B"
+
+
+def test_named_sundays():
+    from bulletin.logic.church_calendar import lookup
+
+    palm = lookup(date(2026, 3, 29))
+    assert palm.special_service == "palm_sunday"
+    assert palm.season == "lent"
+
+    easter_2 = lookup(date(2026, 4, 12))
+    assert easter_2.title == "Second Sunday of Easter"
+    assert easter_2.preface_key == "easter"
+
+    pentecost_8 = lookup(date(2026, 7, 19))
+    assert pentecost_8.season == "ordinary"
+    assert pentecost_8.proper == 12
+    assert pentecost_8.collect_key == "Proper 12"
+
+
+def test_proper_from_date_matches_linear_scan():
+    """The bisect lookup must agree with the original closest-anchor scan."""
+    from bulletin.sources.collects import _PROPER_ANCHORS, proper_from_date
+
+    def linear(target: date) -> int:
+        best, best_distance = None, None
+        for proper_num, (month, day) in _PROPER_ANCHORS.items():
+            distance = abs((target - date(target.year, month, day)).days)
+            if best_distance is None or distance < best_distance:
+                best, best_distance = proper_num, distance
+        return best
+
+    d = date(2024, 1, 1)
+    while d < date(2028, 1, 1):
+        assert proper_from_date(d) == linear(d), d
+        d += timedelta(days=1)
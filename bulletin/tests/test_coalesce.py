@@ -0,0 +1,64 @@
+"""Check that run coalescing shrinks the XML without changing the text
+or its formatting.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_coalesce.py -v
+"""
+
+from __future__ import annotations
+
+
+def _formatted_chars(doc):
+    """Every paragraph as a list of (rPr XML, character) pairs."""
+    from docx.oxml.ns import qn
+    from lxml import etree
+
+    paragraphs = []
+    for p in doc.element.body.iter(qn("w:p")):
+        chars = []
+        for r in p.findall(qn("w:r")):
+            rpr = r.find(qn("w:rPr"))
+            key = etree.tostring(rpr) if rpr is not None else b""
+            for child in r:
+                if child.tag == qn("w:t"):
+                    chars.extend((key, c) for c in child.text or "")
+                elif child.tag == qn("w:tab"):
+                    chars.append((key, "\t"))
+                elif child.tag == qn("w:br"):
+                    chars.append((key, "\n"))
+        paragraphs.append(chars)
+    return paragraphs
+
+
+def test_coalesce_preserves_formatted_text():
+    from bulletin.document.coalesce import coalesce_runs
+    from bulletin.document.formatting import (
+        _add_text_runs, add_body, add_scripture_text,
+    )
+    from bulletin.document.styles import create_document
+
+    doc = create_document()
+    add_scripture_text(
+        doc, "\x011\x01 The LORD is my shepherd; I shall not want. "
+             "\x012\x01 The LORD makes me lie down in green pastures")
+    p = doc.add_paragraph(style="Body")
+    for phrase in ("O come, ", "let us sing ", "to the ", "LORD"):
+        _add_text_runs(p, phrase, bold=True)
+    # What _replace_in_paragraph leaves behind on the cover.
+    p = doc.add_paragraph(style="Body")
+    p.add_run("Second Sunday of Easter")
+    p.add_run("")
+    p.add_run("").text = ""
+    add_body(doc, "In the Name of the Father ✠ and of the Son")
+
+    before = _formatted_chars(doc)
+    stats = coalesce_runs(doc)
+
+    assert _formatted_chars(doc) == before
+    assert stats.runs_after < stats.runs_before
+    assert stats.xml_bytes_after < stats.xml_bytes_before
+    # "O come, let us sing to the " collapses into one bold run.
+    bold_p = doc.paragraphs[-3]
+    assert [r.text for r in bold_p.runs] == ["O come, let us sing to the ", "Lord"]
+    assert [r.text for r in doc.paragraphs[-2].runs] == ["Second Sunday of Easter"]
@@ -0,0 +1,111 @@
+"""Replay liturgical titles through the indexed ``get_collect`` and the
+original linear-scan implementation and require identical answers.
+
+The Liturgical Schedule itself lives in a Google Sheet, so the titles
+replayed here are the ones the sheet uses: every named day the church
+calendar produces for several years, every collects.yaml key in a few
+spellings, and the free-form variants the planners have typed in.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_collect_index.py -v
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+
+
+def _get_collect_linear(liturgical_title, target_date=None):
+    """``get_collect`` as it was before the index (steps 1-3b, then 4)."""
+    from bulletin.logic.church_calendar import lookup
+    from bulletin.sources.collects import _load_collects, proper_from_date
+
+    collects = _load_collects()
+    title = liturgical_title.strip()
+    if title in collects:
+        return collects[title]
+    title_lower = title.lower()
+    for key, val in collects.items():
+        if key.lower() == title_lower:
+            return val
+    for key, val in collects.items():
+        if title_lower in key.lower() or key.lower() in title_lower:
+            return val
+    parts = re.split(r',?\s+or\s+', title_lower)
+    for alt in [p.strip() for p in parts if p.strip()]:
+        matches = []
+        for key, val in collects.items():
+            kl = key.lower()
+            if alt in kl or kl in alt:
+                matches.append((key, val))
+        if matches:
+            for key, val in matches:
+                if "principal" in key.lower():
+                    return val
+            return matches[0][1]
+    if target_date is not None:
+        calendar_key = lookup(target_date).collect_key
+        if calendar_key and calendar_key in collects:
+            return collects[calendar_key]
+        proper_num = proper_from_date(target_date)
+        if proper_num is not None and f"Proper {proper_num}" in collects:
+            return collects[f"Proper {proper_num}"]
+    return None
+
+
+_SHEET_TITLES = [
+    "The Sunday of the Resurrection, or Easter Day",
+    "Easter Day",
+    "Easter Vigil",
+    "Palm Sunday",
+    "Pentecost",
+    "Whitsunday",
+    "Christ the King",
+    "All Saints' Sunday",
+    "Celebration Sunday",
+    "Lent 3",
+    "Proper 15",
+    "Baptism of Our Lord",
+    "Christmas Eve",
+    "The Feast of the Holy Name, or New Year's Day",
+    "Ash Wednesday, or the First Day of Lent",
+    "or",
+    "",
+    "ad",
+]
+
+
+def _titles():
+    from bulletin.logic.church_calendar import church_year
+    from bulletin.sources.collects import _load_collects
+
+    titles = list(_SHEET_TITLES)
+    for year in range(2024, 2030):
+        titles.extend(d.title for d in church_year(year).days.values() if d.title)
+    for key in _load_collects():
+        titles.extend([key, key.upper(), f"  {key.lower()}  ",
+                       f"The {key}", key[: len(key) // 2]])
+    return titles
+
+
+def test_indexed_lookup_matches_linear_scan():
+    from bulletin.sources.collects import get_collect
+
+    for title in _titles():
+        assert get_collect(title) == _get_collect_linear(title), title
+
+
+def test_date_fallback_matches_linear_scan():
+    from bulletin.logic.church_calendar import church_year
+    from bulletin.sources.collects import get_collect
+
+    for day in church_year(2026).sundays():
+        for title in (day.title, "Celebration Sunday"):
+            assert (get_collect(title, day.date)
+                    == _get_collect_linear(title, day.date)), (title, day.date)
+
+    # The Principal Service preference for Easter Day.
+    assert get_collect("The Sunday of the Resurrection, or Easter Day",
+                       date(2026, 4, 5)) is not None
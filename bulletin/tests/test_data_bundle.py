@@ -0,0 +1,65 @@
+"""Compiled data bundle: fresh files come from the bundle, edited or new
+files from YAML.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_data_bundle.py -v
+"""
+
+from __future__ import annotations
+
+
+def _data_dir(monkeypatch, tmp_path):
+    import bulletin.data.bundle as bundle
+
+    data = tmp_path / "data"
+    (data / "prayers").mkdir(parents=True)
+    (data / "staff.yaml").write_text("rector: Andrew\n", encoding="utf-8")
+    (data / "prayers" / "forms.yaml").write_text("I: [a, b]\n", encoding="utf-8")
+    monkeypatch.setattr(bundle, "_DATA_DIR", data)
+    monkeypatch.setattr(bundle, "BUNDLE_PATH", data / "compiled_data.pickle")
+    bundle.clear_cache()
+    monkeypatch.setattr(bundle, "_parse", _counting(bundle._parse))
+    return bundle, data
+
+
+def _counting(parse):
+    def wrapper(text):
+        wrapper.calls += 1
+        return parse(text)
+    wrapper.calls = 0
+    return wrapper
+
+
+def test_fresh_files_come_from_the_bundle(monkeypatch, tmp_path):
+    bundle, data = _data_dir(monkeypatch, tmp_path)
+
+    assert bundle.compile_bundle() == 2
+    parsed = bundle._parse.calls
+
+    first = bundle.load_yaml(data / "prayers" / "forms.yaml")
+    assert first == {"I": ["a", "b"]}
+    assert bundle.load_yaml(data / "staff.yaml") == {"rector": "Andrew"}
+    assert bundle._parse.calls == parsed
+
+    # Each call gets its own objects, as from YAML.
+    first["I"].append("c")
+    assert bundle.load_yaml(data / "prayers" / "forms.yaml") == {"I": ["a", "b"]}
+
+
+def test_edited_and_new_files_fall_back_to_yaml(monkeypatch, tmp_path):
+    bundle, data = _data_dir(monkeypatch, tmp_path)
+    bundle.compile_bundle()
+
+    (data / "staff.yaml").write_text("rector: Logan\n", encoding="utf-8")
+    (data / "new.yaml").write_text("x: 1\n", encoding="utf-8")
+
+    assert bundle.load_yaml(data / "staff.yaml") == {"rector": "Logan"}
+    assert bundle.load_yaml(data / "new.yaml") == {"x": 1}
+
+
+def test_no_bundle_reads_yaml(monkeypatch, tmp_path):
+    bundle, data = _data_dir(monkeypatch, tmp_path)
+
+    assert bundle.load_yaml(data / "staff.yaml") == {"rector": "Andrew"}
+    assert bundle._parse.calls == 1
@@ -0,0 +1,50 @@
+"""Check the reverse dependency index behind ``generate.py --stale``.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_dependencies.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+def _write(output_dir, name, target, dependencies):
+    from bulletin.fingerprint import write_manifest
+
+    path = output_dir / name
+    path.write_bytes(b"")
+    write_manifest(path, {"target_date": target, "service": "11 am",
+                          "dependencies": dependencies})
+    return path
+
+
+def test_find_stale_reports_only_changed_keys(tmp_path):
+    from bulletin.dependencies import current_digest, find_stale, load_index
+
+    key = "template:back_cover.docx"
+    fresh = _write(tmp_path, "fresh.docx", "2026-11-01",
+                   {key: current_digest(key)})
+    _write(tmp_path, "stale.docx", "2026-11-01", {key: "0" * 64})
+    _write(tmp_path, "past.docx", "2026-01-04", {key: "0" * 64})
+
+    assert sorted(load_index(tmp_path)[key]) == [
+        "fresh.docx", "past.docx", "stale.docx"]
+
+    stale = find_stale(tmp_path, since=date(2026, 10, 1))
+    assert [s.output_path.name for s in stale] == ["stale.docx"]
+    assert stale[0].changed_keys == [key]
+    assert stale[0].target_date == date(2026, 11, 1)
+
+    # An edit to songs.yaml can't affect a template dependency.
+    assert find_stale(tmp_path, ["bulletin/data/hymns/songs.yaml"]) == []
+    assert fresh.exists()
+
+
+def test_kinds_for_file():
+    from bulletin.dependencies import kinds_for_file
+
+    assert kinds_for_file("bulletin/data/hymns/songs.yaml") == ("song",)
+    assert kinds_for_file("templates/front_cover.docx") == ("template",)
+    assert kinds_for_file("bulletin/data/bcp_texts/creeds.yaml") == ()
@@ -0,0 +1,51 @@
+"""Check that deterministic saving gives identical bytes for identical
+builds.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_deterministic.py -v
+"""
+
+from __future__ import annotations
+
+
+def _build():
+    from bulletin.document.formatting import add_body, add_heading
+    from bulletin.document.styles import configure_document
+    from bulletin.document.templates import append_back_cover, load_front_cover
+
+    doc = load_front_cover("April 12, 2026", "9 am",
+                           "Second Sunday of Easter")
+    configure_document(doc)
+    add_heading(doc, "The Word of God")
+    add_body(doc, "Alleluia. Christ is risen.")
+    append_back_cover(doc)
+    return doc
+
+
+def test_two_builds_are_byte_identical():
+    import io
+    import re
+    import zipfile
+    from datetime import datetime
+
+    from bulletin.document.deterministic import deterministic_bytes
+
+    stamp = datetime(2026, 4, 12)
+    first = deterministic_bytes(_build(), stamp)
+    second = deterministic_bytes(_build(), stamp)
+    assert first == second
+
+    with zipfile.ZipFile(io.BytesIO(first)) as z:
+        names = z.namelist()
+        assert names[:2] == ["[Content_Types].xml", "_rels/.rels"]
+        assert names[2:] == sorted(names[2:])
+        assert {i.date_time for i in z.infolist()} == {(2026, 4, 12, 0, 0, 0)}
+
+        core = z.read("docProps/core.xml").decode()
+        assert "2026-04-12T00:00:00Z" in core
+        assert "lastPrinted" not in core
+
+        # Front and back cover drawings no longer share template IDs.
+        ids = re.findall(r'docPr id="(\d+)"', z.read("word/document.xml").decode())
+        assert ids == [str(n) for n in range(1, len(ids) + 1)]
@@ -0,0 +1,73 @@
+"""Check that the low-level emitter writes the same XML as python-docx.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_emitter.py -v
+"""
+
+from __future__ import annotations
+
+from lxml import etree
+
+
+def _emit_everything(doc, emit_paragraph, append_runs):
+    from bulletin.config import FONT_BODY_BOLD
+    from bulletin.document.emitter import ITALIC, PLAIN, RunFormat
+
+    bold = RunFormat(font=FONT_BODY_BOLD, bold=True)
+    emit_paragraph(doc, "Spacer - Small")
+    emit_paragraph(doc, "Heading 2", [("The Peace", PLAIN)])
+    emit_paragraph(doc, "Body - Dialogue",
+                   [("People\tAnd also with you.", RunFormat(style="People"))])
+    p = emit_paragraph(doc, "Body", [(" leading and trailing ", PLAIN),
+                                     ("Amen.", bold)])
+    append_runs(p, [("Lord", RunFormat(small_caps=True)),
+                    ("12 ", RunFormat(size=9, superscript=True)),
+                    ("one\ntwo\r\tthree", ITALIC),
+                    ("", PLAIN),
+                    ("Lord", RunFormat(font=FONT_BODY_BOLD, bold=True,
+                                       small_caps=True))])
+    emit_paragraph(doc, "Normal", [("default style", PLAIN)])
+
+    cell = doc.add_table(rows=1, cols=1).cell(0, 0)
+    emit_paragraph(cell, "Body - Lyrics", [("Amazing grace!", PLAIN)])
+    emit_paragraph(cell, "Body - Lyrics", [("How sweet the sound", ITALIC)])
+
+
+def test_emitter_matches_python_docx():
+    from bulletin.document import emitter
+    from bulletin.document.styles import create_document
+
+    fast = create_document()
+    _emit_everything(fast, emitter.emit_paragraph, emitter.append_runs)
+    reference = create_document()
+    _emit_everything(reference, emitter._reference_emit_paragraph,
+                     emitter._reference_append_runs)
+
+    assert etree.tostring(fast.element) == etree.tostring(reference.element)
+
+
+def test_formatting_helpers_match_python_docx(monkeypatch):
+    from bulletin.document import emitter, formatting
+    from bulletin.document.styles import create_document
+
+    def render(doc):
+        formatting.add_heading(doc, "The Word of God")
+        formatting.add_introductory_rubric(doc, "Please stand.")
+        formatting.add_body(doc, "Bless the Lord ✠ who forgives all our sins.")
+        formatting.add_dialogue(doc, "The Lord be with you.", "And also with you.")
+        formatting.add_body_with_bold_ending(doc, "Through Christ our Lord. ", "Amen.")
+        formatting.add_scripture_text(
+            doc, "\x011\x01 The LORD is my shepherd;\n\n\x012\x01 he makes me lie down")
+        formatting.add_lyric_chorus(doc, ["Alleluia!"])
+
+    fast = create_document()
+    render(fast)
+    monkeypatch.setattr(formatting, "emit_paragraph",
+                        emitter._reference_emit_paragraph)
+    monkeypatch.setattr(formatting, "append_runs",
+                        emitter._reference_append_runs)
+    reference = create_document()
+    render(reference)
+
+    assert etree.tostring(fast.element) == etree.tostring(reference.element)
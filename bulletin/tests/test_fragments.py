@@ -0,0 +1,70 @@
+"""Check that spliced BCP fragments are identical to a fresh rendering.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_fragments.py -v
+"""
+
+from __future__ import annotations
+
+from lxml import etree
+
+
+def _render_static_blocks(doc):
+    from bulletin.data.loader import load_common_prayers, load_great_litany
+    from bulletin.document.fragments import cached_block
+    from bulletin.document.sections.holy_communion import (
+        add_agnus_dei_spoken, add_lords_prayer, add_sanctus_spoken,
+        add_sanctus_text,
+    )
+    from bulletin.document.sections.word_of_god import (
+        add_confession, add_nicene_creed, add_pop,
+    )
+
+    prayers = load_common_prayers()
+    add_nicene_creed(doc, prayers)
+    add_confession(doc, prayers)
+    add_sanctus_text(doc, prayers["sanctus"])
+    add_sanctus_spoken(doc, prayers["sanctus"])
+    add_lords_prayer(doc, prayers)
+    add_agnus_dei_spoken(doc)
+    litany = load_great_litany().get("elements", [])
+    cached_block(doc, "great_litany", litany, lambda d: add_pop(d, litany))
+
+
+def _body_xml(doc) -> bytes:
+    return etree.tostring(doc.element.body)
+
+
+def test_spliced_fragments_match_fresh_render():
+    from bulletin.document import fragments
+    from bulletin.document.styles import create_document
+
+    fragments.clear_cache()
+    first = create_document()
+    _render_static_blocks(first)
+    hits, misses, held = fragments.cache_info()
+    assert hits == 0 and misses == held == 7
+
+    second = create_document()
+    _render_static_blocks(second)
+    hits, misses, _ = fragments.cache_info()
+    assert hits == 7 and misses == 7
+
+    assert _body_xml(first) == _body_xml(second)
+
+
+def test_style_sets_get_their_own_fragments():
+    from bulletin.data.loader import load_common_prayers
+    from bulletin.document import fragments
+    from bulletin.document.sections.word_of_god import add_nicene_creed
+    from docx import Document
+    from bulletin.document.styles import configure_lp_document, create_document
+
+    fragments.clear_cache()
+    prayers = load_common_prayers()
+    add_nicene_creed(create_document(), prayers)
+    large_print = Document()
+    configure_lp_document(large_print)
+    add_nicene_creed(large_print, prayers)
+    assert fragments.cache_info() == (0, 2, 2)
@@ -0,0 +1,75 @@
+"""Hidden Springs month mode: one planner download, indexed by date,
+shared by every bulletin in the range.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_hidden_springs_batch.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+
+def _row(d, title="Wednesday"):
+    from bulletin.sources.google_sheet import HiddenSpringsRow
+
+    return HiddenSpringsRow(
+        service_type="LOW", date=d, title=title, proper="", color="",
+        eucharistic_prayer="", preface="", reading="", psalm="", gospel="",
+        pop_form="", special_blessing="", closing_prayer="", dismissal="")
+
+
+def _planner():
+    from bulletin.sources.google_sheet import HiddenSpringsPlanner
+
+    # File order isn't date order; an undated row is ignored.
+    return HiddenSpringsPlanner([
+        _row(date(2026, 5, 20)), _row(date(2026, 5, 6), "first"),
+        _row(None), _row(date(2026, 6, 3)), _row(date(2026, 5, 6), "second"),
+        _row(date(2026, 5, 13)), _row(date(2026, 5, 27)),
+    ])
+
+
+def test_lookup_matches_the_old_scan():
+    planner = _planner()
+
+    row, upcoming = planner.lookup(date(2026, 5, 6))
+    assert row.title == "first"
+    assert [r.date.day for r in upcoming] == [13, 20, 27]
+    assert planner.lookup(date(2026, 5, 27))[1] == [_row(date(2026, 6, 3))]
+    assert planner.dates(date(2026, 5, 1), date(2026, 6, 1)) == [
+        date(2026, 5, d) for d in (6, 13, 20, 27)]
+    with pytest.raises(ValueError, match="2026-05-06 to 2026-06-03"):
+        planner.lookup(date(2026, 5, 7))
+
+
+def test_range_shares_the_planner(monkeypatch, tmp_path):
+    import bulletin.runner as runner
+    from bulletin.runner import RunOptions, RunResult
+
+    planner = _planner()
+    calls = []
+
+    def fake_run(options, *, prompt_fn, progress_fn, report, hs_planner,
+                 update_index):
+        calls.append((options.target_date, options.service, hs_planner,
+                      update_index))
+        return RunResult(target_date=options.target_date,
+                         services_requested=["hidden_springs"], bulletins=[],
+                         reading_sheets=[], report=report)
+
+    monkeypatch.setattr(runner, "run_generation", fake_run)
+    monkeypatch.setattr(runner, "get_rotation", lambda force_fetch=False: None)
+    options = RunOptions(target_date=date(2026, 5, 1), service="all",
+                         output_dir=tmp_path)
+
+    results = runner.run_hidden_springs_range(
+        date(2026, 5, 1), date(2026, 6, 1), options, max_workers=3,
+        planner=planner, progress_fn=lambda line: None)
+
+    assert [r.target_date.day for r in results] == [6, 13, 20, 27]
+    assert {(c[1], c[2] is planner, c[3]) for c in calls} == {
+        ("hidden_springs", True, False)}
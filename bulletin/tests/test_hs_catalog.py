@@ -0,0 +1,130 @@
+"""Incremental Hidden Springs catalog builds (scripts/build_hs_catalog.py):
+the library scan against the last manifest, and merging added and removed
+recordings into a catalog without touching the other entries.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_hs_catalog.py -v
+"""
+
+from __future__ import annotations
+
+import yaml
+
+_REFRAIN = ("Refrain:  Oh, victory in Jesus, my Savior forever "
+            "  He sought me and bought me with His redeeming blood "
+            "  He loved me 'ere I knew Him and all my love is due Him")
+
+
+def _script():
+    import importlib.util
+    from pathlib import Path
+
+    path = Path(__file__).resolve().parents[2] / "scripts" / "build_hs_catalog.py"
+    spec = importlib.util.spec_from_file_location("build_hs_catalog", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _library(monkeypatch, tmp_path, *filenames):
+    """A library of empty recordings under *tmp_path*, and the script
+    pointed at it."""
+    catalog = _script()
+    library = tmp_path / "sorted_hidden_springs_aac_files"
+    for filename in filenames:
+        (library / filename).parent.mkdir(parents=True, exist_ok=True)
+        (library / filename).write_bytes(b"")
+    monkeypatch.setattr(catalog, "AAC_BASE", library)
+    monkeypatch.setattr(catalog, "SCAN_MANIFEST", tmp_path / "manifest.json")
+    monkeypatch.setattr(catalog, "OUTPUT_YAML", tmp_path / "songs.yaml")
+    return catalog, library
+
+
+def test_scan_library_against_the_last_manifest(monkeypatch, tmp_path):
+    catalog, library = _library(
+        monkeypatch, tmp_path, "Hymnal 1982/362 - Holy, holy, holy.m4a",
+        "Other/Amazing Grace.m4a", "Other/notes.txt")
+
+    files, added, changed, removed = catalog.scan_library({})
+    assert sorted(files) == ["Hymnal 1982/362 - Holy, holy, holy.m4a",
+                             "Other/Amazing Grace.m4a"]
+    assert [p["title"] for p in added] == ["Holy, holy, holy", "Amazing Grace"]
+    assert changed == removed == []
+
+    (library / "Other" / "Amazing Grace.m4a").write_bytes(b"re-exported")
+    (library / "Hymnal 1982" / "362 - Holy, holy, holy.m4a").unlink()
+    (library / "Other" / "Be Thou My Vision.m4a").write_bytes(b"")
+    _, added, changed, removed = catalog.scan_library(files)
+    assert [p["title"] for p in added] == ["Be Thou My Vision"]
+    assert changed == ["Other/Amazing Grace.m4a"]
+    assert removed == ["Hymnal 1982/362 - Holy, holy, holy.m4a"]
+
+
+def test_merge_adds_rematches_and_removes(monkeypatch, tmp_path):
+    catalog, _ = _library(monkeypatch, tmp_path)
+    entries = [
+        {"title": "Holy, Holy, Holy! Lord God Almighty",     # hand-edited
+         "hymnal_number": "362", "category": "hymnal",
+         "aac_files": [{"filename": "Hymnal 1982/362 - Holy, holy, holy.m4a"}],
+         "sections": [{"type": "verse", "lines": ["Holy, holy, holy!"]}]},
+        {"title": "Amazing Grace", "category": "other",
+         "aac_files": [{"filename": "Other/Amazing Grace.m4a"}]},
+    ]
+    parse = catalog.parse_aac_filename
+    added = [
+        # renamed: re-matched by the title parsed from the old filename
+        parse("362 - Holy, holy, holy [ORGAN].m4a", "Hymnal 1982"),
+        parse("Be Thou My Vision.m4a", "Other"),
+        parse("Jesu, Joy.m4a", "Prelude - Postlude"),
+    ]
+    removed = ["Hymnal 1982/362 - Holy, holy, holy.m4a",
+               "Other/Amazing Grace.m4a"]
+    calls = []
+
+    def lyrics_sources():
+        calls.append(True)
+        return {}, {}, {}, {"be thou my vision": [{"type": "verse",
+                                                  "lines": ["Be thou"]}]}
+
+    new, missing, emptied, changed = catalog.merge_into_catalog(
+        entries, added, removed, lyrics_sources)
+
+    assert changed and len(calls) == 1
+    assert new == ["Be Thou My Vision", "Jesu, Joy"] and missing == []
+    assert emptied == ["Amazing Grace"]
+    assert [e["title"] for e in entries] == [
+        "Holy, Holy, Holy! Lord God Almighty", "Amazing Grace",
+        "Be Thou My Vision", "Jesu, Joy"]
+    assert entries[0]["aac_files"] == [
+        {"filename": "Hymnal 1982/362 - Holy, holy, holy [ORGAN].m4a",
+         "instrument": "organ"}]
+    assert entries[0]["sections"][0]["lines"] == ["Holy, holy, holy!"]
+    assert entries[2]["sections"][0]["lines"] == ["Be thou"]
+    assert entries[3]["no_lyrics"] and "sections" not in entries[3]
+
+
+def test_incremental_update_keeps_other_entries_as_written(monkeypatch,
+                                                           tmp_path):
+    catalog, library = _library(
+        monkeypatch, tmp_path, "Other/Victory in Jesus.m4a")
+    catalog.OUTPUT_YAML.write_text(yaml.dump(
+        [{"title": "Victory in Jesus", "category": "other",
+          "aac_files": [{"filename": "Other/Victory in Jesus.m4a"}],
+          "sections": [{"type": "refrain", "lines": [_REFRAIN]}]}],
+        default_flow_style=False, allow_unicode=True, sort_keys=False,
+        width=120), encoding="utf-8")
+    written = catalog.OUTPUT_YAML.read_text(encoding="utf-8")
+    monkeypatch.setattr(catalog, "load_lyrics_sources",
+                        lambda refresh=False: ({}, {}, {}, {}))
+
+    # No manifest yet: every file is "new", but all are in the catalog.
+    catalog.update_catalog()
+    assert catalog.OUTPUT_YAML.read_text(encoding="utf-8") == written
+    assert catalog.read_scan_manifest()
+
+    (library / "Other" / "Wonderful Words.m4a").write_bytes(b"")
+    catalog.update_catalog()
+    updated = catalog.OUTPUT_YAML.read_text(encoding="utf-8")
+    assert updated.startswith(written)
+    assert "Wonderful Words" in updated[len(written):]
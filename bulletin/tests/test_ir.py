@@ -0,0 +1,95 @@
+"""Check the IR renderers: docx output matches the formatting helpers,
+and the text/HTML renderings carry the same content.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_ir.py -v
+"""
+
+from __future__ import annotations
+
+_SCRIPTURE = ("\x011\x01 The LORD is my shepherd; I shall not want.\n\n"
+              "\x012\x01 He makes me lie down in green pastures")
+
+_POP = [
+    {"type": "leader", "text": "Let us pray for the Church and for the world."},
+    {"type": "leader", "text": "Grant, Almighty God, that all who confess your Name"},
+    {"type": "people", "leader_text": "Lord, in your mercy",
+     "people_text": "Hear our prayer."},
+    {"type": "rubric", "text": "Silence"},
+    {"type": "both", "leader_text": "Father, we pray for your holy Church;",
+     "people_text": "That we all may be one."},
+]
+
+
+def _body_xml(doc) -> bytes:
+    from lxml import etree
+    return etree.tostring(doc.element.body)
+
+
+def test_docx_renderer_matches_helpers():
+    from bulletin.document.formatting import (
+        add_body, add_celebrant_line, add_heading, add_people_line,
+        add_rubric, add_scripture_text, add_spacer,
+    )
+    from bulletin.document.ir import (
+        Body, DialogueLine, Rubric, Scripture, Spacer, heading_blocks,
+        render_docx,
+    )
+    from bulletin.document.styles import create_document
+
+    expected = create_document()
+    add_heading(expected, "The Word of God")
+    add_rubric(expected, "Please stand.")
+    add_body(expected, "In the Name of the Father ✠ and of the Son")
+    add_spacer(expected)
+    add_scripture_text(expected, _SCRIPTURE)
+    add_celebrant_line(expected, "", "The Word of the Lord.")
+    add_people_line(expected, "People", "Thanks be to God.")
+
+    doc = create_document()
+    render_docx(doc, heading_blocks("The Word of God") + [
+        Rubric("Please stand."),
+        Body("In the Name of the Father ✠ and of the Son"),
+        Spacer(),
+        Scripture(_SCRIPTURE),
+        DialogueLine("", "The Word of the Lord."),
+        DialogueLine("People", "Thanks be to God.", people=True),
+    ])
+
+    assert _body_xml(doc) == _body_xml(expected)
+
+
+def test_pop_blocks_render_as_text_and_html():
+    from bulletin.document.ir import Body, render_html, render_text
+    from bulletin.document.sections.word_of_god import pop_blocks
+
+    blocks = pop_blocks(_POP)
+    assert Body("Lord, in your mercy ", bold_text="Hear our prayer.") in blocks
+
+    text = render_text(blocks)
+    assert "Lord, in your mercy Hear our prayer.\n" in text
+    assert "That we all may be one." in text
+
+    page = render_html(blocks)
+    assert ('<p class="ir-body">Lord, in your mercy '
+            '<strong>Hear our prayer.</strong></p>') in page
+    assert '<p class="ir-body-rubric">Silence</p>' in page
+
+
+def test_scripture_html_formats_verses_and_lord():
+    from bulletin.document.ir import Scripture, render_html
+
+    page = render_html([Scripture(_SCRIPTURE)])
+    assert "<sup>1\u00a0</sup>" in page
+    assert '<span class="ir-small-caps">Lord</span>' in page
+    assert page.count("<p ") == 2
+
+
+def test_blocks_compare_and_digest_by_value():
+    from bulletin.document.sections.word_of_god import pop_blocks
+    from bulletin.fingerprint import digest
+
+    assert pop_blocks(_POP) == pop_blocks(_POP)
+    assert digest(pop_blocks(_POP)) == digest(pop_blocks(_POP))
+    assert digest(pop_blocks(_POP)) != digest(pop_blocks(_POP[:-1]))
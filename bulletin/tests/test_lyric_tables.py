@@ -0,0 +1,76 @@
+"""Check the cloned lyric-table skeletons against python-docx tables,
+and the resolved-song index.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_lyric_tables.py -v
+"""
+
+from __future__ import annotations
+
+from lxml import etree
+
+
+def _python_docx_table(doc, rows, two_column):
+    """The table the song helpers built before the skeletons."""
+    from docx.shared import Inches
+    from bulletin.config import MARGIN_INCHES, PAGE_WIDTH_INCHES
+    from bulletin.document.formatting import (
+        _prevent_row_split, _remove_cell_margins, _remove_table_borders,
+    )
+
+    table = doc.add_table(rows=rows, cols=2 if two_column else 1)
+    table.autofit = True
+    _remove_table_borders(table)
+    _prevent_row_split(table)
+    if two_column:
+        width = Inches(PAGE_WIDTH_INCHES - 2 * MARGIN_INCHES) // 2
+        for cell in table.rows[0].cells:
+            cell.width = width
+    else:
+        _remove_cell_margins(table)
+    cells = [[table.cell(r, c) for c in range(len(table.columns))]
+             for r in range(rows)]
+    for row in cells:
+        for cell in row:
+            for p in cell.paragraphs:
+                p._element.getparent().remove(p._element)
+    return cells
+
+
+def _fill(rows):
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            cell.add_paragraph(f"row {r} col {c}", style="Body - Lyrics")
+
+
+def test_skeleton_tables_match_python_docx():
+    from bulletin.document.formatting import lyric_table
+    from bulletin.document.styles import create_document
+
+    shapes = [(1, False), (4, False), (1, True), (1, False), (2, False)]
+
+    fast = create_document()
+    for rows, two_column in shapes:
+        _fill(lyric_table(fast, rows=rows, two_column=two_column))
+    reference = create_document()
+    for rows, two_column in shapes:
+        _fill(_python_docx_table(reference, rows, two_column))
+
+    assert etree.tostring(fast.element) == etree.tostring(reference.element)
+
+
+def test_resolved_song_index():
+    from bulletin.sources import songs
+
+    songs.clear_cache()
+    first = songs.lookup_song("#208", "11 am")
+    assert first is not None
+    assert songs.lookup_song("#208", "11am") is first
+    assert ("#208", "11am") in songs._resolved
+
+    assert songs.lookup_song("No Such Song Anywhere", "9 am") is None
+    assert songs._resolved[("No Such Song Anywhere", "9am")] is None
+
+    songs.clear_cache()
+    assert not songs._resolved
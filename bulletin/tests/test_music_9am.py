@@ -0,0 +1,102 @@
+"""9 am music store: weeks indexed by date and kept after they scroll off
+the sheet, the history file answering when the sheet is down, and the
+grid fetched again once it is five minutes old.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_music_9am.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+_MAY_3 = date(2026, 5, 3)
+_MAY_10 = date(2026, 5, 10)
+_MAY_17 = date(2026, 5, 17)
+
+
+def _week(day: date, processional: str = "H 362"):
+    from bulletin.sources.music_9am import MusicSlot, ServiceMusic9am
+
+    return ServiceMusic9am(date=day, liturgical_label="Easter",
+                           slots=[MusicSlot("Processional", processional)])
+
+
+def _sheet(monkeypatch, tmp_path, *windows):
+    """Serve each fetch the next of *windows* (raising it if it's an
+    exception), over a fresh process-wide store in *tmp_path*."""
+    import bulletin.sources.music_9am as m9
+
+    clock = [1000.0]
+    fetches = []
+
+    def fetch():
+        window = windows[len(fetches)]
+        fetches.append(clock[0])
+        if isinstance(window, Exception):
+            raise window
+        return window
+
+    monkeypatch.setattr(m9, "_fetch_grid", fetch)
+    monkeypatch.setattr(m9.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(m9, "_store",
+                        m9.Music9amStore(tmp_path / "music_9am_history.json"))
+    return clock, fetches
+
+
+def test_weeks_indexed_by_date_and_kept_as_history(monkeypatch, tmp_path):
+    from bulletin.sources.music_9am import Music9amStore, get_store
+
+    _sheet(monkeypatch, tmp_path,
+           [_week(_MAY_3), _week(_MAY_10)],
+           [_week(_MAY_10, "H 208"), _week(_MAY_17)])
+    store = get_store()
+
+    store.refresh()
+    assert store.dates() == [_MAY_3, _MAY_10]
+    store.refresh()                         # May 3 has scrolled off
+    assert store.dates() == [_MAY_3, _MAY_10, _MAY_17]
+    assert store.get(_MAY_10).slots[0].song_title == "H 208"
+    assert store.get(date(2026, 5, 24)) is None
+
+    reloaded = Music9amStore(store.history_file)
+    assert reloaded.weeks == store.weeks and reloaded.fetched_at is None
+
+
+def test_history_answers_when_the_sheet_is_down(monkeypatch, tmp_path):
+    import pytest
+    import requests
+
+    import bulletin.sources.music_9am as m9
+
+    history = m9.Music9amStore(tmp_path / "music_9am_history.json")
+    history.weeks[_MAY_3] = _week(_MAY_3)
+    history._save_history()
+    _sheet(monkeypatch, tmp_path,
+           requests.ConnectionError("offline"),
+           requests.ConnectionError("offline"))
+
+    assert m9.fetch_9am_music(_MAY_3).slots[0].song_title == "H 362"
+    with pytest.raises(requests.ConnectionError):
+        m9.fetch_9am_music(_MAY_10)         # never seen: nothing to fall back on
+
+
+def test_grid_refetched_after_five_minutes(monkeypatch, tmp_path):
+    import bulletin.sources.music_9am as m9
+
+    clock, fetches = _sheet(monkeypatch, tmp_path,
+                            [_week(_MAY_3)],
+                            [_week(_MAY_3, "H 208")],
+                            [_week(_MAY_3, "H 400")])
+
+    assert m9.fetch_9am_music(_MAY_3).slots[0].song_title == "H 362"
+    clock[0] += m9._REFRESH_SECONDS - 1
+    assert m9.fetch_9am_music(_MAY_3).slots[0].song_title == "H 362"
+    assert len(fetches) == 1
+
+    clock[0] += 2                           # expired: the edit is picked up
+    assert m9.fetch_9am_music(_MAY_3).slots[0].song_title == "H 208"
+    assert m9.fetch_9am_music(_MAY_3, force_fetch=True).slots[0].song_title \
+        == "H 400"
+    assert len(fetches) == 3
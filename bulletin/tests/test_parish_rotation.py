@@ -0,0 +1,74 @@
+"""Parish Cycle of Prayers: the rotation built from the sheet, its disk
+snapshot, and the in-process cache expiring so edits are picked up.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_parish_rotation.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+_CYCLE = [
+    ("August 28, 2022", ["Acolytes", "Altar Guild", "Bell Choir"]),
+    ("September 4, 2022", ["Bible Builders", "Book Club", "Choir"]),
+    ("", ["Special Prayers for the Bishop"]),
+    ("September 11, 2022", ["Daughters of the King", "Deacons", "EYC"]),
+]
+
+
+def test_from_cycle_and_ministries_for():
+    from bulletin.sources.parish_prayers import MinistryRotation
+
+    rotation = MinistryRotation.from_cycle(_CYCLE)
+
+    assert rotation.anchor_date == date(2022, 8, 28)
+    assert len(rotation.regular_weeks) == 3
+    assert list(rotation.special_weeks) == ["Special Prayers for the Bishop"]
+    assert rotation.ministries_for(date(2022, 8, 28))[0] == "Acolytes"
+    assert rotation.ministries_for(date(2022, 9, 17))[0] == "Daughters of the King"
+    # Three weeks on, the cycle starts over.
+    assert rotation.ministries_for(date(2022, 9, 18))[0] == "Acolytes"
+    assert MinistryRotation.from_cycle([]).ministries_for(date(2026, 5, 3)) == [
+        "[No regular ministry weeks found]"]
+
+
+def test_dict_round_trip():
+    from bulletin.sources.parish_prayers import MinistryRotation
+
+    rotation = MinistryRotation.from_cycle(_CYCLE)
+    assert MinistryRotation.from_dict(rotation.to_dict()) == rotation
+
+
+def test_cached_rotation_expires(monkeypatch, tmp_path):
+    import requests
+
+    import bulletin.sources.parish_prayers as pp
+
+    clock = [1000.0]
+    fetches = []
+
+    def fetch():
+        fetches.append(clock[0])
+        if len(fetches) == 3:
+            raise requests.ConnectionError("offline")
+        return _CYCLE[:len(fetches) + 1]
+
+    monkeypatch.setattr(pp.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(pp, "fetch_parish_cycle", fetch)
+    monkeypatch.setattr(pp, "PARISH_CYCLE_CACHE_FILE", tmp_path / "cycle.json")
+    pp.clear_cache()
+    try:
+        first = pp.get_rotation()
+        clock[0] += pp._REFRESH_SECONDS - 1
+        assert pp.get_rotation() is first and len(fetches) == 1
+
+        clock[0] += 2                       # expired: the edit is picked up
+        second = pp.get_rotation()
+        assert len(fetches) == 2 and second != first
+
+        clock[0] += pp._REFRESH_SECONDS     # expired, but the sheet is down
+        assert pp.get_rotation() is second
+    finally:
+        pp.clear_cache()
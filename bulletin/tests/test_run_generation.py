@@ -0,0 +1,213 @@
+"""run_generation end to end: every service for a Sunday plus reading
+sheets, built offline from hand-made sheet rows and cached scripture,
+and the skip when a bulletin's inputs are unchanged.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_run_generation.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+_EASTER_2 = date(2026, 4, 12)
+
+
+def _offline(monkeypatch):
+    import bulletin.runner as runner
+    import bulletin.sources.google_sheet as google_sheet
+    from bulletin.tests.test_check import _snapshot
+
+    monkeypatch.setattr(google_sheet, "fetch_sheet_snapshot", _snapshot)
+    monkeypatch.setattr(runner, "fetch_9am_music",
+                        lambda d, force_fetch=False: None)
+    monkeypatch.setattr(runner, "get_ministries_for_date",
+                        lambda d, force_fetch=False: ["Altar Guild"])
+
+
+def test_builds_every_service_and_reading_sheets(monkeypatch, tmp_path):
+    from bulletin.runner import RunOptions, run_generation
+
+    _offline(monkeypatch)
+    result = run_generation(
+        RunOptions(target_date=_EASTER_2, output_dir=tmp_path,
+                   reading_sheets=True),
+        progress_fn=lambda line: None)
+
+    assert [b.service_time for b in result.bulletins] == ["8 am", "9 am", "11 am"]
+    assert all(b.output_path.exists() and not b.skipped
+               for b in result.bulletins)
+    assert len(result.reading_sheets) == 2
+    assert all(p.exists() for p in result.reading_sheets)
+
+
+# ---------------------------------------------------------------------------
+# Skipping unchanged bulletins (bulletin/fingerprint.py)
+# ---------------------------------------------------------------------------
+
+def _run_11am(tmp_path, **options):
+    from bulletin.runner import RunOptions, run_generation
+
+    result = run_generation(
+        RunOptions(target_date=_EASTER_2, service="11 am",
+                   output_dir=tmp_path, **options),
+        progress_fn=lambda line: None)
+    return result.bulletins[0]
+
+
+def test_unchanged_inputs_skip_and_return_the_stored_manifest(monkeypatch,
+                                                              tmp_path):
+    import json
+
+    from bulletin.fingerprint import manifest_path
+
+    _offline(monkeypatch)
+    first = _run_11am(tmp_path)
+    assert not first.skipped
+
+    # The AAC list comes back from the manifest, not from a build.
+    path = manifest_path(first.output_path)
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    manifest["aac_manifest"] = [["Prelude", "Other/Toccata.m4a"]]
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    saved = first.output_path.stat().st_mtime_ns
+
+    second = _run_11am(tmp_path)
+    assert second.skipped
+    assert second.fingerprint == first.fingerprint
+    assert second.aac_manifest == [("Prelude", "Other/Toccata.m4a")]
+    assert first.output_path.stat().st_mtime_ns == saved
+
+    assert not _run_11am(tmp_path, rebuild=True).skipped
+
+
+def test_changed_input_rebuilds(monkeypatch, tmp_path):
+    import bulletin.runner as runner
+
+    _offline(monkeypatch)
+    first = _run_11am(tmp_path)
+
+    monkeypatch.setattr(runner, "get_ministries_for_date",
+                        lambda d, force_fetch=False: ["Choir"])
+    second = _run_11am(tmp_path)
+    assert not second.skipped and second.fingerprint != first.fingerprint
+
+    assert not _run_11am(tmp_path, coalesce_runs=True).skipped
+
+
+def _fingerprint(inputs, **kwargs):
+    from bulletin.fingerprint import bulletin_fingerprint
+    from bulletin.report import RunReport
+
+    builder = inputs.new_builder("11 am", RunReport())
+    builder.resolve_all(prompt_fn=None)
+    kwargs.setdefault("output_name", "easter2.docx")
+    return bulletin_fingerprint(builder, **kwargs)
+
+
+def _mutations():
+    import dataclasses
+
+    def schedule(inputs):
+        sheet = inputs.sheet_data
+        return dataclasses.replace(inputs, sheet_data=dataclasses.replace(
+            sheet, schedule=dataclasses.replace(sheet.schedule,
+                                                color="Red")))
+
+    def clergy(inputs):
+        sheet = inputs.sheet_data
+        return dataclasses.replace(inputs, sheet_data=dataclasses.replace(
+            sheet, clergy=dataclasses.replace(sheet.clergy,
+                                              preacher_11am="Gene")))
+
+    def music(inputs):
+        slots = [dataclasses.replace(s, song_title="#208")
+                 if s.service_part == "Processional" else s
+                 for s in inputs.music_11am_slots]
+        return dataclasses.replace(inputs, music_11am_slots=slots)
+
+    def scripture(inputs):
+        readings = dict(inputs.scripture_readings)
+        key = next(iter(readings))
+        readings[key] = dataclasses.replace(readings[key],
+                                            paragraphs=["Edited."])
+        return dataclasses.replace(inputs, scripture_readings=readings)
+
+    def ministries(inputs):
+        return dataclasses.replace(inputs, parish_ministries="Choir")
+
+    return {"schedule": schedule, "clergy": clergy, "music": music,
+            "scripture": scripture, "ministries": ministries}
+
+
+def test_every_component_changes_the_fingerprint(monkeypatch):
+    import bulletin.fingerprint as fingerprint
+    from bulletin.report import RunReport
+    from bulletin.runner import RunOptions, gather_inputs
+
+    _offline(monkeypatch)
+    inputs = gather_inputs(RunOptions(target_date=_EASTER_2, service="11 am"),
+                           progress_fn=lambda line: None, report=RunReport())
+    base = _fingerprint(inputs)
+    assert _fingerprint(inputs) == base
+
+    changed = {name: _fingerprint(mutate(inputs))
+               for name, mutate in _mutations().items()}
+    changed["output"] = _fingerprint(inputs, output_name="other.docx")
+    changed["save options"] = _fingerprint(
+        inputs, save_options={"deterministic": True})
+    environment = fingerprint.environment_digests()
+    monkeypatch.setattr(fingerprint, "environment_digests",
+                        lambda: {**environment, "templates": "0" * 64})
+    changed["templates"] = _fingerprint(inputs)
+
+    for name, components in changed.items():
+        assert components["fingerprint"] != base["fingerprint"], name
+
+
+# ---------------------------------------------------------------------------
+# Rebuilding stale bulletins (generate.py --stale --rebuild)
+# ---------------------------------------------------------------------------
+
+def test_stale_rebuild_keeps_save_options_and_shares_a_run(monkeypatch,
+                                                          tmp_path):
+    import io
+    import zipfile
+    from pathlib import Path
+
+    import bulletin.dependencies as dependencies
+    import generate
+    from bulletin.fingerprint import read_manifest, write_manifest
+    from bulletin.runner import RunOptions, run_generation
+
+    _offline(monkeypatch)
+    monkeypatch.chdir(tmp_path)
+    built = run_generation(
+        RunOptions(target_date=_EASTER_2, output_dir=Path("output"),
+                   deterministic=True),
+        progress_fn=lambda line: None).bulletins
+    for bulletin in built[1:]:              # a data edit hits 9 am and 11 am
+        manifest = read_manifest(bulletin.output_path)
+        manifest["dependencies"] = {"template:back_cover.docx": "0" * 64}
+        write_manifest(bulletin.output_path, manifest)
+        bulletin.output_path.write_bytes(b"")
+
+    find_stale = dependencies.find_stale
+    monkeypatch.setattr(dependencies, "find_stale",
+                        lambda out, changed, since: find_stale(out, changed))
+    runs = []
+    monkeypatch.setattr(generate, "run_generation",
+                        lambda options, **kw: runs.append(options)
+                        or run_generation(options, progress_fn=lambda l: None,
+                                          **kw))
+    generate._run_stale(None, rebuild=True, deterministic=True, prompt_fn=None)
+
+    assert [(o.service, o.services) for o in runs] == [
+        ("all", ["9 am", "11 am"])]
+    for before in built[1:]:
+        with zipfile.ZipFile(io.BytesIO(before.output_path.read_bytes())) as z:
+            assert {i.date_time for i in z.infolist()} == {
+                (2026, 4, 12, 0, 0, 0)}
+        assert read_manifest(before.output_path)["fingerprint"] == \
+            before.fingerprint
@@ -0,0 +1,123 @@
+"""Check the scripture reference parser and the verse store: readings
+are assembled from cached verses, and only missing spans are fetched.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_scripture_store.py -v
+"""
+
+from __future__ import annotations
+
+import json
+
+
+def _reading(reference: str, verses: dict[str, str]):
+    """A reading as the oremus parser would return it (one paragraph)."""
+    from bulletin.sources.scripture import _assemble_tokens
+
+    tokens = []
+    for number, text in verses.items():
+        tokens += [("verse", number), ("text", text + " ")]
+    return _assemble_tokens(tokens, reference)
+
+
+def _offline(monkeypatch, tmp_path, cache: dict, fetched: dict):
+    """Point the scripture cache at *cache*; serve fetches from *fetched*."""
+    from bulletin.sources import scripture
+
+    path = tmp_path / "scripture_cache.json"
+    path.write_text(json.dumps(cache), encoding="utf-8")
+    monkeypatch.setattr(scripture, "SCRIPTURE_CACHE_FILE", path)
+    calls = []
+
+    def fetch(reference):
+        calls.append(reference)
+        if reference not in fetched:
+            raise ConnectionError("offline")
+        return fetched[reference]
+
+    monkeypatch.setattr(scripture, "fetch_reading", fetch)
+    return path, calls
+
+
+def test_parse_and_format_references():
+    from bulletin.sources.scripture_refs import (
+        format_reference, parse_reference, spans_for,
+    )
+
+    ref = parse_reference("John 13:1-17, 31b-35")
+    assert ref.book == "John"
+    keys = ref.verses()
+    assert keys[0] == (13, "1") and keys[17] == (13, "31b") and len(keys) == 22
+    assert str(ref) == "John 13:1-17, 31b-35"
+
+    assert parse_reference("Genesis 12:1-4a").verses()[-1] == (12, "4a")
+    assert parse_reference("1 Corinthians 11:23-26").book == "1 Corinthians"
+
+    span = parse_reference("Isaiah 52:13—53:12")
+    assert span.verses() is None            # chapter 52's length unknown
+    lengths = {("isaiah", 52): 15}
+    keys = span.verses(lambda book, ch: lengths.get((book, ch)))
+    assert keys[:4] == [(52, "13"), (52, "14"), (52, "15"), (53, "1")]
+    assert format_reference("Genesis", spans_for(
+        [(12, "4"), (12, "5"), (12, "6"), (12, "8a")])) == "Genesis 12:4-6, 8a"
+
+
+def test_cached_verses_assemble_a_shorter_reading(monkeypatch, tmp_path):
+    from bulletin.sources import scripture
+
+    cached = scripture._load_cache()["John 20:19-31"]
+    _, calls = _offline(monkeypatch, tmp_path, {"John 20:19-31": cached}, {})
+
+    readings = scripture.fetch_readings({"gospel": "John 20:19-23"}, delay=0)
+
+    assert calls == []
+    numbers = scripture._verses_present(readings["gospel"])
+    assert numbers == [19, 20, 21, 22, 23]
+    assert readings["gospel"].paragraphs[0] == \
+        scripture._load_cache()["John 20:19-31"]["paragraphs"][0][
+            :len(readings["gospel"].paragraphs[0])]
+
+
+def test_only_missing_verses_are_fetched(monkeypatch, tmp_path):
+    from bulletin.sources import scripture
+
+    short = _reading("Genesis 12:1-4a", {
+        "1": "Now the LORD said to Abram,", "2": "I will make of you",
+        "3": "I will bless", "4": "So Abram went,"})
+    rest = _reading("Genesis 12:4-9", {
+        "4": "So Abram went, as the LORD had told him.", "5": "Abram took",
+        "6": "Abram passed", "7": "Then the LORD appeared",
+        "8": "From there he moved", "9": "And Abram journeyed on"})
+    path, calls = _offline(
+        monkeypatch, tmp_path,
+        {"Genesis 12:1-4a": scripture._reading_to_cache(short)},
+        {"Genesis 12:4-9": rest})
+
+    reading = scripture.fetch_readings({"reading": "Genesis 12:1-9"},
+                                       delay=0)["reading"]
+
+    assert calls == ["Genesis 12:4-9"]
+    assert scripture._verses_present(reading) == list(range(1, 10))
+    assert "as the LORD had told him" in reading.text     # full verse 4
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert {"Genesis 12:1-4a", "Genesis 12:4-9", "Genesis 12:1-9"} <= set(saved)
+
+    # Both lengths are now offline.
+    calls.clear()
+    scripture.fetch_readings({"reading": "Genesis 12:2-8"}, delay=0)
+    assert calls == []
+
+
+def test_is_cached_counts_assemblable_readings(monkeypatch, tmp_path):
+    from bulletin.sources import scripture
+
+    cached = scripture._load_cache()["John 20:19-31"]
+    _offline(monkeypatch, tmp_path, {"John 20:19-31": cached}, {})
+
+    assert scripture.is_cached("John 20:19-31")
+    assert scripture.is_cached("John 20:19-23")
+    assert scripture.is_cached("John 20:24-35")     # John 20 ends at 31
+    assert not scripture.is_cached("John 20:1-23")
+    assert not scripture.is_cached("John 21:1-14")
+    assert not scripture.is_cached("not a reference")
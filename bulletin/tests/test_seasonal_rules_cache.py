@@ -0,0 +1,38 @@
+"""Check that ``get_seasonal_rules`` memoizes on normalized inputs.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_seasonal_rules_cache.py -v
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+
+def test_same_inputs_share_one_object():
+    from bulletin.logic import rules
+
+    rules.clear_seasonal_rules_cache()
+    first = rules.get_seasonal_rules("Third Sunday in Lent", "Violet", "", "I")
+    # Case and surrounding whitespace don't change any rule, so they
+    # must hit the same cache entry.
+    second = rules.get_seasonal_rules(" third sunday in lent ", "violet", "", "i")
+
+    assert first is second
+    info = rules.seasonal_rules_cache_info()
+    assert info.hits == 1 and info.misses == 1
+
+    assert first.season == "lent"
+    assert first.proper_preface_options == ("option_1", "option_2")
+
+
+def test_rules_are_immutable():
+    from bulletin.logic import rules
+
+    r = rules.get_seasonal_rules("Second Sunday of Easter", "White", "")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        r.season = "lent"
+    hash(r)
@@ -0,0 +1,43 @@
+"""Sheet parsing: header variants resolve to columns once, and each row is
+built straight into its dataclass.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_sheet_columns.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+def test_rows_built_from_resolved_columns(monkeypatch):
+    import bulletin.sources.google_sheet as gs
+
+    headers = ["Date", "Service\nType", "Sunday/Commemoration  Title",
+               "Check if service at St. Andrew’s", "Clsing Prayer",
+               "Notes", "Notes"]
+    rows = [
+        ["5/6/2026", "LOW", " Wednesday ", "TRUE", "Almighty", "a", "b"],
+        ["5/6/2026", "HE-II", "Evening"],                   # short row
+        ["", "LOW", "Undated", "false", "", "", "", "extra"],
+    ]
+    monkeypatch.setattr(gs, "_fetch_sheet_csv",
+                        lambda gid: gs.SheetTable(headers, rows))
+    parsed = []
+    real_parse = gs._parse_date
+    monkeypatch.setitem(gs._HIDDEN_SPRINGS_CONVERTERS, "date",
+                        lambda text: parsed.append(text) or real_parse(text))
+
+    first, second, third = gs.fetch_hidden_springs_planner()
+
+    assert (first.date, first.service_type, first.title) == (
+        date(2026, 5, 6), "LOW", "Wednesday")
+    assert first.at_st_andrews and not third.at_st_andrews
+    assert first.closing_prayer == "Almighty"
+    assert first.notes == "b"               # repeated header: last column
+    assert first.preacher == ""             # no such column
+    assert (second.title, second.notes, second.date) == (
+        "Evening", "", date(2026, 5, 6))
+    assert third.date is None
+    assert parsed == ["5/6/2026", ""]       # once per distinct cell
@@ -0,0 +1,71 @@
+"""Check the song-suggestion index: ranking, de-duplication, and that
+the alias it proposes makes ``lookup_song()`` resolve.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_song_index.py -v
+"""
+
+from __future__ import annotations
+
+_MAIN = [
+    {"title": "I the Lord of Sea and Sky", "services": "9am",
+     "identifiers": ["Here I Am, Lord"],
+     "sections": [{"type": "verse", "lines": ["I, the Lord of sea and sky,"]}]},
+    {"title": "Here I am to Worship", "services": "9am",
+     "sections": [{"type": "verse", "lines": ["Light of the world"]}]},
+    {"title": "Amazing grace!", "hymnal_number": "671",
+     "sections": [{"type": "verse",
+                   "lines": ["Amazing grace! how sweet the sound"]}]},
+    {"title": "In Christ Alone", "services": "9am", "sections": []},
+    {"title": "In Christ Alone", "services": "11am", "sections": []},
+]
+_HS = [{"title": "Be Thou My Vision", "sections": []}]
+
+
+def test_ranks_aliases_first_lines_and_titles():
+    from bulletin.sources.song_index import SongIndex
+
+    index = SongIndex({"main": _MAIN, "hidden_springs": _HS})
+
+    top = index.suggest("Here I Am Lord")
+    assert top[0].title == "I the Lord of Sea and Sky"
+    assert top[0].field == "identifier"
+    assert top[1].title == "Here I am to Worship"
+
+    grace = index.suggest("Amazing Grace how sweet (organ)")[0]
+    assert (grace.title, grace.field, grace.position) == \
+        ("Amazing grace!", "first_line", 2)
+
+    christ = index.suggest("In Christ Alone (no bridge)")
+    assert [s.position for s in christ] == [3]
+
+    assert index.suggest("Be Thou My Vision", libraries=("main",)) == []
+    assert index.suggest("Be Thou My Vision")[0].library == "hidden_springs"
+
+
+def test_suggested_alias_resolves(tmp_path, monkeypatch):
+    import yaml
+
+    from bulletin.sources import songs
+    from bulletin.sources.song_index import alias_for, suggest_songs
+
+    catalog = tmp_path / "songs.yaml"
+    catalog.write_text(yaml.safe_dump(_MAIN), encoding="utf-8")
+    monkeypatch.setattr(songs, "SONGS_FILE", catalog)
+    monkeypatch.setattr(songs, "HS_SONGS_FILE", tmp_path / "missing.yaml")
+    songs.clear_cache()
+    try:
+        planner = "Lord of the Sea and Sky (Schutte)"
+        assert songs.lookup_song(planner) is None
+        best = suggest_songs(planner, libraries=("main",))[0]
+        assert best.title == "I the Lord of Sea and Sky"
+
+        data = yaml.safe_load(catalog.read_text(encoding="utf-8"))
+        data[best.position]["identifiers"].append(alias_for(planner))
+        catalog.write_text(yaml.safe_dump(data), encoding="utf-8")
+        songs.clear_cache()
+
+        assert songs.lookup_song(planner)["title"] == best.title
+    finally:
+        songs.clear_cache()
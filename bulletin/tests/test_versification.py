@@ -0,0 +1,89 @@
+"""NRSV versification table: chapter lengths and reference checks
+without the network.
+
+Run via::
+
+    python3.11 -m pytest bulletin/tests/test_versification.py -v
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+def test_table_totals_and_nrsv_numbering():
+    from bulletin.sources.versification import _load, chapter_count, last_verse
+
+    chapters, _ = _load()
+    protestant = list(chapters)[:66]
+    assert protestant[0] == "Genesis" and protestant[-1] == "Revelation"
+    assert sum(len(chapters[b]) for b in protestant) == 1189
+
+    assert last_verse("Acts", 2) == 47
+    assert last_verse("psalm", 119) == 176
+    assert last_verse("1Cor.", 13) == 13
+    assert last_verse("3 John", 1) == 15            # NRSV, not KJV's 14
+    assert last_verse("Ecclesiasticus", 51) == 30
+    assert last_verse("Acts", 29) is None
+    assert chapter_count("Jude") == 1
+    assert chapter_count("Hezekiah") is None
+
+
+def test_reference_problems():
+    from bulletin.sources.versification import reference_problems
+
+    assert reference_problems("Acts 2:14a, 22-32") == []
+    assert reference_problems("Isaiah 52:13-53:12") == []
+    assert reference_problems("Acts 2:1-50") == ["Acts 2 has only 47 verses"]
+    assert reference_problems("Jude 2:1-4") == ["Jude has only 1 chapter"]
+    assert reference_problems("Hezekiah 1:1") == ["Unknown book 'Hezekiah'"]
+
+
+def test_optional_verses_and_alternates():
+    from bulletin.runner import _cell_problems
+    from bulletin.sources.scripture_refs import alternatives, parse_reference
+    from bulletin.sources.versification import reference_problems
+
+    for ref in ("Exodus 12:1-4, (5-10), 11-14", "Exodus 12:1-4 (5-10) 11-14",
+                "Exodus 12:1-4, [5-10], 11-14"):
+        assert reference_problems(ref) == [], ref
+        assert len(parse_reference(ref).verses()) == 14
+    assert reference_problems("Exodus 12:1-4, (5-60)") == [
+        "Exodus 12 has only 51 verses"]
+
+    cell = "Matthew 26:14-27:66 or 27:11-54"
+    assert alternatives(cell) == ["Matthew 26:14-27:66", "Matthew 27:11-54"]
+    assert _cell_problems("gospel", cell) == []
+    assert _cell_problems("gospel", "Matthew 26:14-27:66 or 27:11-70") == [
+        "Matthew 27 has only 66 verses"]
+
+
+def test_check_references_reads_both_sheets():
+    from bulletin.runner import check_references
+    from bulletin.sources.google_sheet import (
+        HiddenSpringsRow, LiturgicalScheduleRow, SheetSnapshot,
+    )
+
+    day = date(2026, 4, 12)
+    schedule = LiturgicalScheduleRow(
+        service_type="Sunday", date=day, title="Easter 2", proper="-",
+        color="White", eucharistic_prayer="A", preface="",
+        reading="Acts 2:14a, 22-52", psalm="Psalm 16:1-15 responsively",
+        gospel="John 20:19-31", pop_form="I", special_blessing="",
+        closing_prayer="", dismissal="", notes="")
+    hs = HiddenSpringsRow(
+        service_type="LOW", date=day, title="Easter 2", proper="", color="",
+        eucharistic_prayer="", preface="", reading="-", psalm="Canticle 15",
+        gospel="Jn 20:19-40", pop_form="", special_blessing="",
+        closing_prayer="", dismissal="")
+    snapshot = SheetSnapshot(schedule=[schedule], clergy=[], music=[])
+
+    report = check_references(date(2026, 1, 1), date(2027, 1, 1),
+                              snapshot=snapshot, hs_rows=[hs])
+
+    messages = [item.message for item in report.items]
+    assert len(messages) == 3
+    assert "Acts 2 has only 47 verses" in messages[0]
+    assert "psalter" in messages[1]
+    assert messages[2].startswith("2026-04-12 gospel 'Jn 20:19-40'")
+    assert {item.category for item in report.items} == {"scripture"}
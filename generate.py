@@ -10,6 +10,17 @@ Usage:
     python generate.py 2026-03-01 --reading-sheets         # bulletins + reading sheets
     python generate.py 2026-04-02                          # Maundy Thursday → 7 pm
     python generate.py 2026-04-03                          # Good Friday → 7 pm
+    python generate.py --funeral 2026-01-31-cox            # funeral bulletin
+    python generate.py --funeral 2026-01-31-cox --check-readings
+    python generate.py --prefetch-burial-readings          # cache BCP burial readings
+    python generate.py --compile-data                      # faster startup: bundle data/*.yaml
+    python generate.py --stale --changed songs.yaml        # bulletins a songs.yaml edit affects
+    python generate.py --stale --rebuild                   # ...and regenerate them
+    python generate.py --check --weeks 4                   # punch list for the next 4 weeks
+    python generate.py 2026-05 -s hidden_springs --month   # every Hidden Springs bulletin in May
+    python generate.py 2026-05-06 -s hidden_springs --through 2026-06-24 -j 4
+    python generate.py --check --refs-only --weeks 52      # reference typos for a year, no fetch
+    python generate.py 2026-05 -s hidden_springs --month --aac-bundle  # + zip of new AAC files
 
 This file is the *CLI front-end*. The actual orchestration lives in
 ``bulletin.runner.run_generation``, which the local web UI also calls.
@@ -21,7 +32,13 @@ from datetime import datetime
 from pathlib import Path
 
 from bulletin.config import CHURCH_NAME, SERVICE_TIMES
-from bulletin.runner import RunAborted, RunOptions, run_generation
+from bulletin.runner import (
+    FuneralRunOptions,
+    RunAborted,
+    RunOptions,
+    run_funeral_generation,
+    run_generation,
+)
 
 
 def prompt_choice(question: str, options: list[str]) -> str:
@@ -57,10 +74,35 @@ def main():
                                                  "hidden_springs", "all"],
                         default="all",
                         help="Which service to generate (default: all)")
+    parser.add_argument("--month", action="store_true",
+                        help="With --service hidden_springs: build every "
+                             "Hidden Springs bulletin in the month of date "
+                             "(YYYY-MM or YYYY-MM-DD)")
+    parser.add_argument("--through", metavar="END_DATE",
+                        help="With --service hidden_springs: build every "
+                             "Hidden Springs bulletin from date through "
+                             "END_DATE (YYYY-MM-DD)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="With --month/--through: build N bulletins at "
+                             "a time (default: 1)")
+    parser.add_argument("--aac-bundle", action="store_true",
+                        help="With --service hidden_springs: also zip the "
+                             "AAC files that haven't been uploaded yet "
+                             "(tracked in output/.aac_uploads.json)")
     parser.add_argument("--funeral",
                         help="Generate a funeral / memorial bulletin from "
                              "a per-service YAML. Pass either a slug "
                              "('2026-01-31-cox') or a path to the YAML.")
+    parser.add_argument("--check-readings", action="store_true",
+                        help="With --funeral: only check that every reading "
+                             "is available offline, then exit")
+    parser.add_argument("--compile-data", action="store_true",
+                        help="Compile every bulletin/data YAML file into one "
+                             "bundle that later runs load in a single read "
+                             "(re-run after editing the YAML to keep it fast)")
+    parser.add_argument("--prefetch-burial-readings", action="store_true",
+                        help="Cache every BCP burial-office reading "
+                             "(pp. 494-495) for offline funeral builds")
     parser.add_argument("--output", "-o",
                         help="Output .docx file path (only with single service)")
     parser.add_argument("--no-prompt", action="store_true",
@@ -68,21 +110,93 @@ def main():
     parser.add_argument("--reading-sheets", action="store_true",
                         help="Also generate reading sheets for lay readers")
     parser.add_argument("--force-fetch", action="store_true",
-                        help="Re-fetch scripture readings from oremus.org "
-                             "(ignore cache)")
+                        help="Re-fetch scripture readings from oremus.org, "
+                             "the parish cycle of prayers, and the 9 am "
+                             "music grid (ignore caches)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Rebuild every bulletin even if its inputs are "
+                             "unchanged since the last run")
+    parser.add_argument("--coalesce-runs", action="store_true",
+                        help="Merge adjacent runs with identical formatting "
+                             "before saving (smaller document.xml)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Save byte-reproducible .docx files (fixed zip "
+                             "timestamps and entry order, normalized document "
+                             "properties and drawing IDs)")
+    parser.add_argument("--stale", action="store_true",
+                        help="List upcoming bulletins in output/ whose data "
+                             "has changed since they were built (with "
+                             "--rebuild, regenerate them)")
+    parser.add_argument("--check", action="store_true",
+                        help="Check the data for the upcoming weeks (sheet "
+                             "rows, scripture, songs, POP forms) without "
+                             "building any .docx; date is the start date "
+                             "(default: today)")
+    parser.add_argument("--weeks", type=int, default=4, metavar="N",
+                        help="With --check: how many weeks ahead (default: 4)")
+    parser.add_argument("--refs-only", action="store_true",
+                        help="With --check: only check the scripture "
+                             "references against the versification table "
+                             "and psalter (no scripture fetch; quick enough "
+                             "for --weeks 52)")
+    parser.add_argument("--changed", nargs="+", metavar="FILE",
+                        help="With --stale: only consider edits to these "
+                             "data/template files (e.g. songs.yaml)")
     args = parser.parse_args()
 
+    # ------------------------------------------------------------------
+    # Data and maintenance modes — no bulletin is built.
+    # ------------------------------------------------------------------
+    if args.compile_data:
+        from bulletin.data.bundle import BUNDLE_PATH, compile_bundle
+        count = compile_bundle()
+        print(f"Compiled {count} YAML file(s) into {BUNDLE_PATH}")
+        return
+
+    if args.prefetch_burial_readings:
+        from bulletin.sources.burial_readings import prefetch_burial_readings
+        print("Prefetching burial-office readings...")
+        prefetch_burial_readings(force_fetch=args.force_fetch).print_console()
+        return
+
+    if args.stale:
+        _run_stale(args.changed, rebuild=args.rebuild,
+                   coalesce_runs=args.coalesce_runs,
+                   deterministic=args.deterministic,
+                   prompt_fn=None if args.no_prompt else prompt_choice)
+        return
+
+    if args.check:
+        _run_check(args.date, args.weeks, force_fetch=args.force_fetch,
+                   refs_only=args.refs_only)
+        return
+
     # ------------------------------------------------------------------
     # Funeral / memorial branch — entirely separate from the Sunday flow.
     # ------------------------------------------------------------------
+    if args.funeral and args.check_readings:
+        _check_funeral_readings(args.funeral)
+        return
+
     if args.funeral:
         _run_funeral(args.funeral, output_dir=Path("output"),
-                     output_path=Path(args.output) if args.output else None)
+                     output_path=Path(args.output) if args.output else None,
+                     force_fetch=args.force_fetch)
         return
 
     if not args.date:
         parser.error("date is required (or pass --funeral <slug>)")
 
+    if (args.month or args.through or args.aac_bundle) \
+            and args.service != "hidden_springs":
+        parser.error("--month, --through and --aac-bundle need "
+                     "--service hidden_springs")
+
+    if args.month or args.through:
+        _run_hidden_springs_batch(args, prompt_fn=None if args.no_prompt
+                                  else prompt_choice)
+        return
+
     try:
         target_date = datetime.strptime(args.date, "%Y-%m-%d").date()
     except ValueError:
@@ -98,6 +212,9 @@ def main():
         output_path=Path(args.output) if args.output else None,
         reading_sheets=args.reading_sheets,
         force_fetch=args.force_fetch,
+        rebuild=args.rebuild,
+        coalesce_runs=args.coalesce_runs,
+        deterministic=args.deterministic,
     )
     prompt_fn = None if args.no_prompt else prompt_choice
 
@@ -107,6 +224,9 @@ def main():
         print(f"Error: {e}")
         sys.exit(1)
 
+    if args.aac_bundle:
+        _write_aac_bundle([result])
+
     # Unified post-generation TODO report. Prints nothing if the run had
     # no warnings/blockers/manual items, so clean runs stay quiet.
     result.report.print_console()
@@ -114,79 +234,223 @@ def main():
     print("\nDone.")
 
 
-def _run_funeral(slug_or_path: str, *, output_dir: Path,
-                  output_path: Path | None) -> None:
-    """Generate a funeral / memorial bulletin from a per-service YAML.
+def _run_hidden_springs_batch(args, *, prompt_fn) -> None:
+    """Build a month (or date range) of Hidden Springs bulletins."""
+    from datetime import timedelta
+    from bulletin.runner import run_hidden_springs_range
+
+    try:
+        if args.month:
+            first = datetime.strptime(args.date[:7], "%Y-%m").date()
+            start = first
+            end = (first + timedelta(days=32)).replace(day=1)
+        else:
+            start = datetime.strptime(args.date, "%Y-%m-%d").date()
+            end = (datetime.strptime(args.through, "%Y-%m-%d").date()
+                   + timedelta(days=1))
+    except ValueError:
+        print("Error: Invalid date. Use YYYY-MM-DD (or YYYY-MM with --month).")
+        sys.exit(1)
 
-    Loads the YAML, fetches scripture for every reading reference it
-    names, then runs ``FuneralBuilder``. Output filename mirrors the
-    convention used by St. Andrew's existing Pages bulletins,
-    e.g. ``2026-01-31 - Burial of the Dead - Annette Cox.docx``.
+    last = end - timedelta(days=1)
+    print(f"Generating Hidden Springs bulletins for "
+          f"{start.strftime('%B %-d')} – {last.strftime('%B %-d, %Y')}...")
+    options = RunOptions(
+        target_date=start,
+        service="hidden_springs",
+        output_dir=Path("output"),
+        force_fetch=args.force_fetch,
+        rebuild=args.rebuild,
+        coalesce_runs=args.coalesce_runs,
+        deterministic=args.deterministic,
+    )
+    try:
+        results = run_hidden_springs_range(
+            start, end, options, max_workers=args.jobs, prompt_fn=prompt_fn)
+    except RunAborted as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    uploads = [(b.output_path.name, b.aac_manifest)
+               for r in results for b in r.bulletins if b.aac_manifest]
+    if uploads:
+        print("\n=== AAC files for upload, all dates ===")
+        for name, manifest in uploads:
+            print(f"  {name}")
+            for slot, filename in manifest:
+                print(f"      {slot}: {filename}")
+
+    if args.aac_bundle and results:
+        _write_aac_bundle(results)
+
+    for result in results:
+        if result.report:
+            print(f"\n{result.target_date.isoformat()}:")
+            result.report.print_console()
+
+    print("\nDone.")
+
+
+def _write_aac_bundle(results) -> None:
+    """Zip the not-yet-uploaded AAC files for *results* into output/.
+
+    A missing file is reported on the report of each date that uses it.
     """
-    from bulletin.sources.funeral_data import load_service
-    from bulletin.sources.scripture import fetch_reading
-    from bulletin.sources.songs import lookup_song
-    from bulletin.sources.music_11am import parse_11am_identifier
-    from bulletin.document.funeral_builder import FuneralBuilder
+    from bulletin.aac_bundle import build_aac_bundle, bundle_name
 
-    fd = load_service(slug_or_path)
-    print(f"Generating funeral bulletin: {fd.slug}")
-    print(f"  {fd.cover_subtitle_resolved} — Rite {fd.rite}, "
-          f"HC={fd.holy_eucharist['enabled']}, "
-          f"commendation={fd.include_commendation}, "
-          f"committal={fd.include_committal}")
-
-    # ----- Scripture --------------------------------------------------
-    # Psalms come from the BCP Coverdale psalter (bulletin/data/bcp_texts/
-    # psalms.yaml) so they render with the same hanging-indent verse
-    # layout as Sunday bulletins. Other readings come from oremus.
-    from bulletin.sources.psalms import get_psalm
-    scripture = {}
-    psalm_ref = fd.readings.get("psalm")
-    if psalm_ref:
+    output_dir = Path("output")
+    name = bundle_name(results[0].target_date, results[-1].target_date)
+    bundle = build_aac_bundle(
+        [[entry for b in r.bulletins for entry in b.aac_manifest]
+         for r in results],
+        output_dir / name, reports=[r.report for r in results])
+    if bundle.path is None:
+        print("\nNo new AAC files to upload"
+              + (f" ({len(bundle.uploaded)} already uploaded)."
+                 if bundle.uploaded else "."))
+        return
+    print(f"\n=== AAC upload bundle: {bundle.path} ===")
+    for filename in bundle.added:
+        print(f"  {filename}")
+    if bundle.uploaded:
+        print(f"  ({len(bundle.uploaded)} already uploaded, left out)")
+
+
+def _run_stale(changed: list[str] | None, *, rebuild: bool,
+               coalesce_runs: bool = False, deterministic: bool = False,
+               prompt_fn) -> None:
+    """List (and optionally rebuild) bulletins invalidated by data edits.
+
+    A date's stale Sunday services are rebuilt in one run, so the sheets
+    and readings are fetched once and prompt choices are shared.
+    """
+    from datetime import date
+    from bulletin.dependencies import find_stale
+
+    stale = find_stale(Path("output"), changed, since=date.today())
+    if not stale:
+        print("No upcoming bulletins are stale.")
+        return
+
+    print(f"{len(stale)} stale bulletin(s):")
+    for s in stale:
+        print(f"  {s.output_path.name}")
+        for key in s.changed_keys:
+            print(f"      changed: {key}")
+    if not rebuild:
+        print("\nRe-run with --rebuild to regenerate them.")
+        return
+
+    # Sunrise and Hidden Springs come from their own sheet rows, so
+    # they can't share a run with the Sunday services.
+    runs: dict[tuple, list[str]] = {}
+    for s in stale:
+        kind = s.service if s.service in ("sunrise", "hidden_springs") else "all"
+        runs.setdefault((s.target_date, kind), []).append(s.service)
+    order = {time: i for i, time in enumerate(SERVICE_TIMES)}
+    for services in runs.values():
+        services.sort(key=lambda time: order.get(time, len(order)))
+
+    for (target_date, kind), services in runs.items():
+        print(f"\nRebuilding {target_date} ({', '.join(services)})...")
+        options = RunOptions(
+            target_date=target_date,
+            service=kind,
+            services=services if kind == "all" else None,
+            output_dir=Path("output"),
+            rebuild=True,
+            coalesce_runs=coalesce_runs,
+            deterministic=deterministic,
+        )
         try:
-            scripture[psalm_ref] = get_psalm(psalm_ref).to_lines()
-        except Exception as e:
-            print(f"  Warning: could not look up {psalm_ref}: {e}")
-    for ref in (fd.readings.get("first"),
-                 fd.readings.get("second"),
-                 fd.readings.get("gospel")):
-        if not ref:
+            result = run_generation(options, prompt_fn=prompt_fn)
+        except RunAborted as e:
+            print(f"Error: {e}")
             continue
+        result.report.print_console()
+
+
+def _run_check(start: str | None, weeks: int, *, force_fetch: bool,
+               refs_only: bool = False) -> None:
+    """Print a per-date punch list for the upcoming weeks."""
+    from datetime import date, timedelta
+    from bulletin.runner import check_references, check_upcoming
+
+    try:
+        start_date = (datetime.strptime(start, "%Y-%m-%d").date() if start
+                      else date.today())
+    except ValueError:
+        print(f"Error: Invalid date format '{start}'. Use YYYY-MM-DD.")
+        sys.exit(1)
+
+    if refs_only:
+        print(f"Checking scripture references for {weeks} week(s) from "
+              f"{start_date.strftime('%B %-d, %Y')}...")
         try:
-            scripture[ref] = fetch_reading(ref)
-        except Exception as e:
-            print(f"  Warning: could not fetch {ref}: {e}")
-
-    # ----- Song lookup -----------------------------------------------
-    # Funerals draw from the 11am music pool (full hymnals + songbook).
-    # Wrap lookup_song with a hymnal-stub fallback: if the title
-    # carries a "#NNN" prefix and the catalog has no full lyrics, we
-    # synthesize a header-only stub so the bulletin still prints the
-    # title + hymnal reference (matches the 11am Sunday pipeline's
-    # _lookup_slot behavior).
-    def song_lookup_fn(title: str, service: str):
-        result = lookup_song(title, service="11am")
-        if result and result.get("sections"):
-            return result
-        parsed = parse_11am_identifier(title)
-        if parsed.get("hymnal_number"):
-            return {
-                "title":         result["title"] if result else (parsed.get("title") or title),
-                "hymnal_number": parsed["hymnal_number"],
-                "hymnal_name":   parsed.get("hymnal_name") or "Hymnal 1982",
-                "tune_name":     (result or {}).get("tune_name"),
-                "sections":      [],   # header-only render
-            }
-        return result   # may be None — renderer prints "[Song lyrics not found]"
-
-    builder = FuneralBuilder(fd, scripture, song_lookup_fn)
-    doc = builder.build()
-
-    out = output_path or (output_dir / builder.output_filename())
-    out.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(out))
-    print(f"\nWrote: {out}")
+            report = check_references(start_date,
+                                      start_date + timedelta(weeks=weeks))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if not report:
+            print("All references are within their books and chapters.")
+            return
+        report.print_console()
+        sys.exit(1)
+
+    print(f"Checking {weeks} week(s) from {start_date.strftime('%B %-d, %Y')}...")
+    try:
+        checks = check_upcoming(start_date, weeks, force_fetch=force_fetch)
+    except RunAborted as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    for check in checks:
+        services = ", ".join(check.services) or "no services"
+        status = "OK" if not check.report else f"{len(check.report)} issue(s)"
+        print(f"\n{check.target_date.isoformat()}  {check.title}  "
+              f"[{services}]  {status}")
+        check.report.print_console()
+
+    if any(c.report.has_blockers() for c in checks):
+        sys.exit(1)
+
+
+def _check_funeral_readings(slug_or_path: str) -> None:
+    """Report whether a funeral YAML's readings are all available offline."""
+    from bulletin.sources.burial_readings import check_readings_offline
+    from bulletin.sources.funeral_data import load_service
+
+    fd = load_service(slug_or_path)
+    missing = check_readings_offline(fd.readings)
+    if not missing:
+        print(f"{fd.slug}: all readings available offline.")
+        return
+    print(f"{fd.slug}: not available offline:")
+    for ref in missing:
+        print(f"  - {ref}")
+    sys.exit(1)
+
+
+def _run_funeral(slug_or_path: str, *, output_dir: Path,
+                  output_path: Path | None, force_fetch: bool = False) -> None:
+    """Generate a funeral / memorial bulletin from a per-service YAML.
+
+    Thin wrapper over ``bulletin.runner.run_funeral_generation``.
+    """
+    options = FuneralRunOptions(
+        service=slug_or_path,
+        output_dir=output_dir,
+        output_path=output_path,
+        force_fetch=force_fetch,
+    )
+    try:
+        result = run_funeral_generation(options)
+    except RunAborted as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    result.report.print_console()
 
 
 if __name__ == "__main__":
@@ -1,26 +1,44 @@
 #!/usr/bin/env python3
-"""One-time script to build hidden_springs_songs.yaml from AAC files + lyrics sources.
+"""Build hidden_springs_songs.yaml from AAC files + lyrics sources.
 
 Scans AAC files, cross-references songs.yaml and the Google Sheet lyrics CSV,
 and produces a complete catalog with lyrics populated where available.
 
+A full build rewrites the catalog from scratch. --incremental instead
+compares the library with the manifest from the last build (path, size,
+mtime, parsed entry), and merges only the added and removed recordings
+into the existing catalog — titles, lyrics, and other hand edits stay as
+they are. songs.yaml and the lyrics sheet are only read when a new song
+needs lyrics, and the sheet comes from the local copy saved by the last
+fetch unless --refresh-lyrics is given.
+
 Usage:
     python scripts/build_hs_catalog.py
+    python scripts/build_hs_catalog.py --incremental
+    python scripts/build_hs_catalog.py --incremental --refresh-lyrics
 """
 
+import argparse
 import csv
 import io
+import json
 import os
 import re
 import urllib.request
 from pathlib import Path
 
 import yaml
+from ruamel.yaml import YAML
+from ruamel.yaml.emitter import Emitter
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 AAC_BASE = PROJECT_ROOT / "hidden_springs_music" / "sorted_hidden_springs_aac_files"
 SONGS_YAML = PROJECT_ROOT / "bulletin" / "data" / "hymns" / "songs.yaml"
 OUTPUT_YAML = PROJECT_ROOT / "bulletin" / "data" / "hymns" / "hidden_springs_songs.yaml"
+# Local state for --incremental, kept beside the (unversioned) library
+SCAN_MANIFEST = AAC_BASE.parent / ".catalog_manifest.json"
+LYRICS_CSV_CACHE = AAC_BASE.parent / ".lyrics_sheet.csv"
+MANIFEST_FORMAT = 1
 LYRICS_SHEET_URL = (
     "https://docs.google.com/spreadsheets/d/"
     "1vX9llfMg0bAWZiSM10RaAsgExyKIN5YflKaaaEPoOOI/gviz/tq?tqx=out:csv"
@@ -37,6 +55,7 @@ CATEGORY_MAP = {
     "Other": "other",
     "Prelude - Postlude": "prelude_postlude",
 }
+AAC_SUFFIXES = (".m4a", ".aac")
 
 
 def parse_aac_filename(filename: str, category: str):
@@ -87,34 +106,39 @@ def parse_aac_filename(filename: str, category: str):
     }
 
 
+def new_song(parsed):
+    """A song dict for the first recording of a piece."""
+    is_no_lyrics = (
+        parsed["category_key"] == "prelude_postlude"
+        or parsed["title"].lower() in NO_LYRICS_TITLES
+        or (parsed["hymnal_num"] or "") in NO_LYRICS_HYMNAL
+    )
+    return {
+        "title": parsed["title"],
+        "hymnal_num": parsed["hymnal_num"],
+        "category": parsed["category_key"],
+        "no_lyrics": is_no_lyrics,
+        "aac_files": [],
+        "sections": [],
+    }
+
+
 def scan_aac_files():
     """Scan AAC directory and group by song."""
     songs = {}  # key: (hymnal_num or None, cleaned_title) -> song dict
 
-    for category in ["Hymnal 1982", "Other", "Prelude - Postlude"]:
+    for category in CATEGORY_MAP:
         cat_path = AAC_BASE / category
         if not cat_path.is_dir():
             continue
         for f in sorted(cat_path.iterdir()):
-            if f.suffix not in (".m4a", ".aac"):
+            if f.suffix not in AAC_SUFFIXES:
                 continue
             parsed = parse_aac_filename(f.name, category)
             key = (parsed["hymnal_num"], parsed["title"])
 
             if key not in songs:
-                is_no_lyrics = (
-                    parsed["category_key"] == "prelude_postlude"
-                    or parsed["title"].lower() in NO_LYRICS_TITLES
-                    or (parsed["hymnal_num"] or "") in NO_LYRICS_HYMNAL
-                )
-                songs[key] = {
-                    "title": parsed["title"],
-                    "hymnal_num": parsed["hymnal_num"],
-                    "category": parsed["category_key"],
-                    "no_lyrics": is_no_lyrics,
-                    "aac_files": [],
-                    "sections": [],
-                }
+                songs[key] = new_song(parsed)
             songs[key]["aac_files"].append(parsed["aac_entry"])
 
     return songs
@@ -142,11 +166,20 @@ def load_songs_yaml():
     return by_hymnal, by_title
 
 
-def fetch_lyrics_sheet():
-    """Fetch the Hidden Springs lyrics Google Sheet as CSV."""
-    req = urllib.request.Request(LYRICS_SHEET_URL)
-    with urllib.request.urlopen(req) as resp:
-        data = resp.read().decode("utf-8")
+def fetch_lyrics_sheet(refresh=True):
+    """Fetch the Hidden Springs lyrics Google Sheet as CSV.
+
+    Each fetch is saved locally; with refresh=False that copy is used
+    instead of the network when it exists.
+    """
+    if not refresh and LYRICS_CSV_CACHE.exists():
+        data = LYRICS_CSV_CACHE.read_text(encoding="utf-8")
+    else:
+        req = urllib.request.Request(LYRICS_SHEET_URL)
+        with urllib.request.urlopen(req) as resp:
+            data = resp.read().decode("utf-8")
+        if LYRICS_CSV_CACHE.parent.is_dir():
+            LYRICS_CSV_CACHE.write_text(data, encoding="utf-8")
 
     by_hymnal = {}
     by_title = {}
@@ -225,23 +258,53 @@ def match_lyrics(song, yaml_by_hymnal, yaml_by_title, sheet_by_hymnal, sheet_by_
     return []
 
 
-def build_catalog():
-    """Main: build the hidden_springs_songs.yaml catalog."""
-    print("Scanning AAC files...")
-    songs = scan_aac_files()
-    print(f"  Found {len(songs)} unique songs/pieces")
-
+def load_lyrics_sources(refresh=True):
+    """(yaml_by_hymnal, yaml_by_title, sheet_by_hymnal, sheet_by_title)."""
     print("Loading songs.yaml...")
     yaml_by_hymnal, yaml_by_title = load_songs_yaml()
     print(f"  {len(yaml_by_hymnal)} hymnal entries, {len(yaml_by_title)} title entries")
 
     print("Fetching Google Sheet lyrics...")
     try:
-        sheet_by_hymnal, sheet_by_title = fetch_lyrics_sheet()
+        sheet_by_hymnal, sheet_by_title = fetch_lyrics_sheet(refresh)
         print(f"  {len(sheet_by_hymnal)} hymnal entries, {len(sheet_by_title)} title entries")
     except Exception as e:
         print(f"  Warning: Could not fetch sheet: {e}")
         sheet_by_hymnal, sheet_by_title = {}, {}
+    return yaml_by_hymnal, yaml_by_title, sheet_by_hymnal, sheet_by_title
+
+
+def sort_key(category, hymnal_num, title):
+    """Catalog order: hymnal (by number), then other, then prelude_postlude."""
+    return (
+        {"hymnal": 0, "other": 1, "prelude_postlude": 2}.get(category, 1),
+        int(re.sub(r"[^\d]", "", str(hymnal_num or "9999")) or "9999"),
+        title,
+    )
+
+
+def catalog_entry(song):
+    """The hidden_springs_songs.yaml entry for a scanned song."""
+    entry = {"title": song["title"]}
+    if song["hymnal_num"]:
+        entry["hymnal_number"] = song["hymnal_num"]
+    entry["category"] = song["category"]
+    if song["no_lyrics"]:
+        entry["no_lyrics"] = True
+    entry["aac_files"] = song["aac_files"]
+    if song["sections"]:
+        entry["sections"] = song["sections"]
+    return entry
+
+
+def build_catalog():
+    """Main: build the hidden_springs_songs.yaml catalog."""
+    print("Scanning AAC files...")
+    songs = scan_aac_files()
+    print(f"  Found {len(songs)} unique songs/pieces")
+
+    yaml_by_hymnal, yaml_by_title, sheet_by_hymnal, sheet_by_title = \
+        load_lyrics_sources()
 
     # Match lyrics
     matched = 0
@@ -272,29 +335,12 @@ def build_catalog():
             print(f"    - {t}")
 
     # Build output YAML
-    output = []
     # Sort: hymnal first (by number), then other (by title), then prelude_postlude (by title)
     sorted_songs = sorted(
         songs.values(),
-        key=lambda s: (
-            {"hymnal": 0, "other": 1, "prelude_postlude": 2}[s["category"]],
-            int(re.sub(r"[^\d]", "", s["hymnal_num"] or "9999") or "9999"),
-            s["title"],
-        ),
+        key=lambda s: sort_key(s["category"], s["hymnal_num"], s["title"]),
     )
-
-    for song in sorted_songs:
-        entry = {"title": song["title"]}
-        if song["hymnal_num"]:
-            entry["hymnal_number"] = song["hymnal_num"]
-        entry["category"] = song["category"]
-        if song["no_lyrics"]:
-            entry["no_lyrics"] = True
-        entry["aac_files"] = song["aac_files"]
-        if song["sections"]:
-            entry["sections"] = song["sections"]
-
-        output.append(entry)
+    output = [catalog_entry(song) for song in sorted_songs]
 
     # Write YAML
     with open(OUTPUT_YAML, "w") as f:
@@ -304,6 +350,218 @@ def build_catalog():
     print(f"\nWritten to: {OUTPUT_YAML}")
     print(f"Total entries: {len(output)}")
 
+    # Record what was scanned so the next --incremental run starts here.
+    write_scan_manifest(scan_library(read_scan_manifest())[0])
+
+
+# ---------------------------------------------------------------------------
+# Incremental mode
+# ---------------------------------------------------------------------------
+
+def read_scan_manifest():
+    """{filename: {"size", "mtime_ns", "parsed"}} from the last scan, or {}."""
+    try:
+        with open(SCAN_MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if manifest.get("format") != MANIFEST_FORMAT:
+        return {}
+    return manifest.get("files", {})
+
+
+def write_scan_manifest(files):
+    if not SCAN_MANIFEST.parent.is_dir():
+        return
+    with open(SCAN_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump({"format": MANIFEST_FORMAT, "files": files}, f,
+                  ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def scan_library(previous):
+    """Stat every recording, parsing only filenames not in *previous*.
+
+    Returns (files, added, changed, removed): the manifest for this scan,
+    the parsed entries of new recordings, and the filenames of recordings
+    whose size or mtime changed and of ones that are gone.
+    """
+    files, added, changed = {}, [], []
+    for category in CATEGORY_MAP:
+        cat_path = AAC_BASE / category
+        if not cat_path.is_dir():
+            continue
+        with os.scandir(cat_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for e in entries:
+            if not e.name.endswith(AAC_SUFFIXES) or not e.is_file():
+                continue
+            filename = f"{category}/{e.name}"
+            st = e.stat()
+            known = previous.get(filename)
+            if known is None:
+                parsed = parse_aac_filename(e.name, category)
+                added.append(parsed)
+            else:
+                # The catalog only depends on the filename, so a re-exported
+                # recording just gets its new size and mtime recorded.
+                parsed = known["parsed"]
+                if (known["size"], known["mtime_ns"]) != (st.st_size, st.st_mtime_ns):
+                    changed.append(filename)
+            files[filename] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                               "parsed": parsed}
+    removed = sorted(set(previous) - set(files))
+    return files, added, changed, removed
+
+
+def _song_key(filename):
+    """(hymnal_num, title) parsed from a catalog aac_files filename."""
+    category, _, name = filename.partition("/")
+    if category not in CATEGORY_MAP:
+        return None
+    parsed = parse_aac_filename(name, category)
+    return (parsed["hymnal_num"], parsed["title"])
+
+
+def merge_into_catalog(catalog, added, removed, lyrics_sources):
+    """Add *added* recordings to *catalog* and drop *removed* ones, in place.
+
+    A recording of a piece already in the catalog — found by its title as
+    listed, or as parsed from the filenames it already has — joins that
+    entry's aac_files. Anything else becomes a new entry at its sorted
+    position, with lyrics matched as in a full build; *lyrics_sources* is
+    called for them only if some new entry needs lyrics. Nothing else in
+    an existing entry is touched, and an entry whose last recording is
+    removed is kept (it may have hand-entered lyrics).
+
+    Returns (new_titles, missing_lyrics, emptied_titles, changed).
+    """
+    by_file, by_key = {}, {}
+    for entry in catalog:
+        by_key.setdefault((entry.get("hymnal_number"), entry["title"]), entry)
+        for aac in entry.get("aac_files") or []:
+            by_file[aac["filename"]] = entry
+            by_key.setdefault(_song_key(aac["filename"]), entry)
+
+    new_titles, missing_lyrics, emptied_titles = [], [], []
+    changed = False
+    sources = []
+
+    for parsed in added:
+        filename = parsed["aac_entry"]["filename"]
+        if filename in by_file:
+            continue
+        key = (parsed["hymnal_num"], parsed["title"])
+        entry = by_key.get(key)
+        if entry is not None:
+            entry.setdefault("aac_files", []).append(parsed["aac_entry"])
+        else:
+            song = new_song(parsed)
+            song["aac_files"].append(parsed["aac_entry"])
+            if not song["no_lyrics"]:
+                if not sources:
+                    sources.extend(lyrics_sources())
+                song["sections"] = match_lyrics(song, *sources)
+                if not song["sections"]:
+                    missing_lyrics.append(song["title"])
+            entry = catalog_entry(song)
+            position = sort_key(song["category"], song["hymnal_num"], song["title"])
+            index = next(
+                (i for i, e in enumerate(catalog)
+                 if sort_key(e.get("category"), e.get("hymnal_number"),
+                             e["title"]) > position),
+                len(catalog))
+            catalog.insert(index, entry)
+            by_key[key] = entry
+            new_titles.append(song["title"])
+        by_file[filename] = entry
+        changed = True
+
+    for filename in removed:
+        entry = by_file.pop(filename, None)
+        if entry is None:
+            continue
+        aac_files = entry["aac_files"]
+        for i, aac in enumerate(aac_files):
+            if aac["filename"] == filename:
+                del aac_files[i]
+                changed = True
+                break
+        if not aac_files:
+            emptied_titles.append(entry["title"])
+
+    return new_titles, missing_lyrics, emptied_titles, changed
+
+
+class _CatalogEmitter(Emitter):
+    """Folds long double-quoted scalars the way PyYAML does (ruamel
+    breaks them differently), so an entry the full build wrote comes
+    back byte for byte."""
+    write_double_quoted = yaml.emitter.Emitter.write_double_quoted
+
+
+def _round_trip_yaml():
+    """ruamel.yaml writing like the full build (``yaml.dump`` at width
+    120), so entries the merge doesn't touch keep their text, and
+    hand-written ones their comments, key order, and quote style."""
+    rt = YAML(typ="rt")
+    rt.Emitter = _CatalogEmitter
+    rt.width = 120
+    rt.indent(mapping=2, sequence=2, offset=0)
+    rt.preserve_quotes = True
+    return rt
+
+
+def update_catalog(refresh_lyrics=False):
+    """--incremental: merge library changes since the last scan."""
+    if not OUTPUT_YAML.exists():
+        build_catalog()
+        return
+
+    files, added, changed, removed = scan_library(read_scan_manifest())
+    print(f"Scanned {len(files)} AAC files: {len(added)} new, "
+          f"{len(changed)} changed, {len(removed)} removed")
+
+    if added or removed:
+        rt = _round_trip_yaml()
+        with open(OUTPUT_YAML, encoding="utf-8") as f:
+            catalog = rt.load(f) or []
+        new_titles, missing, emptied, catalog_changed = merge_into_catalog(
+            catalog, added, removed,
+            lambda: load_lyrics_sources(refresh=refresh_lyrics))
+        if catalog_changed:
+            with open(OUTPUT_YAML, "w", encoding="utf-8") as f:
+                rt.dump(catalog, f)
+            print(f"\nUpdated: {OUTPUT_YAML}")
+        for title in new_titles:
+            print(f"  + {title}")
+        if missing:
+            print("  Missing lyrics:")
+            for title in missing:
+                print(f"    - {title}")
+        if emptied:
+            print("  No recordings left (entry kept):")
+            for title in emptied:
+                print(f"    - {title}")
+
+    write_scan_manifest(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build hidden_springs_songs.yaml from the AAC library")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only process recordings added or removed "
+                             "since the last run and merge them into the "
+                             "existing catalog (keeps hand edits)")
+    parser.add_argument("--refresh-lyrics", action="store_true",
+                        help="With --incremental: fetch the lyrics sheet "
+                             "again instead of using the saved copy")
+    args = parser.parse_args()
+    if args.incremental:
+        update_catalog(refresh_lyrics=args.refresh_lyrics)
+    else:
+        build_catalog()
+
 
 if __name__ == "__main__":
-    build_catalog()
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: build a full 11 am bulletin with the low-level paragraph
+emitter (bulletin/document/emitter.py) and again with the formatting
+helpers routed through the python-docx API, and compare.
+
+Runs offline — the sheet rows are fixed below and the readings come
+from scripture_cache.json. The BCP fragment cache is cleared before
+every build so both sides render every block.
+
+Usage:
+    python tools/bench_emitter.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lxml import etree
+
+from bulletin.document import emitter, formatting, fragments
+from bulletin.document.builder import BulletinBuilder
+from bulletin.report import RunReport
+from bulletin.sources.google_sheet import (
+    BulletinData, ClergyRotaRow, LiturgicalScheduleRow, ServiceMusicRow,
+)
+from bulletin.sources.music_11am import get_11am_music_slots
+from bulletin.sources.scripture import fetch_readings
+from bulletin.sources.songs import lookup_song
+
+TARGET = date(2026, 4, 12)
+TITLE = "Second Sunday of Easter"
+
+
+def _sheet_data() -> BulletinData:
+    schedule = LiturgicalScheduleRow(
+        service_type="Sunday", date=TARGET, title=TITLE, proper="-",
+        color="White", eucharistic_prayer="A", preface="",
+        reading="Acts 2:14a, 22-32", psalm="Psalm 16 responsively",
+        gospel="John 20:19-31", pop_form="I", special_blessing="",
+        closing_prayer="Almighty", dismissal="2", notes="")
+    clergy = ClergyRotaRow(
+        service_type="Sunday", date=TARGET, title=TITLE,
+        preacher_9am="", preacher_11am="", preacher_8am="")
+    music = ServiceMusicRow(
+        service_type="Sunday", date=TARGET, title=TITLE,
+        processional="#207 Jesus Christ is risen today",
+        song_of_praise="#S280", sequence="#193", anthem="Anthem",
+        communion="#305; #306", recessional="#208")
+    return BulletinData(schedule=schedule, clergy=clergy, music=music)
+
+
+def build_11am(data: BulletinData, scripture: dict):
+    fragments.clear_cache()
+    builder = BulletinBuilder(
+        target_date=TARGET, sheet_data=data,
+        music_data=get_11am_music_slots(data.music),
+        scripture_readings=scripture, song_lookup_fn=lookup_song,
+        parish_ministries="[ministries]", service_time="11 am",
+        report=RunReport())
+    builder.resolve_all()
+    return builder.build()
+
+
+def _time(data, scripture, repeat: int) -> tuple[list[float], bytes]:
+    times, xml = [], b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        doc = build_11am(data, scripture)
+        times.append(time.perf_counter() - start)
+        xml = etree.tostring(doc.element)
+    return times, xml
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = _sheet_data()
+    scripture = fetch_readings({"reading": data.schedule.reading,
+                                "gospel": data.schedule.gospel})
+    build_11am(data, scripture)     # warm the YAML and song caches
+
+    fast, fast_xml = _time(data, scripture, args.repeat)
+
+    formatting.emit_paragraph = emitter._reference_emit_paragraph
+    formatting.append_runs = emitter._reference_append_runs
+    try:
+        slow, slow_xml = _time(data, scripture, args.repeat)
+    finally:
+        formatting.emit_paragraph = emitter.emit_paragraph
+        formatting.append_runs = emitter.append_runs
+
+    print(f"11 am bulletin, best of {args.repeat}:")
+    print(f"  python-docx API  {min(slow) * 1000:7.1f} ms "
+          f"(median {statistics.median(slow) * 1000:.1f})")
+    print(f"  emitter          {min(fast) * 1000:7.1f} ms "
+          f"(median {statistics.median(fast) * 1000:.1f})")
+    print(f"  speed-up         {min(slow) / min(fast):.2f}x")
+    print(f"  identical XML    {fast_xml == slow_xml}")
+
+
+if __name__ == "__main__":
+    main()
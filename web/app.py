@@ -8,10 +8,15 @@ library — nothing in ``bulletin/`` imports from ``web/``.
 Routes (v1):
 
   GET  /                  generate.html (placeholder for v1)
+  GET  /stale             upcoming bulletins whose data changed since build
   GET  /songs             searchable list of songs
   GET  /songs/new         add-song form (paste OR markdown upload)
   POST /songs/preview     parse + render a preview without saving
   POST /songs/save        parse + write to songs.yaml / hidden_springs_songs.yaml
+  POST /songs/alias       add a planner spelling to a song's ``identifiers``
+
+``POST /run`` hands each bulletin to a pool of pre-warmed generation
+processes (``web/workers.py``) started with the app.
 
 Both libraries (the main 8/9/11 am ``songs.yaml`` and
 ``hidden_springs_songs.yaml``) share the same templates; the
@@ -26,8 +31,10 @@ from __future__ import annotations
 
 import html
 import io
+import os
 import re
 import uuid
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -41,9 +48,12 @@ from markupsafe import Markup
 from ruamel.yaml import YAML
 
 from bulletin.data.loader import load_pop_forms
-from bulletin.report import RunReport
-from bulletin.runner import RunAborted, RunOptions, run_generation
+from bulletin.dependencies import find_stale
+from bulletin.document.ir import render_html
+from bulletin.document.sections.word_of_god import pop_blocks
+from bulletin.runner import RunAborted, RunOptions, check_upcoming
 from web.song_parser import parse_markdown, parse_paste
+from web.workers import DEFAULT_SIZE, WorkerPool
 
 
 # ---------------------------------------------------------------------------
@@ -102,7 +112,22 @@ def _yaml_dump_one(song: dict) -> str:
 # App + templates
 # ---------------------------------------------------------------------------
 
-app = FastAPI(title="St. Andrew's Bulletin Generator")
+# Warm generation workers (web/workers.py). BULLETIN_UI_WORKERS=0 runs
+# every bulletin in the server process instead.
+_pool = WorkerPool(size=int(os.environ.get("BULLETIN_UI_WORKERS", DEFAULT_SIZE)))
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    if _pool.size > 0:
+        _pool.start()
+    try:
+        yield
+    finally:
+        _pool.shutdown()
+
+
+app = FastAPI(title="St. Andrew's Bulletin Generator", lifespan=_lifespan)
 
 app.mount(
     "/static",
@@ -119,10 +144,10 @@ templates = Jinja2Templates(directory=str(WEB_DIR / "templates"))
 _PLACEHOLDER_RE = re.compile(r"\{[a-zA-Z0-9_]+\}")
 
 
-def _highlight_placeholders(text: str) -> Markup:
+def _highlight_placeholders(text: str, *, escape: bool = True) -> Markup:
     if text is None:
         return Markup("")
-    escaped = html.escape(str(text))
+    escaped = html.escape(str(text)) if escape else str(text)
     out = _PLACEHOLDER_RE.sub(
         lambda m: f"<code>{m.group(0)}</code>", escaped)
     return Markup(out)
@@ -203,6 +228,7 @@ def run_bulletin(
     service: str = Form("all"),
     reading_sheets: Optional[str] = Form(None),
     force_fetch: Optional[str] = Form(None),
+    rebuild: Optional[str] = Form(None),
 ):
     try:
         parsed_date = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -217,24 +243,16 @@ def run_bulletin(
         output_dir=REPO_ROOT / "output",
         reading_sheets=bool(reading_sheets),
         force_fetch=bool(force_fetch),
+        rebuild=bool(rebuild),
     )
 
-    # Capture all progress lines into a buffer so the report page can
-    # show them (collapsed by default). Web runs are non-interactive —
-    # the CLI's prompt_choice() is replaced with None, so any
-    # disambiguation falls through to the song-list defaults.
-    console_lines: list[str] = []
-    def progress(line: str) -> None:
-        console_lines.append(str(line))
-
-    report = RunReport()
+    # The run goes to a warm worker, which captures its progress lines
+    # so the report page can show them (collapsed by default). Web runs
+    # are non-interactive — the CLI's prompt_choice() is replaced with
+    # None, so any disambiguation falls through to the song-list
+    # defaults.
     try:
-        result = run_generation(
-            options,
-            prompt_fn=None,
-            progress_fn=progress,
-            report=report,
-        )
+        result, console_lines = _pool.run(options)
     except RunAborted as e:
         url = request.url_for("home").include_query_params(error=str(e))
         return RedirectResponse(url=str(url), status_code=303)
@@ -257,6 +275,62 @@ def run_bulletin(
     return RedirectResponse(url=str(url), status_code=303)
 
 
+@app.get("/stale", response_class=HTMLResponse, name="stale_list")
+def stale_list(request: Request) -> HTMLResponse:
+    stale = find_stale(REPO_ROOT / "output", since=date.today())
+    return templates.TemplateResponse(
+        request, "stale.html",
+        {
+            "active": "stale",
+            "stale": [
+                {
+                    "name":          s.output_path.name,
+                    "target_date":   s.target_date,
+                    "service":       s.service,
+                    "service_label": _SERVICE_LABELS.get(s.service, s.service),
+                    "changed_keys":  s.changed_keys,
+                }
+                for s in stale
+            ],
+        },
+    )
+
+
+@app.get("/check", response_class=HTMLResponse, name="check_upcoming")
+def check_list(request: Request, weeks: int = Query(4, ge=1, le=12)) -> HTMLResponse:
+    """Punch list of data problems for the next *weeks* weeks.
+
+    Same as ``generate.py --check``: fetch and resolve every service,
+    build nothing.
+    """
+    checks, error = [], None
+    try:
+        checks = check_upcoming(date.today(), weeks,
+                                progress_fn=lambda line: None)
+    except RunAborted as e:
+        error = str(e)
+    except Exception as e:  # pragma: no cover — surface unexpected errors
+        error = f"Unexpected error: {e}"
+    return templates.TemplateResponse(
+        request, "check.html",
+        {
+            "active": "check",
+            "weeks": weeks,
+            "checks": [
+                {
+                    "target_date":   c.target_date,
+                    "title":         c.title,
+                    "service_labels": [_SERVICE_LABELS.get(s, s)
+                                       for s in c.services],
+                    "report":        c.report,
+                }
+                for c in checks
+            ],
+            "error": error,
+        },
+    )
+
+
 @app.get("/report/{run_id}", response_class=HTMLResponse, name="run_report")
 def run_report(request: Request, run_id: str) -> HTMLResponse:
     run = _RECENT_RUNS.get(run_id)
@@ -524,9 +598,16 @@ async def song_save(
     songs.append(song)
     _save_library(library, songs)
 
-    # Invalidate every in-process YAML cache so the bulletin builder
-    # picks up the new song the next time it generates.
-    #
+    _clear_song_caches()
+
+    url = request.url_for("songs_list").include_query_params(library=library)
+    return RedirectResponse(url=str(url), status_code=303)
+
+
+def _clear_song_caches() -> None:
+    """Invalidate every in-process YAML cache so the bulletin builder
+    picks up a saved song or alias the next time it generates.
+    """
     # ``bulletin.data.loader.clear_all_caches()`` covers every file that
     # goes through that loader (BCP texts, prayers, blessings, POP
     # forms, etc.). The songs catalog has its OWN module-level cache in
@@ -541,8 +622,44 @@ async def song_save(
         clear_songs_cache()
     except Exception:  # pragma: no cover — defensive
         pass
+    # The generation workers hold their own caches; replace them with
+    # workers warmed from the saved file.
+    _pool.refresh()
 
-    url = request.url_for("songs_list").include_query_params(library=library)
+
+@app.post("/songs/alias", name="song_add_alias")
+def song_add_alias(
+    request: Request,
+    library: str = Form("main"),
+    i: int = Form(..., ge=0),
+    title: str = Form(...),
+    alias: str = Form(...),
+):
+    """Teach the catalog a planner spelling: append *alias* to the
+    ``identifiers:`` of entry *i*.
+
+    The report's "did you mean" suggestions post here. *title* is the
+    entry's title as the suggestion saw it; if the file has shifted
+    since, nothing is written.
+    """
+    if library not in LIBRARY_FILES:
+        library = "main"
+    alias = alias.strip()
+    songs = _load_library(library)
+    if i >= len(songs) or songs[i].get("title") != title or not alias:
+        url = request.url_for("songs_list").include_query_params(library=library)
+        return RedirectResponse(url=str(url), status_code=303)
+
+    song = songs[i]
+    identifiers = song.get("identifiers")
+    if identifiers is None:
+        song["identifiers"] = identifiers = []
+    if alias.lower() not in (str(a).lower() for a in identifiers):
+        identifiers.append(alias)
+        _save_library(library, songs)
+        _clear_song_caches()
+
+    url = request.url_for("song_view").include_query_params(library=library, i=i)
     return RedirectResponse(url=str(url), status_code=303)
 
 
@@ -658,5 +775,9 @@ def prayer_view(request: Request, key: str = Query(...)) -> HTMLResponse:
             "key":    key,
             "form":   form,
             "hint":   _planner_hint(form),
+            # Laid out by the same IR blocks the bulletin is built from.
+            "preview": _highlight_placeholders(
+                render_html(pop_blocks(form.get("elements") or [])),
+                escape=False),
         },
     )
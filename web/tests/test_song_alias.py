@@ -0,0 +1,43 @@
+"""The report's one-click "add alias" action writes the alias into the
+song's ``identifiers:`` list.
+
+Run via::
+
+    python3.11 -m pytest web/tests/test_song_alias.py -v
+"""
+
+from __future__ import annotations
+
+
+def test_add_alias_appends_once(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import web.app as app
+
+    library = tmp_path / "songs.yaml"
+    library.write_text(
+        "- title: I the Lord of Sea and Sky\n"
+        "  services: 9am  # Schutte\n"
+        "  sections: []\n"
+        "- title: Amazing grace!\n"
+        "  identifiers:\n"
+        "  - Amazing Grace\n"
+        "  sections: []\n",
+        encoding="utf-8")
+    monkeypatch.setitem(app.LIBRARY_FILES, "main", library)
+    client = TestClient(app.app)
+
+    form = {"library": "main", "i": "0", "title": "I the Lord of Sea and Sky",
+            "alias": "Here I Am Lord"}
+    resp = client.post("/songs/alias", data=form, follow_redirects=False)
+    assert resp.status_code == 303
+    assert "/songs/view" in resp.headers["location"]
+    client.post("/songs/alias", data=form, follow_redirects=False)
+
+    text = library.read_text(encoding="utf-8")
+    assert text.count("Here I Am Lord") == 1
+    assert "# Schutte" in text
+
+    # A stale suggestion (title no longer at that position) writes nothing.
+    client.post("/songs/alias", data=dict(form, i="1"), follow_redirects=False)
+    assert library.read_text(encoding="utf-8") == text
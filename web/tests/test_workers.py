@@ -0,0 +1,55 @@
+"""Warm worker pool: runs fall back in-process until it's started, and a
+changed data file swaps in freshly warmed workers.
+
+Run via::
+
+    python3.11 -m pytest web/tests/test_workers.py -v
+"""
+
+from __future__ import annotations
+
+import time
+
+
+def _wait_for(condition, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def test_unstarted_pool_runs_in_process(monkeypatch):
+    import web.workers as workers
+
+    def fake_run(options, prompt_fn, progress_fn, report):
+        progress_fn("Building 9 am...")
+        return ("result", options)
+
+    monkeypatch.setattr(workers, "run_generation", fake_run)
+    pool = workers.WorkerPool(size=1)
+    pool.refresh()                      # no-op before start()
+
+    assert not pool.ready
+    assert pool.run("opts") == (("result", "opts"), ["Building 9 am..."])
+
+
+def test_changed_file_swaps_in_warm_workers(monkeypatch, tmp_path):
+    import web.workers as workers
+
+    watched = tmp_path / "songs.yaml"
+    watched.write_text("- title: A\n", encoding="utf-8")
+    monkeypatch.setattr(workers, "WATCHED", ((tmp_path, "*.yaml"),))
+
+    pool = workers.WorkerPool(size=1, poll_seconds=0.05)
+    pool.start()
+    try:
+        _wait_for(lambda: pool.ready)
+        first = pool._executor
+        first_pid = first.submit(workers._ready).result()
+
+        watched.write_text("- title: A\n- title: B\n", encoding="utf-8")
+        _wait_for(lambda: pool._executor is not first)
+
+        assert pool._executor.submit(workers._ready).result() != first_pid
+    finally:
+        pool.shutdown()
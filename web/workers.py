@@ -0,0 +1,206 @@
+"""
+Warm generation workers for the web UI.
+
+``POST /run`` used to call ``run_generation()`` inside the uvicorn
+process, so the first run after launch paid for parsing the psalter,
+songs, and BCP texts and for python-docx's first document — and so did
+the first run after every song save, because the save clears those
+caches. ``WorkerPool`` keeps a few generation processes that did all of
+that (``bulletin.runner.warm_caches()``) when they started, and hands
+each run to an idle one.
+
+When a data file changes the pool doesn't clear anything in its
+workers: it starts a fresh set in the background, waits for them to
+warm, swaps them in, and lets the old set finish whatever it's running.
+Changes are noticed two ways:
+
+  - the web app calls ``refresh()`` after it writes a YAML file
+  - a watcher thread polls the size and mtime of every
+    ``bulletin/data/**/*.yaml`` and ``templates/*.docx`` (hand edits)
+
+Runs go through ``run()``, which falls back to running in-process when
+the pool isn't started (tests, ``BULLETIN_UI_WORKERS=0``) or a worker
+died.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Optional
+
+from bulletin.report import RunReport
+from bulletin.runner import RunOptions, RunResult, run_generation, warm_caches
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WATCHED = (
+    (REPO_ROOT / "bulletin" / "data", "**/*.yaml"),
+    (REPO_ROOT / "templates", "*.docx"),
+)
+
+DEFAULT_SIZE = 2
+POLL_SECONDS = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _warm_worker() -> None:
+    """Process initializer: load everything a run reads."""
+    try:
+        warm_caches()
+    except Exception:   # pragma: no cover — a cold worker still works
+        pass
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _generate(options: RunOptions) -> tuple[RunResult, list[str]]:
+    """One web run in a worker: the result plus its progress lines."""
+    console_lines: list[str] = []
+    result = run_generation(options, prompt_fn=None,
+                            progress_fn=lambda line: console_lines.append(str(line)),
+                            report=RunReport())
+    return result, console_lines
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+def _data_signature() -> tuple:
+    """(path, size, mtime) of every watched file."""
+    entries = []
+    for root, pattern in WATCHED:
+        for path in sorted(root.glob(pattern)):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((str(path), st.st_size, st.st_mtime_ns))
+    return tuple(entries)
+
+
+class WorkerPool:
+    """A pool of warm generation processes, replaced when data changes."""
+
+    def __init__(self, size: int = DEFAULT_SIZE,
+                 poll_seconds: float = POLL_SECONDS):
+        self.size = size
+        self.poll_seconds = poll_seconds
+        self._context = multiprocessing.get_context("spawn")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._started = False
+        self._refreshing = False
+        self._refresh_again = False
+        self._signature: tuple = ()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    # -- lifecycle -----------------------------------------------------
+
+    def start(self) -> None:
+        """Start warming the first set of workers and the file watcher.
+
+        Returns at once; runs made before the workers are warm run
+        in-process.
+        """
+        self._started = True
+        self.refresh()
+        self._watcher = threading.Thread(target=self._watch, daemon=True,
+                                         name="bulletin-data-watcher")
+        self._watcher.start()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def ready(self) -> bool:
+        return self._executor is not None
+
+    # -- refresh -------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Replace the workers with freshly warmed ones, in the background.
+
+        A refresh asked for while one is warming runs again after it, so
+        the pool always ends up warmed from the latest data. Does nothing
+        before ``start()``.
+        """
+        with self._lock:
+            if not self._started or self._stop.is_set():
+                return
+            if self._refreshing:
+                self._refresh_again = True
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh, daemon=True,
+                         name="bulletin-pool-refresh").start()
+
+    def _refresh(self) -> None:
+        while True:
+            self._signature = _data_signature()
+            fresh = ProcessPoolExecutor(max_workers=self.size,
+                                        mp_context=self._context,
+                                        initializer=_warm_worker)
+            try:
+                # Each worker warms in its initializer before it takes a
+                # task, so once these return the workers are ready.
+                for future in [fresh.submit(_ready) for _ in range(self.size)]:
+                    future.result()
+            except Exception:   # pragma: no cover — keep the old workers
+                fresh.shutdown(wait=False, cancel_futures=True)
+                fresh = None
+            with self._lock:
+                if fresh is not None and not self._stop.is_set():
+                    old, self._executor = self._executor, fresh
+                else:
+                    old = fresh
+                again, self._refresh_again = self._refresh_again, False
+                if not again:
+                    self._refreshing = False
+            if old is not None:
+                old.shutdown(wait=False)    # in-flight runs finish first
+            if not again:
+                return
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            signature = _data_signature()
+            if signature != self._signature:
+                self._signature = signature
+                self.refresh()
+
+    # -- runs ----------------------------------------------------------
+
+    def run(self, options: RunOptions) -> tuple[RunResult, list[str]]:
+        """Generate *options* on a warm worker (or in-process).
+
+        Returns the result and the run's progress lines. Raises what
+        ``run_generation()`` raises (``RunAborted`` for a bad date).
+        """
+        future = None
+        executor = self._executor
+        if executor is not None:
+            try:
+                future = executor.submit(_generate, options)
+            except RuntimeError:
+                pass            # swapped out and shut down just now
+        if future is not None:
+            try:
+                return future.result()
+            except BrokenProcessPool:
+                self.refresh()
+        return _generate(options)